@@ -1,13 +1,12 @@
 import argparse
 from datetime import datetime
 
-import pandas as pd
-import pybaseball as pyb
-
-from plot_types.swarm import SwarmPlot
 from util.team_maps import mlb_team_full_names
 from util.fix_traded_mlb_players import fix_teams_for_traded_pitchers
+from util.lazy_import import lazy_import
 
+pd = lazy_import('pandas')
+pyb = lazy_import('pybaseball')
 
 
 def get_teamwide_stuff(year: int, team: str) -> None:
@@ -33,6 +32,7 @@ def main(year: int, qual: int, team: str) -> None:
     :param int qual: Minimum inning-pitched to apply to query
     :param str team: Team for which to query
     """
+    from plot_types.swarm import SwarmPlot
 
    # qual = 20
     data = pyb.pitching_stats(year, qual=qual)[['Team', 'Name', 'IP', 'G', 'GS', 'Stuff+',
@@ -1,17 +1,23 @@
+from __future__ import annotations
+
 import argparse
 from datetime import datetime
 from typing import Tuple
 
-import pybaseball as pyb
-import polars as pl
 from util.get_detailed_batter_stats import get_detailed_batter_stats
 
-from plot_types.swarm import SwarmPlot
+from util.render_cache import render_cached
 from util.team_maps import mlb_team_full_names
 from util.fix_traded_mlb_players import fix_teams_for_traded_batters
+from util.lazy_import import lazy_import
+
+pyb = lazy_import('pybaseball')
+pl = lazy_import('polars')
 
 
 def main(year, qual, team):
+    from plot_types.swarm import SwarmPlot
+
     data = get_detailed_batter_stats(year)
     data = data.rename({"Team": "team"})
     data = data.filter(pl.col("PAs") >= qual)
@@ -24,7 +30,9 @@ def main(year, qual, team):
 
     team_wrc, team_rank = get_teamwide_wrc(data, team)
 
-    plot = SwarmPlot(
+    render_cached(
+        SwarmPlot,
+        chart_type="batter_wrc_swarm",
         dataframe=data.to_pandas(),
         filename=f"{team}_wrc.png",
         column="wRC+",
@@ -40,8 +48,6 @@ def main(year, qual, team):
         "Shows the team's top 12 hitters by total wRC+",
     )
 
-    plot.make_plot()
-
 
 def get_teamwide_wrc(df: pl.DataFrame, team_name: str) -> Tuple[int, int]:
     """
@@ -1,8 +1,9 @@
 import argparse
 from datetime import datetime
-import pybaseball
 
-from plot_types.ratio_scatter import RatioScatterPlot
+from util.lazy_import import lazy_import
+
+pybaseball = lazy_import('pybaseball')
 
 
 def main(year):
@@ -11,6 +12,8 @@ def main(year):
 
     :param int year: Year for which to gather data.
     """
+    from plot_types.ratio_scatter import RatioScatterPlot
+
     df = pybaseball.team_batting(year)
     df = df[['Team', 'OBP', 'SLG']]
 
@@ -1,14 +1,14 @@
+from __future__ import annotations
+
 import argparse
 
-import pandas as pd
-import polars as pl
 from datetime import datetime
-from pybaseball import schedule_and_record
 
-from plot_types.animated_rolling_average import AnimatedRollingAveragePlot
+from util.lazy_import import lazy_import
 
-# Disable annoying warning
-pd.options.mode.chained_assignment = None
+pd = lazy_import('pandas')
+pl = lazy_import('polars')
+pyb = lazy_import('pybaseball')
 
 # Number of games over which to compute the rolling average
 WINDOW = 10
@@ -30,7 +30,7 @@ def proccess_data(teams: list[str]) -> pd.DataFrame:
 
     for team in teams:
         # Pull the schedule record data for each individual team, to process and save in a list
-        df = schedule_and_record(year, team).fillna(0)
+        df = pyb.schedule_and_record(year, team).fillna(0)
 
         # Filter out games that haven't been played yet
         df = df[df['Win'] != 0]
@@ -62,6 +62,12 @@ def main(division: int) -> None:
 
     :param int division: Integer corresponding to division for which to generate plot.
     """
+    from plot_types.animated_rolling_average import AnimatedRollingAveragePlot
+    from util import schema
+
+    # Disable annoying warning
+    pd.options.mode.chained_assignment = None
+
     divisions = {
         0: { "name": "American League East",
              "teams": ['TOR', 'BOS', 'NYY', 'TBR', 'BAL'] },
@@ -77,7 +83,8 @@ def main(division: int) -> None:
              "teams": ['STL', 'MIL', 'CHC', 'CIN', 'PIT'] }
     }
 
-    df = pl.from_pandas(proccess_data(divisions[division]['teams']))
+    # Teams as an Enum, since the plot filters on them for every team in every frame
+    df = schema.cast(pl.from_pandas(proccess_data(divisions[division]['teams'])), 'mlb')
 
     division_name = divisions[division]['name']
     # American League East -> AL East
@@ -1,10 +1,10 @@
 import argparse
 from datetime import datetime
 
-import polars as pl
-import pybaseball as pyb
+from util.lazy_import import lazy_import
 
-from plot_types.ratio_scatter import RatioScatterPlot
+pl = lazy_import('polars')
+pyb = lazy_import('pybaseball')
 
 
 def main(year: int):
@@ -13,6 +13,8 @@ def main(year: int):
 
     :param int year: Year for which to gather data.
     """
+    from plot_types.ratio_scatter import RatioScatterPlot
+
     # Getting runs scored/allowed from batting/pitching stats, resp.
     p_df = pl.from_pandas(pyb.team_pitching(2025)[['Team', 'GS', 'R']])
     b_df = pl.from_pandas(pyb.team_batting(2025)[['Team', 'R']])
@@ -1,13 +1,13 @@
+from __future__ import annotations
+
 import argparse
 
-import pandas as pd
 from datetime import datetime
-from pybaseball import schedule_and_record
 
-from plot_types.cumulative_lines import CumulativeLinePlot
+from util.lazy_import import lazy_import
 
-# Disable annoying warning
-pd.options.mode.chained_assignment = None
+pd = lazy_import('pandas')
+pyb = lazy_import('pybaseball')
 
 """
 Inspired by MoneyPuck's graphical standings plot, creates a line plot for each divsion
@@ -30,7 +30,6 @@ def calculate_wins(team_df: pd.DataFrame, row: pd.Series) -> tuple[int, int]:
     return row
 
 
-
 def process_data(teams: list[str]) -> pd.DataFrame:
     """
     Loads the DataFrame containing runs for/against for all teams in the division and
@@ -43,7 +42,7 @@ def process_data(teams: list[str]) -> pd.DataFrame:
     year = datetime.now().year
 
     for team in teams:
-        df = schedule_and_record(year, team).fillna(0)
+        df = pyb.schedule_and_record(year, team).fillna(0)
 
         # Filter out games that haven't been played yet
         df = df[df['Win'] != 0]
@@ -71,6 +70,11 @@ def main(division: int) -> None:
     """
     Main function which takes an integers denoting the division and creates the plot.
     """
+    from plot_types.cumulative_lines import CumulativeLinePlot
+
+    # Disable annoying warning
+    pd.options.mode.chained_assignment = None
+
     divisions = {
         0: { "name": "American League East",
              "teams": ['TOR', 'BOS', 'NYY', 'TBR', 'BAL'] },
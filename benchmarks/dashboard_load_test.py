@@ -0,0 +1,131 @@
+"""
+Load test for the fantasy free agent dashboard (dashboard/fantasy_fa.py).
+
+Serves the dashboard locally with synthetic data, then simulates concurrent sessions, each one
+opening the dashboard for a sequence of random positions and date ranges, and reports the p50
+and p99 latency of those requests.
+
+By default the figure cache starts cold, so that the first sessions to ask for each figure have
+to wait for it to render, while every other session should be unaffected.
+
+Run from the repo root:
+    python benchmarks/dashboard_load_test.py --sessions 20
+"""
+
+import os
+import time
+import random
+import socket
+import argparse
+import tempfile
+import threading
+
+import numpy as np
+import pandas as pd
+import requests
+
+from dashboard import fantasy_data, fantasy_figures
+
+BATTER_TEAMS = ['NYY', 'BOS', 'TOR', 'TBR', 'BAL', 'SEA', 'HOU', 'LAD', 'SDP', 'ATL']
+PLAYERS_PER_TERM = 40
+
+
+def write_synthetic_data(data_dir, seed=0):
+    """
+    Writes one 'fantasy_data_{pos}.csv' per position, in the format of the daily artifact.
+    """
+    rng = np.random.default_rng(seed)
+    for pos in fantasy_data.POSITIONS:
+        frames = []
+        for term in fantasy_data.TERMS:
+            frames.append(pd.DataFrame({
+                'Name': [f'Player{i} {pos}-{term}' for i in range(PLAYERS_PER_TERM)],
+                'Team': rng.choice(BATTER_TEAMS, PLAYERS_PER_TERM),
+                'xwOBA': rng.uniform(0.25, 0.40, PLAYERS_PER_TERM),
+                'wRC+': rng.uniform(60, 160, PLAYERS_PER_TERM),
+                'K-BB%': rng.uniform(0, 0.3, PLAYERS_PER_TERM),
+                'Stuff+': rng.uniform(80, 120, PLAYERS_PER_TERM),
+                'on_team': np.arange(PLAYERS_PER_TERM) < 3,
+                'term': term,
+            }))
+        pd.concat(frames).to_csv(os.path.join(data_dir, f'fantasy_data_{pos}.csv'), index=False)
+
+
+def free_port():
+    """ Returns a free local port. """
+    with socket.socket() as sock:
+        sock.bind(('localhost', 0))
+        return sock.getsockname()[1]
+
+
+def run_session(url, num_requests, seed, latencies):
+    """
+    Simulates one session, requesting the dashboard for random positions and date ranges and
+    appending the latency of each request to `latencies`.
+    """
+    rng = random.Random(seed)
+    with requests.Session() as session:
+        for _ in range(num_requests):
+            params = {'pos': rng.choice(fantasy_data.POSITIONS),
+                      'range': rng.choice(['Week', 'Month', 'Season'])}
+            start = time.perf_counter()
+            response = session.get(url, params=params, timeout=60)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-s', '--sessions', type=int, default=20,
+                        help='Number of concurrent sessions.')
+    parser.add_argument('-r', '--requests', type=int, default=10,
+                        help='Number of requests made by each session.')
+    parser.add_argument('--warm', action='store_true',
+                        help='Pre-render every figure before the sessions start.')
+    args = parser.parse_args()
+
+    # Imported here since the module creates Panel extensions on import
+    import panel as pn
+    from dashboard import fantasy_fa
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_synthetic_data(tmp)
+        fantasy_data.load_store(tmp)
+
+    if args.warm:
+        fantasy_figures.prerender('synthetic')
+        for pos in fantasy_data.POSITIONS:
+            for term in fantasy_data.TERMS:
+                fantasy_figures.figure_future(pos, term).result()
+
+    port = free_port()
+    server = pn.serve(fantasy_fa.create_app, port=port, show=False, threaded=True,
+                      address='localhost')
+    dashboard_url = f'http://localhost:{port}/'
+
+    # Wait for the server to come up
+    for _ in range(100):
+        try:
+            requests.get(dashboard_url, timeout=5)
+            break
+        except requests.ConnectionError:
+            time.sleep(0.1)
+
+    all_latencies = []
+    threads = [threading.Thread(target=run_session,
+                                args=(dashboard_url, args.requests, i, all_latencies))
+               for i in range(args.sessions)]
+    start_time = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start_time
+    server.stop()
+    server.join(timeout=10)
+
+    p50, p99 = np.percentile(all_latencies, [50, 99])
+    print(f"{args.sessions} sessions x {args.requests} requests "
+          f"({'warm' if args.warm else 'cold'} figure cache) in {elapsed:.2f}s")
+    print(f"p50: {p50 * 1000:.0f} ms    p99: {p99 * 1000:.0f} ms    "
+          f"max: {max(all_latencies) * 1000:.0f} ms")
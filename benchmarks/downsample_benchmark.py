@@ -0,0 +1,101 @@
+"""
+Benchmark for LTTB line downsampling (util/downsample.py) in the line plots, rendering synthetic
+cumulative run differential (CumulativeLinePlot) and xG% rolling average (RollingAveragePlot)
+charts spanning 1, 5 and 20 seasons, with and without downsampling.
+
+Run from the repo root:
+    python benchmarks/downsample_benchmark.py
+"""
+
+import os
+import time
+import argparse
+import tempfile
+
+import matplotlib
+matplotlib.use('agg')
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from plot_types.cumulative_lines import CumulativeLinePlot
+from plot_types.rolling_average import RollingAveragePlot
+
+MLB_TEAMS = ['NYY', 'BOS', 'TOR', 'TBR', 'BAL']
+NHL_TEAMS = ['TOR', 'TBL', 'BOS', 'DET', 'MTL', 'OTT', 'FLA', 'BUF']
+
+MLB_GAMES_PER_SEASON = 162
+NHL_GAMES_PER_SEASON = 82
+
+
+def cumulative_plot(seasons, filename, downsample_lines):
+    """ Cumulative games over .500 for an MLB division, over the given number of seasons. """
+    rng = np.random.default_rng(0)
+    num_games = seasons * MLB_GAMES_PER_SEASON
+    df = pd.concat([
+        pd.DataFrame({'team': team,
+                      'game_number': np.arange(1, num_games + 1),
+                      'games_over_500': np.cumsum(rng.choice([-1, 1], num_games)) / 10})
+        for team in MLB_TEAMS
+    ])
+    return CumulativeLinePlot(filename=filename, dataframe=df, sport='baseball',
+                              x_column='game_number', y_column='games_over_500',
+                              title='Benchmark Division', subtitle='Synthetic data',
+                              x_label='Game #', y_label='Games Over .500 (x10)',
+                              downsample_lines=downsample_lines)
+
+
+def rolling_plot(seasons, filename, downsample_lines):
+    """ xG% rolling averages for an NHL division, over the given number of seasons. """
+    rng = np.random.default_rng(0)
+    num_games = seasons * NHL_GAMES_PER_SEASON
+    df = pl.concat([
+        pl.DataFrame({'team': [team] * num_games,
+                      'gameNumber': list(range(1, num_games + 1)),
+                      'xGoalsRollingAvg': 50 + np.cumsum(rng.normal(0, 1.5, num_games)) / 5})
+        for team in NHL_TEAMS
+    ])
+    return RollingAveragePlot(dataframe=df, filename=filename,
+                              x_column='gameNumber', x_label='Game #',
+                              y_column='xGoalsRollingAvg', y_label='10-Game Rolling Average',
+                              title='Benchmark Division', subtitle='Synthetic data',
+                              sport='hockey', y_midpoint=50, add_team_logos=True,
+                              for_multiplot=False, multiline_key='team',
+                              downsample_lines=downsample_lines)
+
+
+def run(make_plot, seasons, downsample_lines, directory):
+    """
+    Renders one chart, returning the time taken, the number of line vertices drawn and the size
+    of the PNG and SVG outputs.
+    """
+    filename = os.path.join(directory, 'benchmark.png')
+    plot = make_plot(seasons, filename, downsample_lines)
+
+    start = time.perf_counter()
+    plot.make_plot()
+    elapsed = time.perf_counter() - start
+
+    vertices = sum(len(line.get_xdata()) for line in plot.axis.get_lines())
+    svg_filename = os.path.join(directory, 'benchmark.svg')
+    plot.fig.savefig(svg_filename)
+    sizes = [os.path.getsize(f) / 1024 for f in (filename, svg_filename)]
+    matplotlib.pyplot.close(plot.fig)
+    return elapsed, vertices, *sizes
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-s', '--seasons', type=int, nargs='+', default=[1, 5, 20],
+                        help='Numbers of seasons of data to benchmark.')
+    args = parser.parse_args()
+
+    print(f"{'Chart':<12}{'Seasons':>8}{'Downsample':>12}{'Render (s)':>12}{'Vertices':>10}"
+          f"{'PNG (KB)':>10}{'SVG (KB)':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, make_plot in [('cumulative', cumulative_plot), ('rolling', rolling_plot)]:
+            for num_seasons in args.seasons:
+                for downsample in (False, True):
+                    result = run(make_plot, num_seasons, downsample, tmp)
+                    print(f"{name:<12}{num_seasons:>8}{str(downsample):>12}{result[0]:>12.2f}"
+                          f"{result[1]:>10}{result[2]:>10.1f}{result[3]:>10.1f}")
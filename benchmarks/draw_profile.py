@@ -0,0 +1,120 @@
+"""
+Profiles the draw of every artist in the plots with the most decorative elements (the ratio
+scatter, the swarm plot and the game report scoreboard) built from synthetic data, using
+util/draw_profiler.py. Prints a report per plot, and writes a speedscope JSON file for each.
+
+Run from the repo root:
+    python benchmarks/draw_profile.py --plot swarm --output profiles
+"""
+
+import os
+import argparse
+import tempfile
+
+import matplotlib
+matplotlib.use('agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from util.draw_profiler import profile_draws
+
+NHL_TEAMS = ['TOR', 'MTL', 'BOS', 'NYR', 'EDM', 'CGY', 'VAN', 'SEA', 'DAL', 'COL', 'FLA', 'TBL',
+             'CAR', 'NJD', 'PIT', 'WSH']
+MLB_TEAMS = ['NYY', 'BOS', 'TOR', 'TBR', 'BAL', 'SEA', 'HOU', 'LAD', 'SDP', 'ATL', 'NYM', 'PHI']
+
+
+def ratio_scatter_plot(filename, rng):
+    """ The team xG ratio plot, with ratio lines. """
+    from plot_types.ratio_scatter import RatioScatterPlot
+
+    df = pl.DataFrame({
+        'team': NHL_TEAMS,
+        'xGoalsForPerHour': rng.uniform(2.2, 3.2, len(NHL_TEAMS)),
+        'xGoalsAgainstPerHour': rng.uniform(2.2, 3.2, len(NHL_TEAMS)),
+    })
+    return RatioScatterPlot(dataframe=df, filename=filename,
+                            x_column='xGoalsForPerHour', y_column='xGoalsAgainstPerHour',
+                            title='Team Expected Goal Rates', scale='team',
+                            x_label='Expected Goals For per hour',
+                            y_label='Expected Goals Against per hour (inverted)',
+                            ratio_lines=True, invert_y=True,
+                            plot_x_mean=False, plot_y_mean=False,
+                            scale_to_extreme=True,
+                            plot_league_average=df['xGoalsForPerHour'].mean())
+
+
+def swarm_plot(filename, rng):
+    """ The wRC+ distribution, highlighting one team's hitters. """
+    from plot_types.swarm import SwarmPlot
+
+    num_players = 300
+    df = pd.DataFrame({
+        'Name': [f'First{i} Last{i}' for i in range(num_players)],
+        'team': [MLB_TEAMS[i % len(MLB_TEAMS)] for i in range(num_players)],
+        'PAs': rng.integers(50, 700, num_players),
+        'wRC+': rng.normal(100, 30, num_players).round().astype(int),
+        'AVG': rng.uniform(0.2, 0.33, num_players).round(3),
+        'HRs': rng.integers(0, 45, num_players),
+        'OPS': rng.uniform(0.55, 1.0, num_players).round(3),
+        'xwOBA': rng.uniform(0.27, 0.42, num_players).round(3),
+    })
+    return SwarmPlot(dataframe=df, filename=filename, column='wRC+', team='NYY', qualifier='PAs',
+                     team_level_metric=112, team_rank=4, y_label='wRC+',
+                     table_columns=['PAs', 'AVG', 'HRs', 'OPS', 'xwOBA'],
+                     title='New York Yankees Hitters by wRC+',
+                     data_disclaimer='baseballreference')
+
+
+def scoreboard_plot(filename, rng):
+    """ The game report scoreboard for one game. """
+    from plot_types.scoreboard import ScoreBoardPlot
+
+    situations = ['all', 'ev', 'pp', 'pk']
+    teams = ['TOR', 'MTL']
+    skater_df = pl.DataFrame([
+        {'team': team, 'situation': situation, 'name': f'{team} Skater{i}',
+         'goals': int(rng.integers(0, 2)), 'individualxGoals': float(rng.uniform(0, 0.6))}
+        for team in teams for situation in situations for i in range(18)
+    ])
+    goalie_df = pl.DataFrame([
+        {'team': team, 'situation': situation, 'name': f'{team} Goalie',
+         'iceTime': float(rng.uniform(100, 3600)), 'goalsAgainst': int(rng.integers(0, 4)),
+         'xGoalsAgainst': float(rng.uniform(0.5, 4))}
+        for team in teams for situation in situations
+    ])
+    return ScoreBoardPlot(filename=filename, skater_df=skater_df, goalie_df=goalie_df)
+
+
+PLOTS = {
+    'ratio_scatter': ratio_scatter_plot,
+    'swarm': swarm_plot,
+    'scoreboard': scoreboard_plot,
+}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-p', '--plot', choices=list(PLOTS) + ['all'], default='all',
+                        help='Plot to profile.')
+    parser.add_argument('-o', '--output', default='.',
+                        help='Directory to write the speedscope JSON files to.')
+    parser.add_argument('-n', '--rows', type=int, default=15,
+                        help='Number of rows to show in each report.')
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    names = list(PLOTS) if args.plot == 'all' else [args.plot]
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in names:
+            with profile_draws() as profiler:
+                plot = PLOTS[name](os.path.join(tmp, f'{name}.png'), np.random.default_rng(0))
+                plot.make_plot()
+            plt.close('all')
+
+            speedscope = os.path.join(args.output, f'{name}.speedscope.json')
+            profiler.write_speedscope(speedscope, name=name)
+            print(f"{name} (written to {speedscope})")
+            print(profiler.report(limit=args.rows))
+            print()
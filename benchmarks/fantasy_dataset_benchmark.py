@@ -0,0 +1,136 @@
+"""
+Benchmark comparing loading the fantasy dashboard's store (dashboard/fantasy_data.py) from the
+per-position CSVs against the partitioned Parquet dataset (dashboard/fantasy_dataset.py).
+
+Each format is loaded in a fresh process, reporting the time taken and how much resident memory
+the process grew by (Linux only, read from /proc) at three points: once the store is loaded,
+once the plot data of every position and term has been built (as the figures are pre-rendered
+right after every load), and once every table has been built too. The dataset reads each term's
+table and plot data on demand, so it does part of its work after loading.
+
+Run from the repo root:
+    python benchmarks/fantasy_dataset_benchmark.py --players 500
+"""
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+import tempfile
+
+import numpy as np
+import pandas as pd
+from polars.testing import assert_frame_equal as assert_polars_frame_equal
+
+from dashboard import fantasy_data, fantasy_dataset
+
+TEAMS = ['NYY', 'BOS', 'TOR', 'TBR', 'BAL', 'SEA', 'HOU', 'LAD', 'SDP', 'ATL', 'NYM', 'PHI']
+NUM_STAT_COLUMNS = 40
+
+
+def write_csvs(csv_dir, players_per_term, seed=0):
+    """
+    Writes one 'fantasy_data_{pos}.csv' per position, with `players_per_term` players for each
+    term and a realistic number of stat columns.
+    """
+    rng = np.random.default_rng(seed)
+    names = [f'First{i} Last{i}' for i in range(players_per_term)]
+    for pos in fantasy_data.POSITIONS:
+        frames = []
+        for term in fantasy_data.TERMS:
+            df = pd.DataFrame({
+                'Name': names,
+                'Team': rng.choice(TEAMS, players_per_term),
+                'on_team': np.arange(players_per_term) < 3,
+                'term': term,
+                'xwOBA': rng.uniform(0.25, 0.40, players_per_term),
+                'wRC+': rng.uniform(60, 160, players_per_term),
+                'K-BB%': rng.uniform(0, 0.3, players_per_term),
+                'Stuff+': rng.uniform(80, 120, players_per_term),
+            })
+            for i in range(NUM_STAT_COLUMNS):
+                df[f'stat_{i}'] = rng.normal(0, 1, players_per_term).round(3)
+            frames.append(df)
+        pd.concat(frames).to_csv(os.path.join(csv_dir, f'fantasy_data_{pos}.csv'), index=False)
+
+
+def directory_size(path):
+    """ Total size of the files under a directory, in bytes. """
+    return sum(os.path.getsize(os.path.join(root, f))
+               for root, _, files in os.walk(path) for f in files)
+
+
+def resident_memory():
+    """ Resident memory of this process, in KB. """
+    with open('/proc/self/status', encoding='utf-8') as fo:
+        for line in fo:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1])
+    return 0
+
+
+def measure(source_format, path):
+    """
+    Loads the store from one format in this process, then gets the plot data and the tables for
+    every position and term. Prints the time since starting and the growth in resident memory,
+    in KB, after each step.
+    """
+    baseline = resident_memory()
+    start = time.perf_counter()
+    results = []
+    if source_format == 'csv':
+        fantasy_data.load_store(path)
+    else:
+        fantasy_data.load_store_from_dataset(path)
+    results += [time.perf_counter() - start, resident_memory() - baseline]
+
+    for get_data in [fantasy_data.get_plot_data, fantasy_data.get_table]:
+        for pos in fantasy_data.POSITIONS:
+            for term in fantasy_data.TERMS:
+                get_data(pos, term)
+        results += [time.perf_counter() - start, resident_memory() - baseline]
+    print(*results)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-p', '--players', type=int, default=500,
+                        help='Number of players per position and term.')
+    parser.add_argument('--measure', nargs=2, metavar=('FORMAT', 'PATH'),
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(*args.measure)
+        sys.exit(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_dir = os.path.join(tmp, 'data')
+        dataset_dir = os.path.join(tmp, fantasy_dataset.DATASET_NAME)
+        os.makedirs(csv_dir)
+        write_csvs(csv_dir, args.players)
+        fantasy_dataset.convert_csv_dir(csv_dir, dataset_dir)
+
+        # Both formats should give the same tables
+        fantasy_data.load_store(csv_dir)
+        csv_table = fantasy_data.get_table('SS', 'month')
+        csv_plot = fantasy_data.get_plot_data('SP', 'week')
+        fantasy_data.load_store_from_dataset(dataset_dir)
+        pd.testing.assert_frame_equal(csv_table, fantasy_data.get_table('SS', 'month'),
+                                      check_dtype=False)
+        assert_polars_frame_equal(csv_plot, fantasy_data.get_plot_data('SP', 'week'),
+                                  check_dtypes=False)
+
+        print(f"{args.players} players per position and term, "
+              f"seconds and RSS growth (KB) since starting to load\n")
+        print(f"{'Format':<10}{'Size (KB)':>12}{'Loaded':>20}{'+ plot data':>20}"
+              f"{'+ tables':>20}")
+        for source_format, path in [('csv', csv_dir), ('parquet', dataset_dir)]:
+            output = subprocess.run([sys.executable, __file__, '--measure', source_format, path],
+                                    capture_output=True, text=True, check=True,
+                                    env={**os.environ, 'PYTHONPATH': os.getcwd()})
+            results = output.stdout.split()
+            steps = ''.join(f"{float(elapsed):>10.3f}{int(rss):>10}"
+                            for elapsed, rss in zip(results[::2], results[1::2]))
+            print(f"{source_format:<10}{directory_size(path) / 1024:>12.1f}{steps}")
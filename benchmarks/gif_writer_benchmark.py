@@ -0,0 +1,92 @@
+"""
+Benchmark comparing the palette-optimized GIF writer (util/gif_writer.py) against saving the same
+frames with Pillow's default GIF encoder, for a synthetic rolling average division animation.
+
+Run from the repo root:
+    python benchmarks/gif_writer_benchmark.py --teams 8
+"""
+
+import os
+import time
+import argparse
+import tempfile
+
+import matplotlib
+matplotlib.use('agg')
+import numpy as np
+import polars as pl
+from PIL import Image
+
+from plot_types.animated_rolling_average import AnimatedRollingAveragePlot
+from util.gif_writer import write_gif
+
+TEAMS = ['TOR', 'TBL', 'BOS', 'DET', 'MTL', 'OTT', 'FLA', 'BUF', 'NYR', 'NYI', 'NJD', 'CAR',
+         'CBJ', 'PIT', 'WSH', 'PHI']
+
+
+def make_frames(num_teams, num_games=30, workers=None):
+    """
+    Renders the frames of a synthetic xG% rolling average animation, one per team.
+
+    :param int workers: Number of processes rendering the frames, defaults to the CPU count.
+    :return tuple[list[bytes], tuple[int, int]]: The RGBA frames and their size.
+    """
+    rng = np.random.default_rng(0)
+    df = pl.concat([
+        pl.DataFrame({'team': [team] * num_games,
+                      'gameNumber': list(range(1, num_games + 1)),
+                      'xGoalsRollingAvg': 50 + np.cumsum(rng.normal(0, 1.5, num_games))})
+        for team in TEAMS[:num_teams]
+    ])
+    plot = AnimatedRollingAveragePlot(dataframe=df, filename='benchmark.gif',
+                                      x_column='gameNumber', x_label='Game #',
+                                      y_column='xGoalsRollingAvg', y_label='10-Game Rolling Average',
+                                      title='Benchmark Division', subtitle='Synthetic data',
+                                      sport='hockey', y_midpoint=50, add_team_logos=True,
+                                      for_multiplot=False, multiline_key='team')
+    teams = plot.setup_animation()
+    frames = list(plot.render_frames(teams, workers))
+    return frames, plot.fig.canvas.get_width_height()
+
+
+def pillow_gif(frames, size, filename, fps=1):
+    """ Baseline: full frames, each quantized and saved by Pillow's GIF encoder. """
+    images = [Image.frombuffer('RGBA', size, frame, 'raw', 'RGBA', 0, 1).convert('RGB')
+              for frame in frames]
+    images[0].save(filename, save_all=True, append_images=images[1:],
+                   duration=int(1000 / fps), loop=0)
+
+
+def max_difference(frames, size, filename):
+    """ Largest per-channel difference between the source frames and the decoded GIF. """
+    worst = 0
+    with Image.open(filename) as gif:
+        for i, frame in enumerate(frames):
+            gif.seek(i)
+            decoded = np.asarray(gif.convert('RGB'), dtype=np.int16)
+            source = np.frombuffer(frame, dtype=np.uint8).reshape(size[1], size[0], 4)[:, :, :3]
+            worst = max(worst, int(np.abs(decoded - source).max()))
+    return worst
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-t', '--teams', type=int, default=8,
+                        help='Number of teams (i.e. frames) in the animation.')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    all_frames, frame_size = make_frames(args.teams)
+    print(f"Rendered {len(all_frames)} frames of {frame_size[0]}x{frame_size[1]} "
+          f"in {time.perf_counter() - start:.2f}s\n")
+
+    print(f"{'Writer':<20}{'Encode (s)':>12}{'Size (KB)':>12}{'Max diff':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, writer in [('pillow', pillow_gif), ('gif_writer', write_gif)]:
+            path = os.path.join(tmp, f'{name}.gif')
+            start = time.perf_counter()
+            writer(all_frames, frame_size, path)
+            elapsed = time.perf_counter() - start
+            size_kb = os.path.getsize(path) / 1024
+            print(f"{name:<20}{elapsed:>12.2f}{size_kb:>12.1f}"
+                  f"{max_difference(all_frames, frame_size, path):>10}")
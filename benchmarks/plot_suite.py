@@ -0,0 +1,353 @@
+"""
+Offline benchmark suite covering every plot type, rendered from the synthetic NHL and MLB data in
+benchmarks/fixtures.py instead of live pyhockey and pybaseball queries.
+
+Each case runs a plotting script's own functions (with its `ph` or `pyb` swapped for the
+fixtures), so data prep is timed along with the render. A case is run once to warm up, then
+`--repeat` times to time it, then once more under tracemalloc for its peak Python memory use.
+Charts are written to a temporary directory, and the render cache, figure templates and league
+context densities are cleared before every run.
+
+Results are written as JSON, and compared against a stored baseline (any earlier results file),
+flagging cases that got slower or use more memory by more than `--threshold`:
+
+    python benchmarks/plot_suite.py --update-baseline
+    ...
+    python benchmarks/plot_suite.py --output results.json
+
+To run on real data instead, without a network connection, record the data the cases use once
+with `--record fixtures/` (see util/fixture_store.py), then run with `--replay fixtures/`.
+
+Run from the repo root, with the repo on PYTHONPATH. Exits with 1 if any case regressed.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import tempfile
+import tracemalloc
+from datetime import datetime
+from contextlib import contextmanager
+
+import matplotlib
+matplotlib.use('agg')
+import matplotlib.pyplot as plt
+import polars as pl
+
+from benchmarks import fixtures
+from plot_types import league_context
+from plot_types import template as figure_template
+from util import fixture_store, hockey_data
+
+## Constants #########################################################################
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, 'benchmarks', 'baseline.json')
+
+SEASON = 2025
+# Relative increase in time or memory over the baseline that counts as a regression
+DEFAULT_THRESHOLD = 0.10
+## End Constants #####################################################################
+
+# Stand-ins for pyhockey and pybaseball, generating each frame once
+hockey = fixtures.memoized(fixtures.hockey)
+baseball = fixtures.memoized(fixtures.baseball)
+
+
+def first_game(season):
+    """ The ID of the first game of the synthetic season. """
+    return int(hockey.team_games(season)['gameID'].min())
+
+
+### Cases ############################################################################
+def team_ratio_scatter():
+    """ RatioScatterPlot at team scale, with ratio lines: xG and G rates. """
+    from hockey.team_plots import plot_team_ratios
+    plot_team_ratios.ph = hockey
+    plot_team_ratios.main(situation='5on5', season=SEASON)
+
+
+def skater_ratio_scatter():
+    """ RatioScatterPlot at player scale with league context: forward and D scoring rates. """
+    from hockey.skater_plots import plot_skater_points
+    plot_skater_points.ph = hockey
+    plot_skater_points.main(team='TOR', min_icetime_minutes=200, situation='5on5', season=SEASON)
+
+
+def batter_swarm():
+    """ SwarmPlot of batter wRC+, with the batter stats derived from bref and statcast data. """
+    from plot_types.swarm import SwarmPlot
+    from baseball.player_plots import plot_wrc_distribution
+    from dashboard.fantasy_dataset import to_pandas
+    from util import get_detailed_batter_stats
+
+    get_detailed_batter_stats.pyb = baseball
+    data = get_detailed_batter_stats.get_detailed_batter_stats(SEASON)
+    # Synthetic batters are never traded, so there are no teams to fix
+    data = data.rename({'Team': 'team'}).filter(pl.col('PAs') >= 50)
+    team_wrc, team_rank = plot_wrc_distribution.get_teamwide_wrc(data, 'NYY')
+
+    # As in plot_wrc_distribution.main, which converts with DataFrame.to_pandas
+    SwarmPlot(dataframe=to_pandas(data), filename='NYY_wrc.png', column='wRC+', team='NYY',
+              qualifier='PAs', team_level_metric=team_wrc, team_rank=team_rank,
+              y_label='wRC+', table_columns=['PAs', 'AVG', 'HRs', 'OPS', 'xwOBA'],
+              title='New York Yankees Hitters by wRC+', data_disclaimer='baseballreference',
+              subtitle="Plotted against league distribution, min. 50 PAs\n"
+                       "Shows the team's top 12 hitters by total wRC+").make_plot()
+
+
+def game_data():
+    """ Skater and goalie data for a single game, as in assemble_report.main. """
+    from hockey.game_report import assemble_report
+    game_id = first_game(SEASON)
+    skater_df = hockey_data.fetch(hockey, 'skater_games', assemble_report.SKATER_GAME_COLUMNS,
+                                  season=SEASON).filter(pl.col('gameID') == game_id)
+    goalie_df = hockey_data.fetch(hockey, 'goalie_games', assemble_report.GOALIE_GAME_COLUMNS,
+                                  season=SEASON).filter(pl.col('gameID') == game_id)
+    return skater_df, goalie_df
+
+
+def scoreboard():
+    """ ScoreBoardPlot on its own, rather than as part of the game report. """
+    from plot_types.scoreboard import ScoreBoardPlot
+    skater_df, goalie_df = game_data()
+    ScoreBoardPlot(filename='scoreboard.png', skater_df=skater_df, goalie_df=goalie_df,
+                   data_disclaimer=None).make_plot()
+
+
+def icetime_mirrored_bar():
+    """ MirroredBarPlot of the game report's icetime breakdown, on its own. """
+    from hockey.game_report import assemble_report
+    skater_df, _ = game_data()
+    plot = assemble_report.make_icetime_plot(skater_df)
+    plot.filename = 'icetime.png'
+    plot.make_plot()
+
+
+def game_report():
+    """ The full game report MultiPlot: scoreboard, icetime bars and xG scatter. """
+    from hockey.game_report import assemble_report
+    assemble_report.ph = hockey
+    assemble_report.main(first_game(SEASON), 'game_report.png', SEASON)
+
+
+def goalie_sequential_bar():
+    """ SequentialBarPlot of a team's goalies' GSAx by game. """
+    from hockey.goalie_plots import games_by_gsax_bar_chart
+    games_by_gsax_bar_chart.ph = hockey
+    games_by_gsax_bar_chart.main(team='TOR', season=SEASON)
+
+
+def special_teams_lollipop():
+    """ LayeredLollipopPlot of 5on4 goals against expected goals. """
+    from hockey.team_plots import plot_special_teams
+    plot_special_teams.ph = hockey
+    plot_special_teams.main(situation='5on4', season=SEASON)
+
+
+def xg_rolling_average():
+    """ RollingAveragePlot of a division's rolling xG%, as a still image. """
+    from plot_types.rolling_average import RollingAveragePlot
+    from hockey.team_plots import plot_rolling_avg_line_plot
+    plot_rolling_avg_line_plot.ph = hockey
+    df = plot_rolling_avg_line_plot.get_xg_data(SEASON, window=10, num_games=0)
+    df = df.filter(pl.col('team').is_in(fixtures.NHL_DIVISIONS['Atlantic']))
+    RollingAveragePlot(dataframe=df, filename='xg_rolling_avg.png', x_column='gameNumber',
+                       x_label='Game #', y_column='xGoalsRollingAvg',
+                       y_label='10-Game Rolling Average', title='Atlantic Division xG%',
+                       sport='hockey', y_midpoint=50, add_team_logos=True,
+                       for_multiplot=False, multiline_key='team').make_plot()
+
+
+def standings_cumulative_lines():
+    """ CumulativeLinePlot of a division's games above .500. """
+    from baseball.team_plots import plot_team_standings
+    plot_team_standings.pyb = baseball
+    plot_team_standings.main(division=0)
+
+
+def run_differential_animation():
+    """ AnimatedRollingAveragePlot of a division's rolling run differential, one frame a team. """
+    from baseball.team_plots import plot_run_diff_rolling_avg
+    plot_run_diff_rolling_avg.pyb = baseball
+    plot_run_diff_rolling_avg.main(division=0)
+
+
+CASES = {
+    'team_ratio_scatter': team_ratio_scatter,
+    'skater_ratio_scatter': skater_ratio_scatter,
+    'batter_swarm': batter_swarm,
+    'scoreboard': scoreboard,
+    'icetime_mirrored_bar': icetime_mirrored_bar,
+    'game_report': game_report,
+    'goalie_sequential_bar': goalie_sequential_bar,
+    'special_teams_lollipop': special_teams_lollipop,
+    'xg_rolling_average': xg_rolling_average,
+    'standings_cumulative_lines': standings_cumulative_lines,
+    'run_differential_animation': run_differential_animation,
+}
+
+
+### Running ##########################################################################
+def run_once(case):
+    """ Runs a case from a clean slate, returning its wall time in seconds. """
+    figure_template.clear_templates()
+    league_context.clear_densities()
+    start = time.perf_counter()
+    case()
+    elapsed = time.perf_counter() - start
+    plt.close('all')
+    return elapsed
+
+
+def measure(case, repeat):
+    """
+    Times a case `repeat` times after a warm-up run, then measures its peak memory.
+
+    :return dict: Every time, their median and minimum, and the peak memory in MB.
+    """
+    run_once(case)
+    times = [run_once(case) for _ in range(repeat)]
+
+    tracemalloc.start()
+    run_once(case)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'times': times,
+        'median': statistics.median(times),
+        'min': min(times),
+        'peak_memory_mb': peak / 2**20,
+    }
+
+
+@contextmanager
+def scratch_directory():
+    """
+    Context manager running everything within it in a temporary directory, so the charts the
+    cases write don't end up in the repo, with the team logos linked in.
+    """
+    # Cached renders would skip the work being measured
+    os.environ.pop('RENDER_CACHE_DIR', None)
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.symlink(os.path.join(REPO_ROOT, 'team_logos'), os.path.join(tmp, 'team_logos'))
+        os.chdir(tmp)
+        try:
+            yield tmp
+        finally:
+            os.chdir(cwd)
+
+
+def environment():
+    """ Details of the environment results were measured in. """
+    return {
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'matplotlib': matplotlib.__version__,
+        'polars': pl.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def run_suite(names, repeat):
+    """
+    Runs the given cases in a scratch directory.
+
+    :return dict: Results for each case, along with details of the environment.
+    """
+    results = {}
+    with scratch_directory():
+        for name in names:
+            results[name] = measure(CASES[name], repeat)
+            print(f"{name:<30}{results[name]['median']:>9.3f} s"
+                  f"{results[name]['peak_memory_mb']:>10.1f} MB", file=sys.stderr)
+
+    return {
+        'meta': {**environment(), 'repeat': repeat},
+        'results': results,
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Prints each case's median time and peak memory against the baseline.
+
+    :return list[str]: The cases that regressed.
+    """
+    regressions = []
+    print(f"{'Case':<30}{'Time (s)':>10}{'Baseline':>10}{'Change':>9}"
+          f"{'Memory (MB)':>13}{'Baseline':>10}{'Change':>9}")
+    for name, result in results['results'].items():
+        previous = baseline.get('results', {}).get(name)
+        if previous is None:
+            print(f"{name:<30}{result['median']:>10.3f}{'-':>10}{'-':>9}"
+                  f"{result['peak_memory_mb']:>13.1f}{'-':>10}{'-':>9}")
+            continue
+
+        time_change = result['median'] / previous['median'] - 1
+        memory_change = result['peak_memory_mb'] / previous['peak_memory_mb'] - 1
+        regressed = time_change > threshold or memory_change > threshold
+        if regressed:
+            regressions.append(name)
+        print(f"{name:<30}{result['median']:>10.3f}{previous['median']:>10.3f}"
+              f"{time_change:>+9.1%}{result['peak_memory_mb']:>13.1f}"
+              f"{previous['peak_memory_mb']:>10.1f}{memory_change:>+9.1%}"
+              f"{'  REGRESSION' if regressed else ''}")
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-k', '--cases', nargs='+', choices=list(CASES), default=list(CASES),
+                        help='Cases to run, defaults to all of them.')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='Number of timed runs of each case.')
+    parser.add_argument('-o', '--output', default=None,
+                        help='File to write the results to, as JSON.')
+    parser.add_argument('-b', '--baseline', default=DEFAULT_BASELINE,
+                        help='Results file to compare against.')
+    parser.add_argument('-t', '--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Relative increase in time or memory that counts as a regression.')
+    data = parser.add_mutually_exclusive_group()
+    data.add_argument('--record', metavar='STORE', default=None,
+                      help='Run on live data, recording it to a fixture store.')
+    data.add_argument('--replay', metavar='STORE', default=None,
+                      help='Run on data recorded to a fixture store, rather than synthetic data.')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Store these results as the baseline, rather than comparing.')
+    args = parser.parse_args()
+
+    if args.record or args.replay:
+        store = fixture_store.FixtureStore(os.path.abspath(args.record or args.replay))
+        stand_in = fixture_store.RecordingModule if args.record else fixture_store.ReplayModule
+        hockey = stand_in('pyhockey', store)
+        baseball = stand_in('pybaseball', store)
+
+    results = run_suite(args.cases, args.repeat)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as fo:
+            json.dump(results, fo, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as fo:
+            json.dump(results, fo, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        sys.exit(0)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as fo:
+            baseline = json.load(fo)
+    else:
+        print(f"No baseline at {args.baseline}, run with --update-baseline to store one\n")
+
+    regressions = compare(results, baseline, args.threshold)
+    sys.exit(1 if regressions else 0)
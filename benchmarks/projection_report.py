@@ -0,0 +1,145 @@
+"""
+Report of how much data each hockey chart reads, with every column of the tables it fetches
+against only the columns it declares (see `fetch` in util/hockey_data.py).
+
+Each chart's fetches are made twice, once for every column and once for the chart's own, and the
+size of the frames read (as polars estimates it) is compared, along with how long the fetches
+took. By default the data is the synthetic data from benchmarks/fixtures.py, which is generated
+in full either way, so only the sizes are meaningful. With `--mirror` the fetches read from the
+local DuckDB mirror, which only reads the requested columns from disk, so the times are too:
+
+    python benchmarks/projection_report.py
+    python benchmarks/projection_report.py --mirror data/hockey.duckdb -o projection.json
+
+Run from the repo root, with the repo on PYTHONPATH.
+"""
+
+import os
+import json
+import time
+import argparse
+
+from benchmarks import fixtures
+from hockey.game_report import assemble_report
+from hockey.goalie_plots import games_by_gsax_bar_chart, xgoals_scatter
+from hockey.skater_plots import plot_skater_points, plot_skater_ratios
+from hockey.team_plots import plot_rolling_avg_line_plot, plot_special_teams, plot_team_ratios
+from util import fixture_store, hockey_data
+
+## Constants #########################################################################
+SEASON = 2025
+
+# The fetches each chart makes, as (pyhockey function, columns, arguments)
+CHARTS = {
+    'team_ratios': [
+        ('team_seasons', plot_team_ratios.TEAM_RATIO_COLUMNS,
+         {'season': SEASON, 'situation': '5on5'}),
+    ],
+    'special_teams': [
+        ('team_seasons', plot_special_teams.SPECIAL_TEAMS_COLUMNS,
+         {'season': SEASON, 'situation': '5on4'}),
+    ],
+    'xg_rolling_average': [
+        ('team_games', plot_rolling_avg_line_plot.XG_ROLLING_COLUMNS,
+         {'season': SEASON, 'situation': '5on5'}),
+    ],
+    'skater_points': [
+        ('skater_seasons', plot_skater_points.SKATER_POINTS_COLUMNS,
+         {'season': SEASON, 'situation': '5on5', 'min_icetime': 0}),
+    ],
+    'skater_ratios': [
+        ('skater_seasons', plot_skater_ratios.SKATER_RATIO_COLUMNS,
+         {'season': SEASON, 'situation': '5on5', 'min_icetime': 0}),
+    ],
+    'goalie_gsax_scatter': [
+        ('goalie_seasons', xgoals_scatter.GOALIE_GSAX_COLUMNS,
+         {'season': SEASON, 'situation': 'all', 'team': 'ALL'}),
+    ],
+    'goalie_gsax_bars': [
+        ('goalie_games', games_by_gsax_bar_chart.GOALIE_GAME_COLUMNS,
+         {'season': SEASON, 'team': 'TOR', 'situation': 'all'}),
+    ],
+    'game_report': [
+        ('skater_games', assemble_report.SKATER_GAME_COLUMNS, {'season': SEASON}),
+        ('goalie_games', assemble_report.GOALIE_GAME_COLUMNS, {'season': SEASON}),
+    ],
+}
+## End Constants #####################################################################
+
+
+def measure(ph, fetches, projected):
+    """
+    Makes a chart's fetches.
+
+    :param ph: pyhockey, or whatever stands in for it.
+    :param list[tuple] fetches: The chart's fetches, as in CHARTS.
+    :param bool projected: Fetch only the chart's columns, rather than every column.
+    :return tuple[int, float]: Total size of the frames read in bytes, and the time taken.
+    """
+    size = 0
+    start = time.perf_counter()
+    for function, columns, kwargs in fetches:
+        df = hockey_data.fetch(ph, function, columns if projected else None, **kwargs)
+        size += df.estimated_size()
+    return size, time.perf_counter() - start
+
+
+def report(ph, charts):
+    """
+    Measures every chart, with and without projection.
+
+    :param ph: pyhockey, or whatever stands in for it.
+    :param list[str] charts: Names of charts in CHARTS.
+    :return dict: For each chart, the bytes read and time taken with every column ('before')
+                  and with only its own ('after').
+    """
+    results = {}
+    for chart in charts:
+        # Warm up, so that neither run is charged for generating or caching the data
+        measure(ph, CHARTS[chart], projected=False)
+        bytes_before, time_before = measure(ph, CHARTS[chart], projected=False)
+        bytes_after, time_after = measure(ph, CHARTS[chart], projected=True)
+        results[chart] = {'bytes_before': bytes_before, 'bytes_after': bytes_after,
+                          'time_before': time_before, 'time_after': time_after}
+    return results
+
+
+def print_report(results):
+    """ Prints the results of `report` as a table. """
+    print(f"{'Chart':<24}{'Before (KB)':>13}{'After (KB)':>12}{'Saved':>8}"
+          f"{'Before (s)':>12}{'After (s)':>11}")
+    for chart, result in results.items():
+        saved = 1 - result['bytes_after'] / result['bytes_before']
+        print(f"{chart:<24}{result['bytes_before'] / 1024:>13.1f}"
+              f"{result['bytes_after'] / 1024:>12.1f}{saved:>8.1%}"
+              f"{result['time_before']:>12.3f}{result['time_after']:>11.3f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-k', '--charts', nargs='+', choices=list(CHARTS), default=list(CHARTS),
+                        help='Charts to report on, defaults to all of them.')
+    parser.add_argument('-o', '--output', default=None,
+                        help='File to write the results to, as JSON.')
+    data = parser.add_mutually_exclusive_group()
+    data.add_argument('--mirror', default=None,
+                      help='Read from this local DuckDB mirror, rather than synthetic data.')
+    data.add_argument('--replay', metavar='STORE', default=None,
+                      help='Read from data recorded to a fixture store, rather than synthetic '
+                           'data.')
+    args = parser.parse_args()
+
+    if args.mirror:
+        ph = hockey_data.LocalHockey(os.path.abspath(args.mirror))
+    elif args.replay:
+        ph = fixture_store.ReplayModule(
+            'pyhockey', fixture_store.FixtureStore(os.path.abspath(args.replay)))
+    else:
+        ph = fixtures.memoized(fixtures.hockey)
+
+    results = report(ph, args.charts)
+    print_report(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as fo:
+            json.dump(results, fo, indent=2)
@@ -0,0 +1,287 @@
+"""
+Scaling benchmark: runs every case of benchmarks/plot_suite.py, plus the data helpers the plots
+are built from, on synthetic leagues 1x, 10x and 100x the size of a real one, to find anything
+that grows faster than the data does before production data gets there.
+
+Leagues are scaled on one axis at a time (see fixtures.League): the number of teams, the number
+of games each team plays, or the number of players on each team. Each case is run at each scale
+in a fresh process, once to warm up (which generates the data) and once to measure its wall
+time and peak resident memory, which unlike tracemalloc includes what polars allocates. A case
+that fails, or runs longer than `--timeout`, isn't run at the larger scales.
+
+Results are written as JSON, along with a chart of time and memory against scale for each axis,
+and a table of the exponent each case grows with between its two largest scales (1 is linear, 2
+is quadratic):
+
+    python benchmarks/scaling.py --axes teams --cases team_ratio_scatter xg_rolling_data
+
+Run from the repo root, with the repo on PYTHONPATH.
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import resource
+import tempfile
+import subprocess
+
+import matplotlib
+matplotlib.use('agg')
+import matplotlib.pyplot as plt
+
+from benchmarks import fixtures, plot_suite
+
+## Constants #########################################################################
+REPO_ROOT = plot_suite.REPO_ROOT
+SEASON = plot_suite.SEASON
+AL_EAST = ['TOR', 'BOS', 'NYY', 'TBR', 'BAL']
+
+# Seconds a case can run for at one scale before it's stopped
+DEFAULT_TIMEOUT = 600
+# Growth exponent above which a case is flagged, between linear and quadratic
+SUPERLINEAR_EXPONENT = 1.5
+## End Constants #####################################################################
+
+
+### Data helper cases ################################################################
+def batter_stats_data():
+    """ get_detailed_batter_stats: bref and statcast stats merged, with wRC+ row by row. """
+    from util import get_detailed_batter_stats
+    get_detailed_batter_stats.pyb = plot_suite.baseball
+    get_detailed_batter_stats.get_detailed_batter_stats(SEASON)
+
+
+def xg_rolling_data():
+    """ Every team's rolling xG%, as in plot_rolling_avg_line_plot. """
+    from hockey.team_plots import plot_rolling_avg_line_plot
+    plot_rolling_avg_line_plot.ph = plot_suite.hockey
+    plot_rolling_avg_line_plot.get_xg_data(SEASON, window=10, num_games=0)
+
+
+def standings_data():
+    """ A division's cumulative games above .500, as in plot_team_standings. """
+    from baseball.team_plots import plot_team_standings
+    plot_team_standings.pyb = plot_suite.baseball
+    plot_team_standings.process_data(AL_EAST)
+
+
+def run_differential_data():
+    """ A division's rolling run differential, as in plot_run_diff_rolling_avg. """
+    from baseball.team_plots import plot_run_diff_rolling_avg
+    plot_run_diff_rolling_avg.pyb = plot_suite.baseball
+    plot_run_diff_rolling_avg.proccess_data(AL_EAST)
+
+
+CASES = {
+    **plot_suite.CASES,
+    'batter_stats_data': batter_stats_data,
+    'xg_rolling_data': xg_rolling_data,
+    'standings_data': standings_data,
+    'run_differential_data': run_differential_data,
+}
+
+
+### Measuring a case (in the worker process) #########################################
+def reset_peak_rss():
+    """ Resets the process' peak resident memory, where the OS allows it (Linux only). """
+    try:
+        with open('/proc/self/clear_refs', 'w', encoding='utf-8') as fo:
+            fo.write('5')
+    except OSError:
+        pass
+
+
+def rss_mb(field='VmHWM'):
+    """
+    The process' peak (VmHWM) or current (VmRSS) resident memory in MB, falling back to the
+    lifetime peak where /proc isn't available.
+    """
+    try:
+        with open('/proc/self/status', encoding='utf-8') as fo:
+            for line in fo:
+                if line.startswith(f'{field}:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_case(name, axis, scale, logo_root):
+    """
+    Runs a case once on a league scaled on one axis, after a warm-up run.
+
+    :return dict: Wall time in seconds, and resident memory in MB at the start of the run and at
+                  its peak.
+    """
+    from plot_types import plot
+
+    league = fixtures.League(**{axis: scale})
+    fixtures.install_synthetic_teams(league, logo_root,
+                                     real_logo_root=os.path.join(REPO_ROOT, 'team_logos'))
+    plot.set_logo_root(logo_root)
+    plot_suite.hockey = fixtures.memoized(league.hockey)
+    plot_suite.baseball = fixtures.memoized(league.baseball)
+
+    with plot_suite.scratch_directory():
+        plot_suite.run_once(CASES[name])
+        start_rss = rss_mb('VmRSS')
+        reset_peak_rss()
+        elapsed = plot_suite.run_once(CASES[name])
+        return {'time': elapsed, 'start_rss_mb': start_rss, 'peak_rss_mb': rss_mb('VmHWM')}
+
+
+### Running the benchmark ############################################################
+def measure(name, axis, scale, logo_root, timeout):
+    """
+    Runs a case at one scale in a fresh process, so that a case running out of memory or time
+    can't take the rest of the benchmark with it.
+
+    :return dict: The case's results, or the error it failed with.
+    """
+    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as fo:
+        result_file = fo.name
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join(filter(None, [
+        REPO_ROOT, os.environ.get('PYTHONPATH')]))}
+    command = [sys.executable, os.path.abspath(__file__), '--worker', name, axis, str(scale),
+               '--logo-root', logo_root, '--result', result_file]
+
+    try:
+        process = subprocess.run(command, env=env, capture_output=True, text=True,
+                                 timeout=timeout, check=False)
+        if process.returncode != 0:
+            lines = (process.stderr or process.stdout).strip().splitlines()
+            return {'error': lines[-1] if lines else f'exit code {process.returncode}'}
+        with open(result_file, encoding='utf-8') as fi:
+            return json.load(fi)
+    except subprocess.TimeoutExpired:
+        return {'error': f'timed out after {timeout} s'}
+    finally:
+        os.remove(result_file)
+
+
+def growth_exponent(points):
+    """
+    The exponent a case's time grows with between its two largest scales, e.g. 2 if 10 times
+    the data takes 100 times as long.
+
+    :param list[tuple] points: (scale, time) for each scale the case ran at.
+    """
+    if len(points) < 2:
+        return None
+    (scale_a, time_a), (scale_b, time_b) = points[-2:]
+    return math.log(time_b / time_a) / math.log(scale_b / scale_a)
+
+
+def plot_curves(results, scales, filename):
+    """
+    Writes a chart of each case's time and peak memory against scale, one row per axis.
+    """
+    axes_names = list(results)
+    fig, axes = plt.subplots(len(axes_names), 2, figsize=(14, 5 * len(axes_names)),
+                             squeeze=False)
+    for row, axis in enumerate(axes_names):
+        for name, by_scale in results[axis].items():
+            points = [(scale, by_scale[str(scale)]) for scale in scales
+                      if 'error' not in by_scale.get(str(scale), {'error': None})]
+            if not points:
+                continue
+            x = [scale for scale, _ in points]
+            axes[row][0].plot(x, [r['time'] for _, r in points], marker='o', label=name)
+            axes[row][1].plot(x, [r['peak_rss_mb'] for _, r in points], marker='o', label=name)
+
+        for col, label in enumerate(['Time (s)', 'Peak RSS (MB)']):
+            axes[row][col].set_xscale('log')
+            axes[row][col].set_yscale('log')
+            axes[row][col].set_xticks(scales, [f'{scale}x' for scale in scales])
+            axes[row][col].set_xlabel(f'League size ({axis})')
+            axes[row][col].set_ylabel(label)
+            axes[row][col].grid(True, which='both', alpha=0.3)
+        axes[row][1].legend(fontsize=7, loc='upper left')
+
+    fig.tight_layout()
+    fig.savefig(filename, dpi=100)
+    plt.close(fig)
+
+
+def print_summary(results, scales):
+    """
+    Prints each case's time at each scale and its growth exponent, flagging superlinear ones.
+    """
+    for axis, cases in results.items():
+        print(f"\nScaling {axis}")
+        print(f"{'Case':<30}" + ''.join(f"{f'{scale}x (s)':>12}" for scale in scales)
+              + f"{'Exponent':>10}")
+        for name, by_scale in cases.items():
+            cells, points = '', []
+            for scale in scales:
+                result = by_scale.get(str(scale))
+                if result is None:
+                    cells += f"{'-':>12}"
+                elif 'error' in result:
+                    cells += f"{'failed':>12}"
+                else:
+                    cells += f"{result['time']:>12.3f}"
+                    points.append((scale, result['time']))
+
+            exponent = growth_exponent(points)
+            flag = '  SUPERLINEAR' if exponent and exponent > SUPERLINEAR_EXPONENT else ''
+            print(f"{name:<30}{cells}{exponent if exponent is None else f'{exponent:.2f}':>10}"
+                  f"{flag}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-k', '--cases', nargs='+', choices=list(CASES), default=list(CASES),
+                        help='Cases to run, defaults to all of them.')
+    parser.add_argument('-a', '--axes', nargs='+', choices=fixtures.SCALE_AXES,
+                        default=list(fixtures.SCALE_AXES),
+                        help='League dimensions to scale, one at a time.')
+    parser.add_argument('-s', '--scales', nargs='+', type=int, default=list(fixtures.SCALES),
+                        help='Multiples of a real league to run at.')
+    parser.add_argument('-t', '--timeout', type=int, default=DEFAULT_TIMEOUT,
+                        help='Seconds a case can run for at one scale.')
+    parser.add_argument('-o', '--output', default='scaling.json',
+                        help='File to write the results to, as JSON.')
+    parser.add_argument('-p', '--plot', default='scaling.png',
+                        help='File to write the chart of the results to.')
+    # Used internally, to run a single case in a worker process
+    parser.add_argument('--worker', nargs=3, metavar=('CASE', 'AXIS', 'SCALE'),
+                        help=argparse.SUPPRESS)
+    parser.add_argument('--logo-root', help=argparse.SUPPRESS)
+    parser.add_argument('--result', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        case, axis, scale = args.worker
+        with open(args.result, 'w', encoding='utf-8') as fo:
+            json.dump(run_case(case, axis, int(scale), args.logo_root), fo)
+        sys.exit(0)
+
+    scales = sorted(args.scales)
+    results = {}
+    with tempfile.TemporaryDirectory() as logo_root:
+        for axis in args.axes:
+            results[axis] = {}
+            for name in args.cases:
+                results[axis][name] = {}
+                for scale in scales:
+                    start = time.perf_counter()
+                    result = measure(name, axis, scale, logo_root, args.timeout)
+                    results[axis][name][str(scale)] = result
+                    status = result.get('error') or \
+                        f"{result['time']:.3f} s, {result['peak_rss_mb']:.0f} MB peak"
+                    print(f"{axis:<8}{name:<30}{f'{scale}x':>6}  {status} "
+                          f"({time.perf_counter() - start:.0f} s total)", file=sys.stderr)
+                    # Larger scales would only fail the same way, or take longer still
+                    if 'error' in result:
+                        break
+
+    with open(args.output, 'w', encoding='utf-8') as fo:
+        json.dump({'meta': {**plot_suite.environment(), 'scales': scales},
+                   'results': results}, fo, indent=2)
+    plot_curves(results, scales, args.plot)
+    print_summary(results, scales)
+    print(f"\nResults written to {args.output}, chart to {args.plot}")
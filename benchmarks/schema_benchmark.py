@@ -0,0 +1,128 @@
+"""
+Benchmark of the dtypes in util/schema.py, on a season of the synthetic skater_games data from
+benchmarks/fixtures.py: the filters and group-bys the hockey charts run, timed with the team,
+situation, position and name columns as strings and cast, along with the memory the frame
+takes up either way.
+
+    python benchmarks/schema_benchmark.py
+    python benchmarks/schema_benchmark.py --repeat 20 --output schema.json
+
+Run from the repo root, with the repo on PYTHONPATH.
+"""
+
+import json
+import time
+import argparse
+import statistics
+
+import polars as pl
+
+from benchmarks import fixtures
+from util import schema
+
+## Constants #########################################################################
+SEASON = 2025
+## End Constants #####################################################################
+
+
+def filter_each_team_and_situation(df):
+    """ As ScoreBoardPlot does for a game, for every team and situation of the season. """
+    for team in sorted(set(df['team'])):
+        for situation in ['ev', 'pp', 'pk', 'all']:
+            df.filter((pl.col('team') == team) & (pl.col('situation') == situation))['goals'].sum()
+
+
+def filter_positions(df):
+    """ As plot_skater_points splits forwards and defensemen. """
+    df.filter(pl.col('position').is_in({'C', 'R', 'L'}))
+    df.filter(pl.col('position') == 'D')
+
+
+def group_by_team_and_situation(df):
+    """ Totals for every team and situation. """
+    df.group_by(['team', 'situation']).agg(pl.col('iceTime').sum(), pl.col('goals').sum())
+
+
+def group_by_name(df):
+    """ Season totals for every skater. """
+    df.group_by(['name', 'team']).agg(pl.col('iceTime').sum(), pl.col('goals').sum())
+
+
+OPERATIONS = {
+    'filter_each_team_and_situation': filter_each_team_and_situation,
+    'filter_positions': filter_positions,
+    'group_by_team_and_situation': group_by_team_and_situation,
+    'group_by_name': group_by_name,
+}
+
+
+def time_operation(operation, df, repeat):
+    """ Median time of `repeat` runs of an operation, after one to warm up. """
+    operation(df)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation(df)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def run_benchmark(repeat):
+    """
+    Times every operation on a season of skater_games, with strings and with the schema's
+    dtypes.
+
+    :param int repeat: Number of timed runs of each operation.
+    :return dict: The frame's size and the time taken to cast it, and for each operation, its
+                  median time with strings ('string') and cast columns ('cast').
+    """
+    strings = fixtures.hockey.skater_games(season=SEASON)
+
+    start = time.perf_counter()
+    cast = schema.cast(strings)
+    cast_time = time.perf_counter() - start
+
+    columns = [column for column in schema.SCHEMAS['nhl'] if column in strings.columns]
+    results = {
+        'rows': len(strings),
+        'dtypes': {column: str(cast.schema[column]) for column in columns},
+        'cast_time': cast_time,
+        'frame_bytes': {'string': strings.estimated_size(), 'cast': cast.estimated_size()},
+        'column_bytes': {'string': strings.select(columns).estimated_size(),
+                         'cast': cast.select(columns).estimated_size()},
+        'operations': {},
+    }
+    for name, operation in OPERATIONS.items():
+        results['operations'][name] = {'string': time_operation(operation, strings, repeat),
+                                       'cast': time_operation(operation, cast, repeat)}
+    return results
+
+
+def print_results(results):
+    """ Prints the results of `run_benchmark` as a table. """
+    print(f"skater_games, {results['rows']} rows, cast in {results['cast_time']:.3f}s")
+    for label in ['frame_bytes', 'column_bytes']:
+        before, after = results[label]['string'], results[label]['cast']
+        print(f"{label.replace('_', ' ').capitalize():<34}{before / 2 ** 20:>9.2f} MB"
+              f"{after / 2 ** 20:>9.2f} MB{after / before - 1:>+9.1%}")
+    print()
+    print(f"{'Operation':<34}{'String (s)':>12}{'Cast (s)':>12}{'Speed-up':>10}")
+    for name, result in results['operations'].items():
+        print(f"{name:<34}{result['string']:>12.4f}{result['cast']:>12.4f}"
+              f"{result['string'] / result['cast']:>9.2f}x")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-r', '--repeat', type=int, default=10,
+                        help='Number of timed runs of each operation.')
+    parser.add_argument('-o', '--output', default=None,
+                        help='File to write the results to, as JSON.')
+    args = parser.parse_args()
+
+    results = run_benchmark(args.repeat)
+    print_results(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as fo:
+            json.dump(results, fo, indent=2)
@@ -0,0 +1,82 @@
+"""
+Benchmark comparing the size of a representative fantasy free agent plot (40 players from 10
+teams, as a RatioScatterPlot) exported with matplotlib's SVG backend as-is, against
+util/svg_export.py which embeds each team logo once.
+
+Run from the repo root:
+    python benchmarks/svg_export_benchmark.py --players 40 --teams 10
+"""
+
+import io
+import gzip
+import time
+import argparse
+import xml.etree.ElementTree as ET
+
+import matplotlib
+matplotlib.use('agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import polars as pl
+
+from plot_types.ratio_scatter import RatioScatterPlot
+from util.svg_export import deduplicate_images
+
+TEAMS = ['NYY', 'BOS', 'TOR', 'TBR', 'BAL', 'SEA', 'HOU', 'LAD', 'SDP', 'ATL', 'NYM', 'PHI',
+         'CHC', 'MIL', 'STL', 'CIN', 'PIT', 'ARI', 'SFG', 'COL']
+
+
+def free_agent_figure(num_players, num_teams, seed=0):
+    """ Builds the dashboard's batter plot for synthetic free agents. """
+    rng = np.random.default_rng(seed)
+    df = pl.DataFrame({
+        'name': [f'P. Player{i}' for i in range(num_players)],
+        'team': [TEAMS[i % num_teams] for i in range(num_players)],
+        'xwOBA': rng.uniform(0.25, 0.40, num_players),
+        'wRC+': rng.uniform(60, 160, num_players),
+    })
+    plot = RatioScatterPlot(df, filename='',
+                            y_column='wRC+', x_column='xwOBA',
+                            title='Interesting Free Agents - OF',
+                            y_label='wRC+', x_label='xwOBA',
+                            quadrant_labels=None,
+                            invert_x=False,
+                            break_even_line=False,
+                            scale='player',
+                            data_disclaimer='fangraphs',
+                            sport='baseball',
+                            fantasy_mode=True)
+    return plot.make_plot(dashboard=True)
+
+
+def count_elements(svg, tag):
+    """ Number of elements with the given tag in an SVG document (which must be well-formed). """
+    root = ET.fromstring(svg)
+    return sum(1 for element in root.iter() if element.tag == f'{{http://www.w3.org/2000/svg}}{tag}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-p', '--players', type=int, default=40,
+                        help='Number of players in the plot.')
+    parser.add_argument('-t', '--teams', type=int, default=10,
+                        help='Number of teams the players are spread over.')
+    args = parser.parse_args()
+
+    fig = free_agent_figure(args.players, args.teams)
+    buffer = io.StringIO()
+    fig.savefig(buffer, format='svg', dpi=144)
+    plt.close(fig)
+    original = buffer.getvalue()
+
+    start = time.perf_counter()
+    deduplicated = deduplicate_images(original)
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.players} players from {args.teams} teams, deduplicated in {elapsed * 1000:.1f} ms\n")
+    print(f"{'Export':<14}{'Size (KB)':>12}{'Gzipped (KB)':>14}{'<image>':>9}{'<use>':>7}")
+    for name, svg in [('matplotlib', original), ('svg_export', deduplicated)]:
+        size = len(svg.encode()) / 1024
+        gzipped = len(gzip.compress(svg.encode())) / 1024
+        print(f"{name:<14}{size:>12.1f}{gzipped:>14.1f}"
+              f"{count_elements(svg, 'image'):>9}{count_elements(svg, 'use'):>7}")
@@ -0,0 +1,287 @@
+"""
+Module holding the fantasy free agent data used by the dashboard in memory.
+
+Each position's CSV is read once, when the data is loaded, and stored pre-partitioned by term
+(week, month, season), with everything the widget callbacks need already computed:
+    - the table as displayed on the dashboard, i.e. without the internal columns and with the
+      player names abbreviated,
+    - the DataFrame used for the scatter plot,
+    - the rows to freeze in the table, i.e. one per player already on my team.
+
+That way, every widget change is just a dictionary lookup, without any file I/O.
+
+When the data comes as the partitioned Parquet dataset (see dashboard/fantasy_dataset.py), only
+the rows to freeze are worked out when it's loaded. The table and plot data of each term are
+read from their partition, with just the columns they need, the first time they're asked for,
+and kept from then on.
+"""
+
+import asyncio
+import zipfile
+
+import pandas as pd
+import polars as pl
+
+from dashboard import fantasy_dataset
+
+## Constants #########################################################################
+POSITIONS = ['C', '1B', '2B', '3B', 'SS', 'OF', 'SP', 'RP']
+TERMS = ['week', 'month', 'season']
+
+# How often callbacks check whether the first data load has finished
+LOAD_POLL_SECONDS = 0.25
+
+# Columns which are used to build the store, but not displayed in the table
+HIDDEN_COLUMNS = ['on_team', 'Team', 'term']
+
+BATTER_POSITIONS = {'1B', '2B', '3B', 'SS', 'C', 'OF'}
+# Columns plotted against each other, as (x, y), for batters and pitchers
+BATTER_AXES = ('xwOBA', 'wRC+')
+PITCHER_AXES = ('K-BB%', 'Stuff+')
+## End Constants #####################################################################
+
+
+## Globals ###########################################################################
+# Keyed by position, see `build_position` and `dataset_position` for the contents of each entry.
+# Replaced wholesale by `load_store`, `load_store_from_dataset` or `load_store_from_zip`.
+_store = {}
+## End Globals ########################################################################
+
+
+def term_from_label(label: str) -> str:
+    """
+    Converts the label of a date range widget option (e.g. 'Week', or 'Last Week') to the
+    value of the 'term' column in the data.
+
+    :param str label: The widget label.
+    :return str: The term.
+    """
+    return label.split(' ')[-1].lower()
+
+
+def abbreviate_names(names: pd.Series) -> pd.Series:
+    """
+    Abbreviates player names to their first initial and last name, e.g. 'Vladimir Guerrero Jr.'
+    becomes 'V. Guerrero Jr.'.
+
+    :param pd.Series names: Full player names.
+    :return pd.Series: The abbreviated names.
+    """
+    last_names = names.str.split(' ', n=1).str[1].fillna('')
+    return names.str[0] + '. ' + last_names
+
+
+def plot_axes(pos: str) -> tuple[str, str]:
+    """
+    Returns the columns plotted against each other for a position.
+
+    :param str pos: The player position.
+    :return tuple[str, str]: The x and y columns.
+    """
+    return BATTER_AXES if pos in BATTER_POSITIONS else PITCHER_AXES
+
+
+def plot_columns(pos: str) -> list[str]:
+    """
+    Returns the columns of a position's data that its scatter plot uses.
+
+    :param str pos: The player position.
+    :return list[str]: The column names.
+    """
+    return ['Name', 'Team', *plot_axes(pos)]
+
+
+def make_table(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Builds the table displayed for a term, dropping any internal columns and abbreviating the
+    player names.
+
+    :param pd.DataFrame df: Raw data for a single term.
+    :return pd.DataFrame: The table.
+    """
+    table = df.drop(columns=[column for column in HIDDEN_COLUMNS if column in df.columns])
+    table['Name'] = abbreviate_names(table['Name'])
+    return table.reset_index(drop=True)
+
+
+def make_plot_data(df: pd.DataFrame, pos: str) -> pl.DataFrame:
+    """
+    Builds the data plotted for a term.
+
+    :param pd.DataFrame df: Raw data for a single term, with at least the `plot_columns`.
+    :param str pos: The player position.
+    :return pl.DataFrame: The plot data.
+    """
+    # RatioScatterPlot expects the team and label columns under 'team' and 'name'
+    return pl.from_pandas(df[plot_columns(pos)]).rename({'Team': 'team', 'Name': 'name'})
+
+
+def freeze_rows(df: pd.DataFrame) -> list[int]:
+    """
+    Returns the rows to freeze in a position's table, one for each player on my team.
+
+    :param pd.DataFrame df: Raw data for the position, with at least the 'Name' and 'on_team'
+                            columns.
+    :return list[int]: The row indices.
+    """
+    return list(range(df.loc[df['on_team'], 'Name'].nunique()))
+
+
+def build_position(df: pd.DataFrame, pos: str) -> dict:
+    """
+    Builds the store entry for a single position from its raw DataFrame.
+
+    :param pd.DataFrame df: Raw data for the position, for every term.
+    :param str pos: The player position.
+    :return dict: Entry with the frozen rows under 'freeze', and under 'terms' the display table
+                  ('table') and plot data ('plot') for each term.
+    """
+    terms = {}
+    for term in TERMS:
+        term_df = df[df['term'] == term]
+        terms[term] = {
+            'table': make_table(term_df),
+            'plot': make_plot_data(term_df, pos),
+        }
+
+    return {
+        'freeze': freeze_rows(df),
+        'terms': terms,
+    }
+
+
+def dataset_position(dataset: fantasy_dataset.Dataset, pos: str) -> dict:
+    """
+    Builds the store entry for a single position from the Parquet dataset. Only the frozen rows
+    are worked out now, from the names and `on_team` flags of every term. The table and plot data
+    of each term are left to `get_table` and `get_plot_data`, which read them from their
+    partition through the functions under 'read'.
+
+    :param fantasy_dataset.Dataset dataset: The dataset.
+    :param str pos: The player position.
+    :return dict: Entry in the same format as `build_position`'s, with the functions that read the
+                  table and plot data of a term under 'read'.
+    """
+    table_columns = [column for column in dataset.columns() if column not in HIDDEN_COLUMNS]
+    on_team = pd.concat([dataset.read_partition(pos, term, ['Name', 'on_team'])
+                         for term in dataset.terms(pos)])
+
+    return {
+        'freeze': freeze_rows(on_team),
+        'terms': {term: {} for term in dataset.terms(pos)},
+        'read': {
+            'table': lambda term: make_table(dataset.read_partition(pos, term, table_columns)),
+            'plot': lambda term: make_plot_data(
+                dataset.read_partition(pos, term, plot_columns(pos)), pos),
+        },
+    }
+
+
+def load_store(data_dir: str = 'data') -> None:
+    """
+    Reads the CSV for every position and replaces the contents of the store.
+
+    :param str data_dir: Directory holding one 'fantasy_data_{pos}.csv' file per position.
+    """
+    global _store
+
+    # Swap in the new data all at once, so callbacks never see a partially loaded store
+    _store = {pos: build_position(pd.read_csv(f'{data_dir}/fantasy_data_{pos}.csv'), pos)
+              for pos in POSITIONS}
+
+
+def load_store_from_dataset(root: str = fantasy_dataset.DATASET_NAME) -> None:
+    """
+    Same as `load_store`, but reads the partitioned Parquet dataset (see
+    dashboard/fantasy_dataset.py).
+
+    :param str root: Root directory of the dataset.
+    """
+    global _store
+
+    dataset = fantasy_dataset.open_dataset(root)
+    _store = {pos: dataset_position(dataset, pos) for pos in POSITIONS}
+
+
+def load_store_from_zip(archive: zipfile.ZipFile) -> None:
+    """
+    Same as `load_store`, but reads the data straight out of the data artifact's zip, which holds
+    either the partitioned Parquet dataset or, for older artifacts, one
+    'fantasy_data_{pos}.csv' file per position at its root.
+
+    :param zipfile.ZipFile archive: The archive.
+    """
+    global _store
+
+    if fantasy_dataset.is_dataset_archive(archive):
+        dataset = fantasy_dataset.open_dataset_from_zip(archive)
+        _store = {pos: dataset_position(dataset, pos) for pos in POSITIONS}
+        return
+
+    store = {}
+    for pos in POSITIONS:
+        with archive.open(f'fantasy_data_{pos}.csv') as fo:
+            store[pos] = build_position(pd.read_csv(fo), pos)
+    _store = store
+
+
+def is_loaded() -> bool:
+    """
+    Returns True once data has been loaded into the store.
+    """
+    return bool(_store)
+
+
+async def wait_for_data() -> None:
+    """
+    Waits, without blocking the event loop, until data has been loaded into the store.
+    """
+    while not _store:
+        await asyncio.sleep(LOAD_POLL_SECONDS)
+
+
+def _get_term_data(pos: str, term: str, key: str):
+    """
+    Returns the table or plot data (`key`) of a position and term, reading it from the dataset
+    the first time it's asked for if the store was loaded from one.
+    """
+    entry = _store[pos]
+    term_data = entry['terms'][term]
+    if key not in term_data:
+        # Two callbacks asking at once both read the partition, and one of the results is kept
+        term_data[key] = entry['read'][key](term)
+    return term_data[key]
+
+
+def get_table(pos: str, term: str) -> pd.DataFrame:
+    """
+    Returns the statistics table displayed for a position and term. The DataFrame is shared
+    between every session, so it should not be modified.
+
+    :param str pos: The player position.
+    :param str term: One of 'week', 'month' or 'season'.
+    :return pd.DataFrame: The table.
+    """
+    return _get_term_data(pos, term, 'table')
+
+
+def get_plot_data(pos: str, term: str) -> pl.DataFrame:
+    """
+    Returns the data to plot for a position and term.
+
+    :param str pos: The player position.
+    :param str term: One of 'week', 'month' or 'season'.
+    :return pl.DataFrame: The plot data.
+    """
+    return _get_term_data(pos, term, 'plot')
+
+
+def get_freeze_rows(pos: str) -> list[int]:
+    """
+    Returns the indices of the rows to freeze in the statistics table for a position, i.e. one
+    for each player already on my team.
+
+    :param str pos: The player position.
+    :return list[int]: The row indices.
+    """
+    return _store[pos]['freeze']
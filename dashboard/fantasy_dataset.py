@@ -0,0 +1,196 @@
+"""
+Module for the columnar format of the fantasy free agent data artifact.
+
+Rather than one text CSV per position, the data is stored as a Parquet dataset partitioned by
+position and term, with the player names and teams dictionary-encoded:
+
+    fantasy_data/
+        _schema.json
+        pos=C/term=week/part-0.parquet
+        pos=C/term=month/part-0.parquet
+        ...
+
+`_schema.json` holds the schema version, the column types and the partitions in the dataset.
+Readers check the schema version first, so a change to the format can't be misread silently.
+
+A `Dataset` reads one partition at a time, when it's asked for, with polars, memory-mapped when
+it's on disk, so only the partitions and columns that are asked for are ever read.
+
+The producer can convert its CSVs with:
+    python dashboard/fantasy_dataset.py -i data -o fantasy_data
+"""
+
+import io
+import os
+import json
+import argparse
+
+import pandas as pd
+import polars as pl
+
+## Constants #########################################################################
+# Bump whenever the layout or column types change in a way older readers can't handle
+SCHEMA_VERSION = 1
+
+DATASET_NAME = 'fantasy_data'
+SCHEMA_FILENAME = '_schema.json'
+
+# Columns with many repeated values, stored dictionary-encoded
+DICTIONARY_COLUMNS = ['Name', 'Team']
+## End Constants #####################################################################
+
+
+def partition_path(pos: str, term: str) -> str:
+    """
+    Returns the path of a partition, relative to the root of the dataset.
+    """
+    return f'pos={pos}/term={term}/part-0.parquet'
+
+
+def to_pandas(df: pl.DataFrame) -> pd.DataFrame:
+    """
+    Converts a polars DataFrame to pandas column by column, since DataFrame.to_pandas requires
+    pyarrow, which the project doesn't otherwise need.
+    """
+    return pd.DataFrame({name: df[name].to_numpy() for name in df.columns})
+
+
+def write_dataset(frames: dict[str, pl.DataFrame], root: str) -> None:
+    """
+    Writes the data for every position as a partitioned dataset.
+
+    :param dict[str, pl.DataFrame] frames: Data for each position, for every term, with the term
+                                           under the 'term' column.
+    :param str root: Directory to write the dataset to.
+    """
+    partitions = {}
+    columns = None
+    for pos, df in frames.items():
+        df = df.with_columns(pl.col(DICTIONARY_COLUMNS).cast(pl.Categorical))
+        partitions[pos] = []
+        for term, term_df in df.partition_by('term', as_dict=True, include_key=False).items():
+            term = term[0]
+            path = os.path.join(root, partition_path(pos, term))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            term_df.write_parquet(path, compression='zstd', statistics=True)
+
+            partitions[pos].append(term)
+            columns = {name: str(dtype) for name, dtype in term_df.schema.items()}
+
+    with open(os.path.join(root, SCHEMA_FILENAME), 'w', encoding='utf-8') as fo:
+        json.dump({'schema_version': SCHEMA_VERSION,
+                   'columns': columns,
+                   'partitions': partitions}, fo, indent=2)
+
+
+def convert_csv_dir(csv_dir: str, root: str) -> None:
+    """
+    Converts a directory of 'fantasy_data_{pos}.csv' files into a dataset.
+
+    :param str csv_dir: Directory holding the CSVs.
+    :param str root: Directory to write the dataset to.
+    """
+    frames = {}
+    for filename in sorted(os.listdir(csv_dir)):
+        if filename.startswith('fantasy_data_') and filename.endswith('.csv'):
+            pos = filename[len('fantasy_data_'):-len('.csv')]
+            frames[pos] = pl.read_csv(os.path.join(csv_dir, filename))
+    write_dataset(frames, root)
+
+
+def check_schema(schema: dict) -> None:
+    """
+    Raises a ValueError if the dataset was written with a different schema version.
+    """
+    version = schema.get('schema_version')
+    if version != SCHEMA_VERSION:
+        raise ValueError(f"Fantasy dataset has schema version {version}, "
+                         f"expected {SCHEMA_VERSION}")
+
+
+class Dataset:
+    """
+    A fantasy dataset whose partitions are read on demand.
+
+    :param dict schema: Contents of the dataset's `_schema.json`.
+    :param open_partition: Takes the path of a partition relative to the root of the dataset and
+                           returns something polars can read.
+    """
+    def __init__(self, schema: dict, open_partition):
+        check_schema(schema)
+        self.schema = schema
+        self.open_partition = open_partition
+
+    def columns(self) -> list[str]:
+        """
+        Returns the names of the columns in every partition, in order.
+        """
+        return list(self.schema['columns'])
+
+    def terms(self, pos: str) -> list[str]:
+        """
+        Returns the terms stored for a position.
+        """
+        return self.schema['partitions'][pos]
+
+    def read_partition(self, pos: str, term: str, columns: list[str] = None) -> pd.DataFrame:
+        """
+        Reads the data for one position and term.
+
+        :param str pos: The player position.
+        :param str term: One of 'week', 'month' or 'season'.
+        :param list[str] columns: Columns to read, defaults to all of them.
+        :return pd.DataFrame: The data, in the same format as the CSVs but without the 'term'
+                              column.
+        """
+        return to_pandas(pl.read_parquet(self.open_partition(partition_path(pos, term)),
+                                         columns=columns, memory_map=True))
+
+
+def open_dataset(root: str) -> Dataset:
+    """
+    Opens a dataset on disk, whose partitions are memory-mapped as they're read.
+
+    :param str root: Root directory of the dataset.
+    :return Dataset: The dataset.
+    """
+    with open(os.path.join(root, SCHEMA_FILENAME), encoding='utf-8') as fo:
+        schema = json.load(fo)
+
+    return Dataset(schema, lambda path: os.path.join(root, path))
+
+
+def open_dataset_from_zip(archive) -> Dataset:
+    """
+    Same as `open_dataset`, for a dataset stored under DATASET_NAME in a zip archive. The archive
+    can be closed afterwards: the partitions are kept as their compressed Parquet bytes, and only
+    decoded when they're read.
+
+    :param zipfile.ZipFile archive: The archive.
+    :return Dataset: The dataset.
+    """
+    schema = json.loads(archive.read(f'{DATASET_NAME}/{SCHEMA_FILENAME}'))
+    check_schema(schema)
+
+    partitions = {partition_path(pos, term): archive.read(f'{DATASET_NAME}/'
+                                                          f'{partition_path(pos, term)}')
+                  for pos, terms in schema['partitions'].items() for term in terms}
+    return Dataset(schema, lambda path: io.BytesIO(partitions[path]))
+
+
+def is_dataset_archive(archive) -> bool:
+    """
+    Returns True if the zip archive holds a dataset, rather than the legacy CSVs.
+    """
+    return f'{DATASET_NAME}/{SCHEMA_FILENAME}' in archive.namelist()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-i', '--input', type=str, default='data',
+                        help='Directory holding the fantasy_data_{pos}.csv files.')
+    parser.add_argument('-o', '--output', type=str, default=DATASET_NAME,
+                        help='Directory to write the dataset to.')
+    args = parser.parse_args()
+
+    convert_csv_dir(args.input, args.output)
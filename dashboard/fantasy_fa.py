@@ -2,79 +2,36 @@
 Module for creating a dashboard displaying certain plots and tables used to determine
 if there are any interesting free agents to add to my fantasy baseball team.
 """
-import os
-import zipfile
-import json
-import asyncio
-from datetime import datetime
-
-import requests
-import matplotlib
-import matplotlib.figure
-import matplotlib.pyplot as plt
 import pandas as pd
 import panel as pn
 
-from plotting.base_plots.ratio_scatter import RatioScatterPlot
-
-matplotlib.use("agg")
+from dashboard import fantasy_data, fantasy_figures, fantasy_refresh
 
 pn.extension('tabulator')
 
 ## Constants #########################################################################
-POSITIONS = ['C', '1B', '2B', '3B', 'SS', 'OF', 'SP', 'RP']
+POSITIONS = fantasy_data.POSITIONS
 ACCENT = "teal"
 ## End Constants #####################################################################
 
 
-## Globals ###########################################################################
-df_dict = {pos: {
-                "df": None,
-                "freeze": 0
-                } for pos in POSITIONS}
-## End Globals ########################################################################
-
-
 ## Bound Functions ####################################################################
 # These are functions which will be bound to widgets which will provide the inputs
 # used as function parameters and provide ouputs that can be displayed in the dashboard
-async def get_plot(pos: str, date_range: str) -> matplotlib.figure:
+async def get_plot(pos: str, date_range: str) -> str:
     """
     Bound function which takes the position and date_range from their respective widgets
-    and created a MatplotLib plot that will be displayed in the panel.
+    and returns the RatioScatterPlot for them, as SVG markup.
 
-    Uses a RatioScatterPlot to create the figure.
+    Figures are pre-rendered once per data load and shared by every session, see
+    dashboard/fantasy_figures.py.
 
     :param str pos: The player position for which to make the plot.
     :param str date_range: The date range being used (i.e. week, month, season)
-    :return matplotlib.figure: The matplotlib figure which will be displayed.
+    :return str: The SVG markup of the figure which will be displayed.
     """
-    if pos in {'1B', '2B', '3B', 'SS', 'C', 'OF'}:
-        x = 'xwOBA'
-        y = 'wRC+'
-    else:
-        x = 'K-BB%'
-        y = 'Stuff+'
-
-    df = pd.read_csv(f"data/fantasy_data_{pos}.csv")
-    df = df[df['term'] == date_range.split(' ')[-1].lower()]
-
-    plot = RatioScatterPlot(df, filename='',
-                            y_column=y, x_column=x,
-                            title=f'Interesting Free Agents - {pos}',
-                            y_label=y, x_label=x,
-                            quadrant_labels=None,
-                            invert_x=False,
-                            #size=(10, 15),
-                            break_even_line=False,
-                            scale='player',
-                            data_disclaimer='fangraphs',
-                            sport='baseball',
-                            fantasy_mode=True)
-
-    fig = plot.make_plot(dashboard=True)
-    plt.close(fig)  # CLOSE THE FIGURE TO AVOID MEMORY LEAKS!
-    return fig
+    await fantasy_data.wait_for_data()
+    return await fantasy_figures.get_figure(pos, fantasy_data.term_from_label(date_range))
 
 
 async def get_freeze_rows(pos: str) -> list[int]:
@@ -85,10 +42,8 @@ async def get_freeze_rows(pos: str) -> list[int]:
     :param str pos: The player positions we're checking for.
     :return list[int]: A list of integers corresponding to the row indices which should be frozen.
     """
-    df = pd.read_csv(f'data/fantasy_data_{pos}.csv')
-    num_freeze = len(df[df['on_team']].drop_duplicates(['Name']))
-    del df
-    return list(range(num_freeze))
+    await fantasy_data.wait_for_data()
+    return fantasy_data.get_freeze_rows(pos)
 
 
 async def get_df(pos: str, date_range: str) -> pd.DataFrame:
@@ -100,143 +55,87 @@ async def get_df(pos: str, date_range: str) -> pd.DataFrame:
     :param str date_range: The desired date range
     :return pd.DataFrame: DataFrame containing statistics with the desired conditions applied.
     """
-    df = pd.read_csv(f'data/fantasy_data_{pos}.csv')
-    try:
-        df = df[df['term'] == date_range.lower()]
-    except TypeError as e:
-        print(f"Failed getting df for {pos}")
-        print(f"df_dict: {df_dict}")
-        raise e
-
-    # Delete columns we don't want to see displayed on the dashboard
-    del df['on_team']
-    del df['Team']
-    del df['term']
-
-    df['Name'] = df.apply(lambda row: f"{row['Name'][0]}. {' '.join(row['Name'].split(' ')[1:])}",
-                          axis=1)
-
-    # Make sure the number of freeze rows is updated properly before returning the df
-    task = asyncio.create_task(get_freeze_rows(pos))
-    await task
-
-    return df
+    await fantasy_data.wait_for_data()
+    # Already filtered, with the internal columns dropped and names abbreviated
+    return fantasy_data.get_table(pos, fantasy_data.term_from_label(date_range))
 ## End Bound Functions ################################################################
 
-@pn.cache
-def load_data() -> None:
+## App Layout #########################################################################
+def create_app() -> pn.template.FastListTemplate:
     """
-    Function to be run at the initialization of the dashboard.
+    Creates the widgets and panes for a dashboard session, bound to the functions above.
 
-    Downloads all of the relevant CSV data files from GitHub, where they are stored as build
-    artifact for a build that runs daily and scrapes the relevant statistics,
+    The initial position and date range can be set with the 'pos' and 'range' query arguments,
+    e.g. '?pos=SS&range=Month'.
 
-    Expects GitHub PAT with proper permissions to be available as an environment variable under
-    'GITHUB_PAT'.
-
-    :raises ValueError: Raises a ValueError if an artifact with today's timestamp is not found.
+    :return pn.template.FastListTemplate: The dashboard layout.
     """
-
-    url = "https://api.github.com/repos/hockey-stats/chart-plotting/actions/artifacts"
-    payload = {}
-    headers = {
-        'Authorization': f'Bearer {os.environ["GITHUB_PAT"]}'
-    }
-    output_filename = 'data.zip'
-
-    # Returns a list of every available artifact for the repo
-    response = requests.request("GET", url, headers=headers, data=payload, timeout=10)
-    response_body = json.loads(response.text)
-
-    # Get today's date in YYYY-MM-DD format, to compare to the returned artifacts
-    today = datetime.today().strftime('%Y-%m-%d')
-
-    for artifact in response_body['artifacts']:
-        if artifact['name'] == 'dashboard-fa-data':
-            artifact_creation_date = artifact['created_at'].split('T')[0]
-            if today == artifact_creation_date:
-                download_url = artifact['archive_download_url']
-                break
-                # Breaks when we find an artifact with the correct name and today's date
-    else:
-        # Raise an error if no such artifact as found
-        raise ValueError(f"Data for {today} not found, exiting....")
-
-    # Downloads the artifact as a zip file...
-    dl_response = requests.request("GET", download_url, headers=headers, data=payload, timeout=20)
-    with open(output_filename, 'wb') as fo:
-        fo.write(dl_response.content)
-
-    # ... and unzips
-    with zipfile.ZipFile(output_filename, 'r') as zip_ref:
-        zip_ref.extractall('data')
-
-    # The unzipped contents will be one DataFrame for each position
-    for pos in POSITIONS:
-        # Read the raw CSV into a DataFrame
-        df = pd.read_csv(f'data/fantasy_data_{pos}.csv')
-
-        # Determine the number of players on team, for rows to freeze
-        t_df = df[df['on_team']]
-        num_freeze = len(set(t_df['Name']))
-        df_dict[pos]['df'] = df
-        df_dict[pos]['freeze'] = list(range(0, num_freeze))
-
-    print(f"Data loaded for {artifact_creation_date}")
+    session_args = pn.state.session_args or {}
+    initial_pos = session_args.get('pos', [b'C'])[0].decode()
+    initial_range = session_args.get('range', [b'Week'])[0].decode()
+
+    # Initialize the select widget for choosing the player position
+    position_widget = pn.widgets.Select(
+                          description="Select a position",
+                          name="Position",
+                          options=POSITIONS,
+                          value=initial_pos if initial_pos in POSITIONS else POSITIONS[0],
+                          width=65
+                      )
+
+    # Initialize the radio button widget for choosing the date range
+    date_range_options = ['Week', 'Month', 'Season']
+    date_range_widget = pn.widgets.RadioButtonGroup(
+                            description='Select a date range over which to display data.',
+                            options = date_range_options,
+                            value=initial_range if initial_range in date_range_options else 'Week',
+                            button_style='outline',
+                            button_type='primary',
+                            orientation='vertical',
+                            width=65,
+                        )
+
+    # Binding functions to their appropriate widgets
+    figure = pn.bind(get_plot, pos=position_widget, date_range=date_range_widget)
+    rows_to_freeze = pn.bind(get_freeze_rows, pos=position_widget)
+    table = pn.bind(get_df, pos=position_widget, date_range=date_range_widget)
+
+    # Initialize the table widget which displays our statistics in a table
+    table_pane = pn.widgets.Tabulator(
+                                 table,
+                                 layout='fit_data_table',
+                                 show_index=False,
+                                 frozen_rows=rows_to_freeze,
+                                 theme='simple',
+                                 stylesheets=[":host .tabulator {font-size: 8px;}"]
+                             )
+
+    # Initialize the pane displaying our plot
+    plot_pane = pn.pane.SVG(
+        figure, fixed_aspect=True, height=350
+    )
+
+    # Add all of the above to a FastListTemplate
+    return pn.template.FastListTemplate(
+        title="Fantasy Free Agents of Interest",
+        sidebar=[position_widget, date_range_widget],
+        sidebar_width=70,
+        main=[pn.Row(table_pane, plot_pane)],
+        accent=ACCENT,
+        main_layout=None
+    )
+## End App Layout #####################################################################
 
 
 ## Main Script Body ###################################################################
 
-# Load today's data
-load_data()
-
-# Initialize the select widget for choosing the player position
-position_widget = pn.widgets.Select(
-                      description="Select a position",
-                      name="Position",
-                      options=['C', '1B', '2B', '3B', 'SS', 'OF', 'SP', 'RP'],
-                      width=65
-                  )
-
-# Initialize the radio button widget for choosing the date range
-date_range_widget = pn.widgets.RadioButtonGroup(
-                        description='Select a date range over which to display data.',
-                        options = ['Week', 'Month', 'Season'],
-                        value='Week',
-                        button_style='outline',
-                        button_type='primary',
-                        orientation='vertical',
-                        width=65,
-                    )
-
-# Binding functions to their appropriate widgets
-figure = pn.bind(get_plot, pos=position_widget, date_range=date_range_widget)
-rows_to_freeze = pn.bind(get_freeze_rows, pos=position_widget)
-table = pn.bind(get_df, pos=position_widget, date_range=date_range_widget)
-
-# Initialize the table widget which displays our statistics in a table
-table_pane = pn.widgets.Tabulator(
-                             table,
-                             layout='fit_data_table',
-                             show_index=False,
-                             frozen_rows=rows_to_freeze,
-                             theme='simple',
-                             stylesheets=[":host .tabulator {font-size: 8px;}"]
-                         )
-
-# Initialize the pane displaying our plot
-plot_pane = pn.pane.Matplotlib(
-    figure, format="svg", dpi=144, fixed_aspect=True, height=350
-)
-
-# Add all of the above to a FastListTemplate and make it servable
-pn.template.FastListTemplate(
-    title="Fantasy Free Agents of Interest",
-    sidebar=[position_widget, date_range_widget],
-    sidebar_width=70,
-    main=[pn.Row(table_pane, plot_pane)],
-    accent=ACCENT,
-    main_layout=None
-).servable()
+# Only when run with `panel serve`, so that the functions above can be imported on their own
+if __name__.startswith('bokeh'):
+    # Load the data in the background, and keep checking for new daily artifacts. Sessions
+    # opened before the first load wait for it, then every new load is swapped in live and
+    # starts rendering the figures for it.
+    fantasy_refresh.start_background_refresh(on_update=fantasy_figures.prerender)
+
+    create_app().servable()
 
 ## End Main Script Body ###############################################################
@@ -0,0 +1,147 @@
+"""
+Module for pre-rendering the scatter plots shown on the fantasy dashboard.
+
+There are only 8 positions x 3 date ranges worth of figures, and the data only changes once a day,
+so rather than building a RatioScatterPlot on every widget change (for every session), all of
+the figures are rendered to SVG once, in the background, as soon as the data is loaded. Widget
+callbacks then just return the cached markup, and every session shares the same renders.
+
+The cache is tied to the version (i.e. checksum) of the data artifact it was rendered from:
+loading a new artifact starts a new set of renders, and figures for the old one are never served
+again.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import matplotlib
+import matplotlib.pyplot as plt
+
+from dashboard import fantasy_data
+from plot_types.ratio_scatter import RatioScatterPlot
+from util import svg_export
+
+matplotlib.use("agg")
+
+## Constants #########################################################################
+# Resolution the figures are rendered at, which sets the resolution of the embedded logos
+DPI = 144
+# Renders are bound by the GIL and pyplot's global state (see `_pyplot_lock`), so more threads
+# wouldn't make them any faster, just keep them off the server's threads
+RENDER_THREADS = 1
+## End Constants #####################################################################
+
+
+## Globals ###########################################################################
+_executor = ThreadPoolExecutor(max_workers=RENDER_THREADS, thread_name_prefix='fantasy-figures')
+
+# pyplot keeps global state (e.g. the current figure, used when adding titles), so only one
+# figure can be built at a time in the process
+_pyplot_lock = threading.Lock()
+
+# Version of the data artifact the figures are rendered from, and a Future for each figure's
+# SVG markup keyed by (position, term). Replaced wholesale when new data is loaded.
+_generation = {
+    'version': None,
+    'figures': {}
+}
+_generation_lock = threading.Lock()
+## End Globals ########################################################################
+
+
+def render_figure(pos: str, term: str) -> str:
+    """
+    Creates the RatioScatterPlot for a position and term, and renders it to SVG.
+
+    :param str pos: The player position for which to make the plot.
+    :param str term: The date range being used (i.e. week, month, season).
+    :return str: The SVG markup of the figure.
+    """
+    x, y = fantasy_data.plot_axes(pos)
+    df = fantasy_data.get_plot_data(pos, term)
+
+    with _pyplot_lock:
+        plot = RatioScatterPlot(df, filename='',
+                                y_column=y, x_column=x,
+                                title=f'Interesting Free Agents - {pos}',
+                                y_label=y, x_label=x,
+                                quadrant_labels=None,
+                                invert_x=False,
+                                break_even_line=False,
+                                scale='player',
+                                data_disclaimer='fangraphs',
+                                sport='baseball',
+                                fantasy_mode=True)
+
+        fig = plot.make_plot(dashboard=True)
+        # Each player's team logo is embedded once per team, rather than once per player
+        svg = svg_export.figure_to_svg(fig, dpi=DPI)
+        plt.close(fig)  # CLOSE THE FIGURE TO AVOID MEMORY LEAKS!
+
+    return svg
+
+
+def prerender(version: str) -> None:
+    """
+    Starts rendering every figure in the background for the given data, unless that's already
+    been done. Should be called whenever new data is loaded into the store.
+
+    :param str version: Version of the data, e.g. the data artifact's digest.
+    """
+    with _generation_lock:
+        if _generation['version'] == version:
+            return
+
+        # Renders for the old data that haven't started yet would never be served
+        for future in _generation['figures'].values():
+            future.cancel()
+
+        _generation['version'] = version
+        _generation['figures'] = {
+            (pos, term): _executor.submit(render_figure, pos, term)
+            for pos in fantasy_data.POSITIONS for term in fantasy_data.TERMS
+        }
+
+
+def figure_future(pos: str, term: str) -> Future:
+    """
+    Returns the Future for the figure of a position and term. Figures which aren't rendered or
+    being rendered yet are submitted to the render pool, and requests for a figure that's already
+    in flight share its Future, so each figure is only ever rendered once per data load. Renders
+    that failed, or were cancelled, are submitted again.
+
+    :param str pos: The player position.
+    :param str term: One of 'week', 'month' or 'season'.
+    :return Future: Future for the SVG markup of the figure.
+    """
+    with _generation_lock:
+        future = _generation['figures'].get((pos, term))
+        # Either nothing was pre-rendered (e.g. the data was loaded without calling `prerender`),
+        # or the render didn't produce a figure, which would otherwise be served until new data
+        if future is None or future.cancelled() or \
+                (future.done() and future.exception() is not None):
+            future = _executor.submit(render_figure, pos, term)
+            _generation['figures'][(pos, term)] = future
+    return future
+
+
+async def get_figure(pos: str, term: str) -> str:
+    """
+    Returns the SVG markup of the figure for a position and term. If its render is still in
+    progress, this waits for it without blocking the event loop.
+
+    If the render is cancelled while waiting (new data was loaded) or fails, the figure is
+    fetched once more, which gets the render for the new data or tries the render again.
+
+    :param str pos: The player position.
+    :param str term: One of 'week', 'month' or 'season'.
+    :return str: The SVG markup.
+    """
+    try:
+        return await asyncio.wrap_future(figure_future(pos, term))
+    except (Exception, asyncio.CancelledError):
+        # This request itself being cancelled (e.g. its session closing) is passed on as usual
+        if asyncio.current_task().cancelling():
+            raise
+    return await asyncio.wrap_future(figure_future(pos, term))
@@ -0,0 +1,186 @@
+"""
+Module for keeping the fantasy dashboard's data up to date in the background.
+
+The data is published once a day as a build artifact of the repo ('dashboard-fa-data'), a zip
+with one CSV per position. A background thread polls the GitHub API for the newest artifact and,
+when its checksum differs from the one currently loaded, downloads the zip into memory, verifies
+it, and swaps the parsed data into the store (dashboard/fantasy_data.py). Nothing is written to
+disk, and the server keeps serving the previous data until the new data is fully loaded.
+
+The API base URL can be pointed somewhere else (e.g. a local stand-in server for testing) with
+the FANTASY_API_URL environment variable. A GitHub PAT with access to the repo's artifacts is read
+from GITHUB_PAT, if set.
+"""
+
+import io
+import os
+import time
+import hashlib
+import zipfile
+import threading
+
+import requests
+
+from dashboard import fantasy_data
+
+## Constants #########################################################################
+DEFAULT_API_URL = 'https://api.github.com/repos/hockey-stats/chart-plotting'
+ARTIFACT_NAME = 'dashboard-fa-data'
+
+# How often to check for a new artifact once data is loaded, and how soon to retry before then
+REFRESH_INTERVAL_SECONDS = 15 * 60
+RETRY_INTERVAL_SECONDS = 60
+
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+## End Constants #####################################################################
+
+
+## Globals ###########################################################################
+# Checksum and creation date of the artifact currently loaded in the store
+_loaded = {
+    'digest': None,
+    'date': None
+}
+_refresh_lock = threading.Lock()
+_refresh_thread = None
+## End Globals ########################################################################
+
+
+def api_url() -> str:
+    """
+    Returns the base URL of the repo in the GitHub API, or of whatever stands in for it.
+    """
+    return os.environ.get('FANTASY_API_URL', DEFAULT_API_URL).rstrip('/')
+
+
+def auth_headers() -> dict:
+    """
+    Returns the authorization headers for the API, if a GitHub PAT is available.
+    """
+    token = os.environ.get('GITHUB_PAT')
+    return {'Authorization': f'Bearer {token}'} if token else {}
+
+
+def artifact_digest(artifact: dict) -> str:
+    """
+    Returns the checksum identifying the contents of an artifact. Artifacts uploaded before GitHub
+    started reporting digests fall back to their ID.
+
+    :param dict artifact: Artifact as returned by the API.
+    :return str: e.g. 'sha256:...' or 'id:...'.
+    """
+    return artifact.get('digest') or f"id:{artifact['id']}"
+
+
+def find_latest_artifact(session: requests.Session, base_url: str) -> dict | None:
+    """
+    Returns the most recently created, unexpired data artifact, or None if there isn't one.
+
+    :param requests.Session session: Session used for the request.
+    :param str base_url: Base URL of the repo in the API.
+    :return dict: The artifact as returned by the API.
+    """
+    response = session.get(f'{base_url}/actions/artifacts',
+                           params={'name': ARTIFACT_NAME, 'per_page': 100}, timeout=10)
+    response.raise_for_status()
+
+    artifacts = [artifact for artifact in response.json()['artifacts']
+                 if artifact['name'] == ARTIFACT_NAME and not artifact.get('expired', False)]
+    if not artifacts:
+        return None
+    return max(artifacts, key=lambda artifact: artifact['created_at'])
+
+
+def download_archive(session: requests.Session, artifact: dict) -> zipfile.ZipFile:
+    """
+    Streams an artifact's zip into memory, verifying it against the artifact's digest.
+
+    :param requests.Session session: Session used for the request.
+    :param dict artifact: Artifact as returned by the API.
+    :raises ValueError: If the download doesn't match the artifact's sha256 digest.
+    :return zipfile.ZipFile: The archive, backed by an in-memory buffer.
+    """
+    buffer = io.BytesIO()
+    checksum = hashlib.sha256()
+    with session.get(artifact['archive_download_url'], stream=True, timeout=20) as response:
+        response.raise_for_status()
+        for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+            buffer.write(chunk)
+            checksum.update(chunk)
+
+    digest = artifact.get('digest')
+    if digest and digest.startswith('sha256:') and digest != f'sha256:{checksum.hexdigest()}':
+        raise ValueError(f"Download of artifact {artifact['id']} doesn't match its digest")
+
+    buffer.seek(0)
+    return zipfile.ZipFile(buffer)
+
+
+def refresh(base_url: str = None, on_update=None) -> bool:
+    """
+    Loads the newest data artifact into the store, unless it's the one already loaded.
+
+    :param str base_url: Base URL of the repo in the API, defaults to `api_url()`.
+    :param callable on_update: Called with the new artifact's digest after the store is swapped,
+                               e.g. to start rendering figures for the new data.
+    :return bool: True if new data was loaded.
+    """
+    base_url = base_url or api_url()
+
+    # Only one refresh at a time, so an artifact is never downloaded twice
+    with _refresh_lock, requests.Session() as session:
+        session.headers.update(auth_headers())
+
+        artifact = find_latest_artifact(session, base_url)
+        if artifact is None:
+            print(f"No '{ARTIFACT_NAME}' artifact available yet")
+            return False
+
+        digest = artifact_digest(artifact)
+        if digest == _loaded['digest']:
+            return False
+
+        with download_archive(session, artifact) as archive:
+            fantasy_data.load_store_from_zip(archive)
+
+        _loaded['digest'] = digest
+        _loaded['date'] = artifact['created_at'].split('T')[0]
+
+    print(f"Data loaded for {_loaded['date']} ({digest})")
+    if on_update is not None:
+        on_update(digest)
+    return True
+
+
+def _refresh_loop(interval: float, on_update) -> None:
+    """
+    Body of the refresh thread. Failures are logged and retried, since the artifact for the day
+    may simply not be uploaded yet.
+    """
+    while True:
+        try:
+            refresh(on_update=on_update)
+        except Exception as e:  # Keep the thread alive through network or API errors
+            print(f"Refreshing fantasy data failed: {e!r}")
+
+        time.sleep(interval if fantasy_data.is_loaded() else min(interval, RETRY_INTERVAL_SECONDS))
+
+
+def start_background_refresh(interval: float = REFRESH_INTERVAL_SECONDS,
+                             on_update=None) -> threading.Thread:
+    """
+    Starts the thread which polls for new artifacts, if it isn't running already. The first
+    refresh happens right away.
+
+    :param float interval: Seconds between checks for a new artifact.
+    :param callable on_update: Passed to `refresh`.
+    :return threading.Thread: The refresh thread.
+    """
+    global _refresh_thread
+
+    with _refresh_lock:
+        if _refresh_thread is None or not _refresh_thread.is_alive():
+            _refresh_thread = threading.Thread(target=_refresh_loop, args=(interval, on_update),
+                                               name='fantasy-refresh', daemon=True)
+            _refresh_thread.start()
+    return _refresh_thread
@@ -11,14 +11,20 @@ The report will consist of many plots assembed into a multi-plot, including:
 
 from datetime import datetime
 import argparse
-import polars as pl
-import pyhockey as ph
 
-from plot_types.ratio_scatter import RatioScatterPlot
-from plot_types.mirrored_bar import MirroredBarPlot
-from plot_types.scoreboard import ScoreBoardPlot
-from plot_types.multiplot import MultiPlot
+from util import hockey_data, plot_timing
 from util.team_maps import team_full_names
+from util.lazy_import import lazy_import
+
+pl = lazy_import('polars')
+ph = lazy_import('pyhockey')
+
+# The only columns of skater_games and goalie_games the report uses, and so the only ones fetched
+SKATER_GAME_COLUMNS = ['gameID', 'gameDate', 'name', 'team', 'position', 'situation', 'iceTime',
+                       'goals', 'primaryAssists', 'secondaryAssists', 'individualxGoals',
+                       'xGoalsFor', 'xGoalsAgainst']
+GOALIE_GAME_COLUMNS = ['gameID', 'name', 'team', 'situation', 'iceTime', 'goalsAgainst',
+                       'xGoalsAgainst']
 
 
 def make_xg_ratio_plot(skater_df):
@@ -26,6 +32,8 @@ def make_xg_ratio_plot(skater_df):
     Function for creating scatter plot showing 5v5 on-ice xG ratios.
     :param DataFrame skater_df: DataFrame containing information for all skaters in the game.
     """
+    from plot_types.ratio_scatter import RatioScatterPlot
+
     # DataFrame contains info for all states, so filter to 5v5
     df = skater_df.filter(pl.col('situation') == 'ev')
 
@@ -54,6 +62,8 @@ def make_icetime_plot(skater_df):
         name | team | position | es_toi | pp_toi | pk_toi
     :param DataFrame skater_df: DataFrame containing information for all skaters in the game.
     """
+    from plot_types.mirrored_bar import MirroredBarPlot
+
     # Pivot skater_df to have one df showing icetime broken down by situation
     icetime_df = skater_df.pivot('situation', index=['name', 'team', 'position'], values='iceTime')
     teams = list(set(icetime_df['team']))
@@ -107,6 +117,8 @@ def make_scoreboard_plot(df, g_df):
     """
     Draw scoreboard plot based on skater/goalie dataframes.
     """
+    from plot_types.scoreboard import ScoreBoardPlot
+
     plot = ScoreBoardPlot(filename='', skater_df=df, goalie_df=g_df, data_disclaimer=None)
     return plot
 
@@ -116,6 +128,8 @@ def assemble_multiplot(icetime, xg_scatter, scoreboard, team_a, team_b, date, fi
     Function which takes the various plots which constitute the game report and assembles them
     into a single multiplot.
     """
+    from plot_types.multiplot import MultiPlot
+
     arrangement = {
         "dimensions": (2, 2),
         "plots": [
@@ -180,8 +194,11 @@ def main(game_id, filename, season):
     and create the Game Report plot.
     """
 
-    skater_df = ph.skater_games(season=season).filter(pl.col('gameID') == game_id)
-    goalie_df = ph.goalie_games(season=season).filter(pl.col('gameID') == game_id)
+    with plot_timing.phase('data_prep'):
+        skater_df = hockey_data.fetch(ph, 'skater_games', SKATER_GAME_COLUMNS, season=season)\
+            .filter(pl.col('gameID') == game_id)
+        goalie_df = hockey_data.fetch(ph, 'goalie_games', GOALIE_GAME_COLUMNS, season=season)\
+            .filter(pl.col('gameID') == game_id)
 
     date = datetime.strftime(skater_df['gameDate'][0], '%d-%m-%Y')
 
@@ -207,6 +224,12 @@ if __name__ == '__main__':
                         default=datetime.now().year - 1 if datetime.now().month < 10 \
                                 else datetime.now().year,
                         help='Season for which we pull data')
+    parser.add_argument('--timing', nargs='?', const='stderr', default=None,
+                        help='Write how long each phase of the render takes as JSON lines, to '\
+                             'stderr or to the given file.')
     args = parser.parse_args()
 
+    if args.timing:
+        plot_timing.enable(args.timing)
+
     main(args.game_id, args.filename, args.season)
@@ -4,11 +4,17 @@ Module for generate sequential bar chart showing goalie GSaX on a game-by-game b
 
 import argparse
 from datetime import datetime
-import polars as pl
-import pyhockey as ph
 
-from plot_types.sequential_bar import SequentialBarPlot
+from util import hockey_data
+from util.render_cache import render_cached
 from util.team_maps import team_full_names
+from util.lazy_import import lazy_import
+
+pl = lazy_import('polars')
+ph = lazy_import('pyhockey')
+
+# The only columns of goalie_games the plot uses, and so the only ones fetched
+GOALIE_GAME_COLUMNS = ['gameID', 'gameDate', 'name', 'xGoalsAgainst', 'goalsAgainst']
 
 
 def main(team: str, season: int) -> None:
@@ -18,8 +24,10 @@ def main(team: str, season: int) -> None:
         team (str): Team to generate plot for
         season (int): Season for which to gather data
     """
+    from plot_types.sequential_bar import SequentialBarPlot
 
-    df = ph.goalie_games(season=season, team=team, situation='all')
+    df = hockey_data.fetch(ph, 'goalie_games', GOALIE_GAME_COLUMNS, season=season, team=team,
+                           situation='all')
 
     df = df.sort(by=pl.col('gameDate'))
 
@@ -42,21 +50,21 @@ def main(team: str, season: int) -> None:
 
     team_name = team_full_names[team]
 
-    gsax_plot = SequentialBarPlot(df=df,
-                                  filename=f'{team}_gsax.png',
-                                  x_column='gameNumber',
-                                  y_column='goalsSavedAboveExpected',
-                                  selector_column='name',
-                                  team=team,
-                                  y_max=6,
-                                  x_label='Game #',
-                                  y_label='Goals Saved Above Expected',
-                                  title=f'{team_name} - Goals Saved Above Expected',
-                                  subtitle='Goalie performances for each game so far this season',
-                                  data_disclaimer='nst')
-
-    gsax_plot.make_plot()
-
+    render_cached(SequentialBarPlot,
+                  chart_type='goalie_gsax_bars',
+                  df=df,
+                  filename=f'{team}_gsax.png',
+                  template=f'goalie_gsax_{season}',
+                  x_column='gameNumber',
+                  y_column='goalsSavedAboveExpected',
+                  selector_column='name',
+                  team=team,
+                  y_max=6,
+                  x_label='Game #',
+                  y_label='Goals Saved Above Expected',
+                  title=f'{team_name} - Goals Saved Above Expected',
+                  subtitle='Goalie performances for each game so far this season',
+                  data_disclaimer='nst')
 
 
 if __name__ == '__main__':
@@ -2,19 +2,28 @@
 Module for plotting goalie GSAX against xG workload.
 """
 
+from __future__ import annotations
+
 import argparse
 from datetime import datetime
-import numpy as np
-import pyhockey as ph
-import polars as pl
 
-from plot_types.ratio_scatter import RatioScatterPlot
+from util import hockey_data
 from util.team_maps import team_full_names
+from util.lazy_import import lazy_import
+
+np = lazy_import('numpy')
+ph = lazy_import('pyhockey')
+pl = lazy_import('polars')
+
+# The only columns of goalie_seasons the plot uses, and so the only ones fetched
+GOALIE_GSAX_COLUMNS = ['name', 'team', 'xGoals', 'goals']
 
 
 def construct_plot(df: pl.DataFrame, team: str, output_filename: str, plot_title: str,
                    subtitle: str) -> None:
 
+    from plot_types.ratio_scatter import RatioScatterPlot
+
     df = df.with_columns(
         (pl.col('xGoals') - pl.col('goals')).alias('GSAX')
     )
@@ -48,8 +57,8 @@ def main(team: str, min_xg: int, situation: str, season: int) -> None:
         situation (str): One of '5on5', '4on5', 5on4', 'other', or 'all'.
         season (int): The season for which to plot data.
     """
-    df = ph.goalie_seasons(season=season, situation=situation, team=team)\
-            [['name', 'team', 'xGoals', 'goals']]
+    df = hockey_data.fetch(ph, 'goalie_seasons', GOALIE_GSAX_COLUMNS, season=season,
+                           situation=situation, team=team)
 
     # If min_xg provided is -1 (i.e. default), calculate to be 30% of max value
     if min_xg == -1:
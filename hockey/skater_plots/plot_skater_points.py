@@ -4,19 +4,29 @@ Module for plotting points against ice-time for skaters.
 
 import argparse
 from datetime import datetime
-import numpy as np
-import pyhockey as ph
-import polars as pl
 
-from plot_types.ratio_scatter import RatioScatterPlot
+from util import hockey_data
 from util.team_maps import team_full_names
+from util.lazy_import import lazy_import
 
+np = lazy_import('numpy')
+ph = lazy_import('pyhockey')
+pl = lazy_import('polars')
 
-def construct_plot(df, team, output_filename, plot_title, subtitle):
+# The only columns of skater_seasons the plots use, and so the only ones fetched
+SKATER_POINTS_COLUMNS = ['season', 'name', 'team', 'position', 'iceTime', 'averageIceTime',
+                         'pointsPerHour']
+
+
+def construct_plot(df, team, output_filename, plot_title, subtitle, template=None):
     """
     Given the dataframe, create the skater points ratio plot with the given
     output filename.
+
+    :param str template: If given, name under which the plot's static scaffold is cached, so that
+                         plots for other teams can reuse it.
     """
+    from plot_types.ratio_scatter import RatioScatterPlot
 
     # Calculate the percentiles for points per hour
     pph_percentiles = []
@@ -40,7 +50,8 @@ def construct_plot(df, team, output_filename, plot_title, subtitle):
                                 quadrant_labels=['OPPORTUNITY', 'PRODUCTION'],
                                 plot_x_mean=False,
                                 plot_y_mean=False,
-                                y_min_max=(0, max_pph))
+                                y_min_max=(0, max_pph),
+                                template=template)
     pph_plot.make_plot()
 
 
@@ -48,8 +59,8 @@ def main(team, min_icetime_minutes, situation, season):
     """
     Main function to create the plot and save as a png file.
     """
-    df = ph.skater_seasons(season=season, situation=situation, min_icetime=min_icetime_minutes)
-    df = df[['season', 'name', 'team', 'position', 'iceTime', 'averageIceTime', 'pointsPerHour']]
+    df = hockey_data.fetch(ph, 'skater_seasons', SKATER_POINTS_COLUMNS, season=season,
+                           situation=situation, min_icetime=min_icetime_minutes)
 
     # Create separate DataFrames for forwards and defensemen
     df_f = df.filter(pl.col('position').is_in({'C', 'R', 'L'})) 
@@ -64,12 +75,14 @@ def main(team, min_icetime_minutes, situation, season):
 
     construct_plot(df_f, team,
                    output_filename=f'{team}_F_{situation}_scoring_rates.png',
+                   template=f'skater_points_F_{situation}_{season}',
                    plot_title=f'{display_team} - Forward Scoring Rates ',
                    subtitle=f'{situation.replace("on", "v")}, minimum {min_icetime_minutes} minutes, '\
 													  f'logo opacity represents total icetime')
 
     construct_plot(df_d, team,
                    output_filename=f'{team}_D_{situation}_scoring_rates.png',
+                   template=f'skater_points_D_{situation}_{season}',
                    plot_title=f'{display_team} Defenseman Scoring Rates ({situation.replace("on", "v")})',
                    subtitle=f'min. {min_icetime_minutes} minutes)')
 
@@ -4,17 +4,28 @@ Script used to plot on-ice ratios for individual players.
 
 import argparse
 from datetime import datetime
-import pyhockey as ph
 
-from plot_types.ratio_scatter import RatioScatterPlot
+from util import hockey_data
+from util.render_cache import render_cached
 from util.team_maps import team_full_names
+from util.lazy_import import lazy_import
+
+ph = lazy_import('pyhockey')
+
+# The only columns that affect the plots, and so the only ones fetched, also used as the render
+# cache key
+SKATER_RATIO_COLUMNS = ['name', 'team', 'iceTime', 'xGoalsForPerHour', 'xGoalsAgainstPerHour',
+                        'goalsForPerHour', 'goalsAgainstPerHour']
+
 
 def main(team, min_icetime, season):
     """
     Main function to create the plot and save as a png file.
     """
+    from plot_types.ratio_scatter import RatioScatterPlot
 
-    base_df = ph.skater_seasons(season=season, situation='5on5', min_icetime=min_icetime)
+    base_df = hockey_data.fetch(ph, 'skater_seasons', SKATER_RATIO_COLUMNS, season=season,
+                                situation='5on5', min_icetime=min_icetime)
 
     # Calculate league averages for plot
     league_avg_xg = base_df['xGoalsForPerHour'].mean()
@@ -26,42 +37,48 @@ def main(team, min_icetime, season):
     else:
         display_team = team_full_names[team]
 
-    xg_plot = RatioScatterPlot(dataframe=base_df,
-                               filename=f'{team}_skater_xg_ratios.png',
-                               x_column='xGoalsForPerHour', y_column='xGoalsAgainstPerHour',
-                               title=f'{display_team} - Expected Goal Rates',
-                               subtitle=f'5v5, '\
-                                        f'minimum {min_icetime} minutes, logo opacity'\
-                                         ' represents total icetime',
-                               scale='player', x_label='Expected Goals For per hour',
-                               y_label='Expected Goals Against per hour (inverted)',
-                               team=team,
-                               ratio_lines=True,
-                               invert_y=True,
-                               plot_x_mean=False,
-                               plot_y_mean=False,
-                               scale_to_extreme=True,
-                               plot_league_average=league_avg_xg)
-    xg_plot.make_plot()
+    render_cached(RatioScatterPlot,
+                  chart_type='skater_xg_ratios',
+                  hash_columns=SKATER_RATIO_COLUMNS,
+                  dataframe=base_df,
+                  filename=f'{team}_skater_xg_ratios.png',
+                  template=f'skater_xg_ratios_{season}',
+                  x_column='xGoalsForPerHour', y_column='xGoalsAgainstPerHour',
+                  title=f'{display_team} - Expected Goal Rates',
+                  subtitle=f'5v5, '\
+                           f'minimum {min_icetime} minutes, logo opacity'\
+                            ' represents total icetime',
+                  scale='player', x_label='Expected Goals For per hour',
+                  y_label='Expected Goals Against per hour (inverted)',
+                  team=team,
+                  ratio_lines=True,
+                  invert_y=True,
+                  plot_x_mean=False,
+                  plot_y_mean=False,
+                  scale_to_extreme=True,
+                  plot_league_average=league_avg_xg)
 
-    g_plot = RatioScatterPlot(dataframe=base_df,
-                              filename=f'{team}_skater_g_ratios.png',
-                              x_column='goalsForPerHour',
-                              y_column='goalsAgainstPerHour',
-                              title=f'{team} Player Goal Rates',
-                              subtitle=f'5v5, min. {min_icetime} minutes',
-                              scale='player',
-                              x_label='Goals For per hour',
-                              y_label='Goals Against per hour (inverted)',
-                              team=team,
-                              show_league_context=True,
-                              ratio_lines=True,
-                              invert_y=True,
-                              plot_x_mean=False,
-                              plot_y_mean=False,
-                              scale_to_extreme=True,
-                              plot_league_average=league_avg_g)
-    g_plot.make_plot()
+    render_cached(RatioScatterPlot,
+                  chart_type='skater_g_ratios',
+                  hash_columns=SKATER_RATIO_COLUMNS,
+                  dataframe=base_df,
+                  filename=f'{team}_skater_g_ratios.png',
+                  template=f'skater_g_ratios_{season}',
+                  x_column='goalsForPerHour',
+                  y_column='goalsAgainstPerHour',
+                  title=f'{team} Player Goal Rates',
+                  subtitle=f'5v5, min. {min_icetime} minutes',
+                  scale='player',
+                  x_label='Goals For per hour',
+                  y_label='Goals Against per hour (inverted)',
+                  team=team,
+                  show_league_context=True,
+                  ratio_lines=True,
+                  invert_y=True,
+                  plot_x_mean=False,
+                  plot_y_mean=False,
+                  scale_to_extreme=True,
+                  plot_league_average=league_avg_g)
 
 
 if __name__ == '__main__':
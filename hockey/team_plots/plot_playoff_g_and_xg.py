@@ -3,16 +3,17 @@ Script used to plot things like xG%, Corsi%, and G% at the team-wide level on a
 """
 
 import os
-import pandas as pd
 
-from plot_types.ratio_scatter import RatioScatterPlot
-from plot_types.multiplot import MultiPlot
+from util.lazy_import import lazy_import
+
+pd = lazy_import('pandas')
 
 
 def make_plots(base_df):
     """
     Given DataFrame, create ratio scatter plots for 5on5 xG and G, and save as image files.
     """
+    from plot_types.ratio_scatter import RatioScatterPlot
 
     # Calculate league averages for plot
     league_avg_xg = base_df['xGoalsForPerHour'].mean()
@@ -50,6 +51,7 @@ def assemble_multiplot(xg_plot, g_plot):
     :param Plot xg_plot: Scatter plot for expected goals.
     :param Plot g_plot: Scatter plot for actual goals.
     """
+    from plot_types.multiplot import MultiPlot
 
     arrangement = {
         "dimensions": (1, 2),
@@ -1,10 +1,16 @@
+from __future__ import annotations
+
 import argparse
 from datetime import datetime
 
-import pyhockey as ph
-import polars as pl
+from util import hockey_data
+from util.lazy_import import lazy_import
+
+ph = lazy_import('pyhockey')
+pl = lazy_import('polars')
 
-from plot_types.animated_rolling_average import AnimatedRollingAveragePlot
+# The only columns of team_games the plot uses, and so the only ones fetched
+XG_ROLLING_COLUMNS = ['team', 'gameID', 'xGoalsShare']
 
 
 def get_xg_data(season: int, window: int, num_games: int) -> pl.DataFrame:
@@ -18,7 +24,8 @@ def get_xg_data(season: int, window: int, num_games: int) -> pl.DataFrame:
     :param int num_games: Number of games to include in dataset (i.e. last 'n' games)
     :return pl.DataFrame: Results of the query + rolling data
     """
-    df = ph.team_games(season=season, situation='5on5')
+    df = hockey_data.fetch(ph, 'team_games', XG_ROLLING_COLUMNS, season=season,
+                           situation='5on5')
 
     output_dfs = []
 
@@ -44,6 +51,7 @@ def xg_by_division_multiplot(season: int, div: int, window: int, num_games: int)
     Plot each teams rolling 10-game average, in a 2x2 plot where each plot shows
     all the teams in one division.
     """
+    from plot_types.animated_rolling_average import AnimatedRollingAveragePlot
 
     divisions = {
     0: {'teams': {'TOR', 'TBL', 'BOS', 'DET', 'MTL', 'OTT', 'FLA', 'BUF'},
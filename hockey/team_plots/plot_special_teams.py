@@ -6,15 +6,21 @@ performance on special teams.
 import argparse
 from datetime import datetime
 
-import pyhockey as ph
+from util import hockey_data
+from util.lazy_import import lazy_import
 
-from plot_types.layered_lollipop import LayeredLollipopPlot
+ph = lazy_import('pyhockey')
+
+# The only columns of team_seasons the plots use, and so the only ones fetched
+SPECIAL_TEAMS_COLUMNS = ['team', 'goalsForPerHour', 'xGoalsForPerHour', 'goalsAgainstPerHour',
+                         'xGoalsAgainstPerHour']
 
 
 def make_5on4_plot(base_df):
     """
     Given DataFrame, create plot for 5on4.
     """
+    from plot_types.layered_lollipop import LayeredLollipopPlot
 
     pp_plot = LayeredLollipopPlot(dataframe=base_df, filename='5on4_offence.png',
                                   value_a='goalsForPerHour', value_b='xGoalsForPerHour',
@@ -31,6 +37,7 @@ def make_4on5_plot(base_df):
     """
     Given DataFrame, create plot for 4on5.
     """
+    from plot_types.layered_lollipop import LayeredLollipopPlot
 
     pk_plot = LayeredLollipopPlot(dataframe=base_df, filename='4on5_defence.png',
                                   value_a='goalsAgainstPerHour', value_b='xGoalsAgainstPerHour',
@@ -50,7 +57,8 @@ def main(situation, season):
     Main function which disambiguates and calls appropriate plotting function based on provided
     situation.
     """
-    base_df = ph.team_seasons(situation=situation, season=season)
+    base_df = hockey_data.fetch(ph, 'team_seasons', SPECIAL_TEAMS_COLUMNS, situation=situation,
+                                season=season)
 
     if situation == '5on4':
         make_5on4_plot(base_df)
@@ -5,15 +5,21 @@ Script used to plot things like xG%, Corsi%, and G% at the team-wide level on a
 from datetime import datetime
 import argparse
 
-import pyhockey as ph
+from util import hockey_data, plot_timing
+from util.lazy_import import lazy_import
 
-from plot_types.ratio_scatter import RatioScatterPlot
+ph = lazy_import('pyhockey')
+
+# The only columns of team_seasons the plots use, and so the only ones fetched
+TEAM_RATIO_COLUMNS = ['team', 'xGoalsForPerHour', 'xGoalsAgainstPerHour', 'goalsForPerHour',
+                      'goalsAgainstPerHour']
 
 
 def make_plots(base_df):
     """
     Given DataFrame, create ratio scatter plots for 5on5 xG and G, and save as image files.
     """
+    from plot_types.ratio_scatter import RatioScatterPlot
 
     # Calculate league averages for plot
     league_avg_xg = base_df['xGoalsForPerHour'].mean()
@@ -48,7 +54,9 @@ def main(situation, season):
     Main function which disambiguates and calls appropriate plotting function based on provided
     situation.
     """
-    base_df = ph.team_seasons(season=season, situation=situation)
+    with plot_timing.phase('data_prep'):
+        base_df = hockey_data.fetch(ph, 'team_seasons', TEAM_RATIO_COLUMNS, season=season,
+                                    situation=situation)
 
     make_plots(base_df)
 
@@ -61,7 +69,13 @@ if __name__ == '__main__':
                         default=datetime.now().year - 1 if datetime.now().month < 10 \
                                 else datetime.now().year,
                         help='Season for which we pull data')
+    parser.add_argument('--timing', nargs='?', const='stderr', default=None,
+                        help='Write how long each phase of the render takes as JSON lines, to '\
+                             'stderr or to the given file.')
 
     args = parser.parse_args()
 
+    if args.timing:
+        plot_timing.enable(args.timing)
+
     main(situation=args.situation, season=args.season)
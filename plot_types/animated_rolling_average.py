@@ -1,17 +1,40 @@
+import os
 import sys
-import polars as pl
+import multiprocessing
+from multiprocessing import shared_memory
 import matplotlib
 import matplotlib.patheffects as PathEffects
-from matplotlib.animation import FuncAnimation, FFMpegWriter
+import numpy as np
 
 from plot_types.plot import FancyAxes
 from plot_types.rolling_average import RollingAveragePlot
+from util.animation_writer import write_animation
 from util.font_dicts import label_text_params, tick_params
 
 
 if sys.platform == 'win32':
     matplotlib.rcParams['animation.ffmpeg_path'] = r'C:\\Users\\sohra\\Downloads\\ffmpeg-7.1.1-essentials_build\\ffmpeg-7.1.1-essentials_build\\bin\\ffmpeg.exe'
 
+# Resolution and speed of the saved animation
+ANIMATION_DPI = 300
+ANIMATION_FPS = 1
+
+# The plot being animated, inherited by each forked frame-rendering worker
+_frame_plot = None
+# Frames shared with the workers, as an array of (batch, slot, height, width, RGBA)
+_frame_slots = None
+
+
+def _init_frame_worker():
+    """ Renders the static background once in each worker process. """
+    _frame_plot.prepare_frames()
+
+
+def _render_frame(team, batch, slot):
+    """ Renders the frame highlighting `team` in a worker process, into its shared slot. """
+    _frame_plot.blit_frame(team)
+    _frame_slots[batch, slot] = np.asarray(_frame_plot.fig.canvas.buffer_rgba())
+
 
 class AnimatedRollingAveragePlot(RollingAveragePlot):
     """
@@ -33,7 +56,8 @@ class AnimatedRollingAveragePlot(RollingAveragePlot):
                  size=(10, 8),
                  add_team_logos=False,
                  multiline_key='',
-                 for_multiplot=True):
+                 for_multiplot=True,
+                 downsample_lines=False):
 
         super().__init__(filename=filename,
                          dataframe=dataframe,
@@ -49,61 +73,177 @@ class AnimatedRollingAveragePlot(RollingAveragePlot):
                          y_midpoint=y_midpoint,
                          add_team_logos=add_team_logos,
                          multiline_key=multiline_key,
-                         for_multiplot=for_multiplot)
+                         for_multiplot=for_multiplot,
+                         downsample_lines=downsample_lines)
 
         self.axis = self.fig.add_subplot(111, axes_class=FancyAxes, ar=2.0)
         self.axis.spines[['bottom', 'left', 'right', 'top']].set_visible(False)
         #plt.axis('off')
 
-    def make_plot_gif(self):
+        # Line and logo artists for each team, and the rendered background they're blitted onto
+        self.lines = {}
+        self.logos = {}
+        self.background = None
+
+    def make_plot_gif(self, workers=None):
+        """
+        Generates one frame per team, each highlighting that team, and saves them as an animation
+        named after `self.filename` (a GIF for .gif filenames, otherwise an mp4 if ffmpeg is
+        available).
+
+        The buffers are streamed to the encoder in order, without any intermediate files.
+
+        :param int workers: Number of worker processes, defaults to the CPU count.
+        :return str: The filename of the saved animation.
         """
-        Generates each frame of the plot and saves it as a GIF.
+        teams = self.setup_animation()
+        size = self.fig.canvas.get_width_height()
+        return write_animation(self.render_frames(teams, workers=workers), size, self.filename,
+                               fps=ANIMATION_FPS)
+
+
+    def setup_animation(self):
         """
+        Draws every line and logo once, along with the axes, titles and styling that are shared
+        by every frame.
 
+        :return list[str]: The teams to highlight, one per frame.
+        """
         x_min = self.df['gameNumber'].min()
         x_max = self.df['gameNumber'].max()
         x_ticks = list(range(x_min, x_max, 5))
         y_range = self.set_scaling()
 
-        def animate(i: int):
-            self.axis.clear()
-
-            self.axis.set_xticks([], [])
-            self.axis.set_xticks(x_ticks, labels=x_ticks, fontdict=tick_params)
-            self.axis.set_xlabel(self.x_label, fontdict=label_text_params, labelpad=16.0)
+        self.axis.set_xticks(x_ticks, labels=x_ticks, fontdict=tick_params)
+        self.axis.set_xlabel(self.x_label, fontdict=label_text_params, labelpad=16.0)
 
-            self.axis.set_yticks([], [])
-            self.axis.set_yticks(y_range,
-                                labels=[f"{y}%" for y in y_range] if self.sport == 'hockey' \
-                                       else y_range,
-                                fontdict=tick_params)
-            self.axis.set_ylabel(self.y_label, fontdict=label_text_params, labelpad=16.0)
+        self.axis.set_yticks(y_range,
+                             labels=[f"{y}%" for y in y_range] if self.sport == 'hockey' \
+                                    else y_range,
+                             fontdict=tick_params)
+        self.axis.set_ylabel(self.y_label, fontdict=label_text_params, labelpad=16.0)
 
-            teams = list(set(self.df['team']))
-            team = teams[i % 5]
-            team_df = self.df.filter(pl.col('team') == team)
-            else_df = self.df.filter(pl.col('team') != team)
+        self.add_x_axis()
+        self.add_dotted_h_lines(y_values=y_range)
 
-            team_line = self.plot_multilines(alpha=1, linewidth=3, df=team_df)
-            else_lines = self.plot_multilines(alpha=0.2, linewidth=1, df=else_df)
-            team_logo = self.handle_team_logos(df=team_df, alpha=1)
-            else_logos = self.handle_team_logos(df=else_df, alpha=0.1)
+        self.lines = self.plot_multilines(alpha=0.2, linewidth=1)
+        self.logos = self.handle_team_logos(alpha=0.1)
 
-            self.add_x_axis()
-            self.add_dotted_h_lines(y_values=y_range)
-
-            return team_line + else_lines, team_logo, else_logos
-
-        ani = FuncAnimation(self.fig, animate,
-                            frames=8,
-                            blit=False,
-                            repeat=True)
+        # Fit the y-axis to the lines and dotted h-lines, rather than the limits from set_scaling()
+        self.axis.autoscale(axis='y')
 
         self.add_data_disclaimer()
         self.set_styling()
         self.set_title()
 
         self.fig.set_facecolor('#000d1a')
+        self.fig.set_dpi(ANIMATION_DPI)
+
+        return sorted(set(self.df['team']))
+
 
-        videowriter = FFMpegWriter(fps=1)
-        ani.save('run_diff_rolling_avg.mp4', dpi=300, writer=videowriter)
+    def render_frames(self, teams, workers=None):
+        """
+        Yields the frame for each team as a raw RGBA buffer, in order.
+
+        Frames are rendered in a pool of forked worker processes. Each worker draws the static
+        background once and blits the restyled lines and logos on top of it for every frame,
+        then copies the frame into shared memory rather than sending it back through a pipe.
+        There are two batches of slots, so the workers render the next batch of frames while
+        the current one is being used.
+
+        :param list[str] teams: The team to highlight in each frame.
+        :param int workers: Number of worker processes, defaults to the CPU count.
+        """
+        global _frame_plot, _frame_slots  # pylint: disable=global-statement
+
+        workers = min(workers or os.cpu_count(), len(teams))
+        if workers > 1 and 'fork' in multiprocessing.get_all_start_methods():
+            width, height = self.fig.canvas.get_width_height()
+            shape = (2, workers, height, width, 4)
+            memory = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)))
+            _frame_plot = self
+            _frame_slots = np.ndarray(shape, dtype=np.uint8, buffer=memory.buf)
+            batches = [teams[i:i + workers] for i in range(0, len(teams), workers)]
+            context = multiprocessing.get_context('fork')
+            try:
+                with context.Pool(workers, initializer=_init_frame_worker) as pool:
+                    def submit(index):
+                        return pool.starmap_async(_render_frame,
+                                                  [(team, index % 2, slot)
+                                                   for slot, team in enumerate(batches[index])])
+
+                    pending = submit(0)
+                    for index, batch in enumerate(batches):
+                        pending.get()
+                        # The other batch of slots was used up by the previous batch's frames
+                        if index + 1 < len(batches):
+                            pending = submit(index + 1)
+                        for slot in range(len(batch)):
+                            yield _frame_slots[index % 2, slot].tobytes()
+            finally:
+                _frame_plot = None
+                _frame_slots = None
+                memory.close()
+                memory.unlink()
+            return
+
+        self.prepare_frames()
+        for team in teams:
+            yield self.render_frame(team)
+
+
+    def highlight_team(self, team):
+        """
+        Restyles every line and logo so that only `team` is highlighted.
+
+        :param str team: The team to highlight, or None to fade every team.
+        :return list: The restyled artists, in the order they should be drawn.
+        """
+        for key, line in self.lines.items():
+            highlighted = key == team
+            line.set_alpha(1 if highlighted else 0.2)
+            line.set_linewidth(3 if highlighted else 1)
+            # Keep the highlighted line on top of the faded ones
+            line.set_zorder(2.1 if highlighted else 2)
+            for logo in self.logos.get(key, []):
+                logo.offsetbox.image.set_alpha(1 if highlighted else 0.1)
+                logo.set_zorder(3.1 if highlighted else 3)
+
+        artists = list(self.lines.values()) + [logo for pair in self.logos.values()
+                                               for logo in pair]
+        return sorted(artists, key=lambda artist: artist.get_zorder())
+
+
+    def prepare_frames(self):
+        """
+        Draws everything except the lines and logos, and keeps it as the background that each
+        frame is blitted onto.
+        """
+        for artist in self.highlight_team(None):
+            artist.set_animated(True)
+        self.fig.canvas.draw()
+        self.background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+
+
+    def blit_frame(self, team):
+        """
+        Draws the frame highlighting `team` onto the canvas, on top of the background from
+        `prepare_frames`.
+
+        :param str team: The team to highlight.
+        """
+        renderer = self.fig.canvas.get_renderer()
+        self.fig.canvas.restore_region(self.background)
+        for artist in self.highlight_team(team):
+            artist.draw(renderer)
+
+    def render_frame(self, team):
+        """
+        Renders the frame highlighting `team`, on top of the background from `prepare_frames`.
+
+        :param str team: The team to highlight.
+        :return bytes: The frame as a raw RGBA buffer.
+        """
+        self.blit_frame(team)
+        return bytes(self.fig.canvas.buffer_rgba())
@@ -3,7 +3,9 @@ from matplotlib.offsetbox import AnnotationBbox
 
 from plot_types.plot import Plot, FancyAxes
 from util.color_maps import mlb_label_colors
+from util.downsample import downsample, pixel_budget
 from util.font_dicts import game_report_label_text_params as label_params
+from util import plot_timing
 
 
 class CumulativeLinePlot(Plot):
@@ -21,7 +23,8 @@ class CumulativeLinePlot(Plot):
                  subtitle='',
                  x_label='',
                  y_label='',
-                 size=(10, 8)):
+                 size=(10, 8),
+                 downsample_lines=False):
 
         super().__init__(filename, title, subtitle, size, sport, data_disclaimer)
 
@@ -32,12 +35,15 @@ class CumulativeLinePlot(Plot):
         self.y_label = y_label
         self.sport = sport
         self.data_disclaimer = data_disclaimer
+        # For long series (e.g. multiple seasons), cap the vertices of each line to the plot width
+        self.downsample_lines = downsample_lines
 
         self.fig = plt.figure(figsize=self.size)
         self.axis = self.fig.add_subplot(111, axes_class=FancyAxes, ar=2.0)
         self.axis.spines[['bottom', 'left', 'right', 'top']].set_visible(False)
 
 
+    @plot_timing.timed('make_plot')
     def make_plot(self):
         """
         Assemble the plot object.
@@ -94,6 +100,7 @@ class CumulativeLinePlot(Plot):
         """
         Adds a line plot for each team in the dataframe.
         """
+        max_points = pixel_budget(self.axis) if self.downsample_lines else None
         for team in set(self.df['team']):
             team_df = self.df[self.df['team'] == team]
 
@@ -102,8 +109,11 @@ class CumulativeLinePlot(Plot):
             else:
                 color = 'black'
 
-            self.axis.plot(team_df[self.x_col], team_df[self.y_col],
-                           color, marker='o', markersize=2, linestyle='dashed')
+            x, y = team_df[self.x_col], team_df[self.y_col]
+            if max_points:
+                x, y = downsample(x, y, max_points)
+
+            self.axis.plot(x, y, color, marker='o', markersize=2, linestyle='dashed')
 
 
 
@@ -3,6 +3,7 @@ import matplotlib.pyplot as plt
 
 from plot_types.plot import Plot, FancyAxes
 from util.font_dicts import game_report_label_text_params
+from util import plot_timing
 
 
 class LayeredLollipopPlot(Plot):
@@ -32,6 +33,7 @@ class LayeredLollipopPlot(Plot):
         self.legend_loc = legend_loc
 
 
+    @plot_timing.timed('make_plot')
     def make_plot(self):
         """
         Creates the plot object.
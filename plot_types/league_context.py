@@ -0,0 +1,181 @@
+"""
+Module for drawing the league context of a player scatter plot, i.e. every player who isn't on
+the highlighted team, at a level of detail that suits how many of them there are.
+
+Up to a threshold, each player is drawn as a faint team logo. Past it, hundreds of nearly
+invisible logos dominate the time it takes to render the plot (and the size of an SVG of it),
+so the players are drawn as a single layer instead, in one of these styles:
+    - 'kde': a Gaussian kernel density estimate of where the players are, as one raster image
+    - 'hexbin': the number of players in each hexagonal bin
+    - 'points': a single collection of small points
+
+The KDE is computed with NumPy for every team at once, and can be kept in memory under a name
+(e.g. the chart, season and situation), so that a batch of plots for one team after another only
+computes it once: each team's layer is the league's density less its own.
+"""
+
+import numpy as np
+from matplotlib.colors import ListedColormap
+
+## Constants #########################################################################
+STYLES = ('kde', 'hexbin', 'points')
+DEFAULT_STYLE = 'kde'
+# Number of context players above which they're drawn as a single layer rather than logos
+DEFAULT_THRESHOLD = 150
+
+# Colour of the layer, and the opacity of its densest part
+CONTEXT_COLOR = (0.35, 0.35, 0.35)
+MAX_ALPHA = 0.3
+
+# Number of cells along each side of the KDE raster
+KDE_GRID_SIZE = 200
+# Number of hexagons across the x-axis of a hexbin
+HEXBIN_GRID_SIZE = 25
+# Size and opacity of each point
+POINT_SIZE = 12
+POINT_ALPHA = 0.25
+
+# Maximum number of densities kept in memory, oldest are dropped first
+MAX_DENSITIES = 32
+## End Constants #####################################################################
+
+_densities = {}
+
+
+class LeagueDensity:
+    """
+    Density of every team's players on a grid, from which the league context of any team can be
+    drawn.
+
+    :param tuple extent: (x_min, x_max, y_min, y_max) of the grid, in data coordinates.
+    :param dict teams: For each team, its players' density, as a (y, x) array.
+    """
+    def __init__(self, extent, teams):
+        self.extent = extent
+        self.teams = teams
+        self.total = sum(teams.values())
+
+    def excluding(self, team):
+        """ The density of every player not on `team`. """
+        density = self.total - self.teams.get(team, 0)
+        # Subtracting can leave tiny negative values where the team had all the players
+        return np.clip(density, 0, None)
+
+
+def _kernels(values, centres, bandwidth):
+    """ The Gaussian kernel of every value at every grid centre, shaped (values, centres). """
+    return np.exp(-0.5 * ((centres[None, :] - values[:, None]) / bandwidth) ** 2)
+
+
+def _bandwidth(values, factor, span):
+    """ Scott's rule bandwidth, or a fiftieth of the axis if the values are all the same. """
+    spread = values.std() * factor
+    return spread if spread > 0 else span / 50
+
+
+def compute_density(teams, x, y, extent, size=KDE_GRID_SIZE):
+    """
+    Computes the KDE of every team's players on a `size` x `size` grid. The Gaussian kernel is
+    separable, so each team's density is a single product of its players' x and y kernels.
+
+    :param np.ndarray teams: Team of each player.
+    :param np.ndarray x: x-value of each player.
+    :param np.ndarray y: y-value of each player.
+    :param tuple extent: (x_min, x_max, y_min, y_max) of the grid.
+    :param int size: Number of cells along each side of the grid.
+    :return LeagueDensity: The density of every team.
+    """
+    x_min, x_max, y_min, y_max = extent
+    # Scott's rule, for two dimensions, with the bandwidth from the whole league
+    factor = len(x) ** (-1 / 6)
+    x_kernels = _kernels(x, np.linspace(x_min, x_max, size),
+                         _bandwidth(x, factor, x_max - x_min))
+    y_kernels = _kernels(y, np.linspace(y_min, y_max, size),
+                         _bandwidth(y, factor, y_max - y_min))
+
+    names, codes = np.unique(teams, return_inverse=True)
+    densities = {}
+    for index, team in enumerate(names):
+        players = codes == index
+        densities[str(team)] = y_kernels[players].T @ x_kernels[players]
+    return LeagueDensity(extent, densities)
+
+
+def get_density(name, teams, x, y, extent):
+    """
+    Returns the density of the league for the given players, from memory if it was computed
+    under the same name for the same players and extent.
+
+    :param str name: Name the density is kept under, or None to not keep it.
+    :param np.ndarray teams: Team of each player.
+    :param np.ndarray x: x-value of each player.
+    :param np.ndarray y: y-value of each player.
+    :param tuple extent: (x_min, x_max, y_min, y_max) of the grid.
+    """
+    if name is None:
+        return compute_density(teams, x, y, extent)
+
+    # The players are identified cheaply, so that a name reused with other data never matches
+    key = (name, tuple(extent), len(x), float(x.sum()), float(y.sum()))
+    density = _densities.get(key)
+    if density is None:
+        density = compute_density(teams, x, y, extent)
+        if len(_densities) >= MAX_DENSITIES:
+            del _densities[next(iter(_densities))]
+        _densities[key] = density
+    return density
+
+
+def clear_densities():
+    """
+    Drops every density kept in memory.
+    """
+    _densities.clear()
+
+
+def _context_cmap():
+    """ Colormap from transparent to CONTEXT_COLOR at MAX_ALPHA. """
+    colors = np.zeros((256, 4))
+    colors[:, :3] = CONTEXT_COLOR
+    colors[:, 3] = np.linspace(0, MAX_ALPHA, 256)
+    return ListedColormap(colors)
+
+
+def draw(axis, teams, x, y, team, style=DEFAULT_STYLE, name=None):
+    """
+    Draws the league context of a team on an axis, as a single layer under the team's players.
+
+    :param Axes axis: Axis to draw on, with its limits already set.
+    :param np.ndarray teams: Team of every player, including the highlighted team's.
+    :param np.ndarray x: x-value of every player.
+    :param np.ndarray y: y-value of every player.
+    :param str team: The highlighted team, whose players are left out.
+    :param str style: One of STYLES.
+    :param str name: Name the KDE is kept in memory under, e.g. the chart, season and situation.
+    :return Artist: The layer drawn.
+    """
+    if style not in STYLES:
+        raise ValueError(f"League context style must be one of {', '.join(STYLES)}, "
+                         f"not '{style}'")
+
+    x_lim, y_lim = axis.get_xlim(), axis.get_ylim()
+    extent = (min(x_lim), max(x_lim), min(y_lim), max(y_lim))
+    others = teams != team
+
+    if style == 'points':
+        layer = axis.scatter(x[others], y[others], s=POINT_SIZE, color=CONTEXT_COLOR,
+                             alpha=POINT_ALPHA, linewidths=0)
+    elif style == 'hexbin':
+        layer = axis.hexbin(x[others], y[others], gridsize=HEXBIN_GRID_SIZE, extent=extent,
+                            cmap=_context_cmap(), mincnt=1, linewidths=0)
+    else:
+        density = get_density(name, teams, x, y, extent).excluding(team)
+        peak = density.max()
+        layer = axis.imshow(density / peak if peak > 0 else density, extent=extent,
+                            origin='lower', cmap=_context_cmap(), vmin=0, vmax=1,
+                            interpolation='bilinear', aspect='auto')
+
+    # Drawing the layer can move the limits, which were set to fit the data
+    axis.set_xlim(x_lim)
+    axis.set_ylim(y_lim)
+    return layer
@@ -10,6 +10,7 @@ from plot_types.plot import Plot, FancyAxes
 from util.color_maps import label_colors
 from util.helpers import handle_player_full_names
 from util.font_dicts import game_report_label_text_params as text_params
+from util import plot_timing
 
 class MirroredBarPlot(Plot):
     """
@@ -52,6 +53,7 @@ class MirroredBarPlot(Plot):
         self.y_label = y_label
 
 
+    @plot_timing.timed('make_plot')
     def make_plot(self):
         """
         Generate the actual plot object.
@@ -310,7 +312,9 @@ class MirroredBarPlot(Plot):
             'total': pl.Float64,
         })
 
+        # Relaxed, since the name, team and position columns may be categorical (see
+        # util/schema.py), and the empty names and positions aren't among their categories
         if a_is_more:
-            self.df_b = pl.concat([self.df_b, df]).fill_nan(0)
+            self.df_b = pl.concat([self.df_b, df], how='vertical_relaxed').fill_nan(0)
         else:
-            self.df_a = pl.concat([self.df_a, df]).fill_nan(0)
+            self.df_a = pl.concat([self.df_a, df], how='vertical_relaxed').fill_nan(0)
@@ -2,6 +2,7 @@ import matplotlib.pyplot as plt
 
 from plot_types.plot import Plot, FancyAxes
 from util.font_dicts import multiplot_title_params
+from util import plot_timing
 
 
 class MultiPlot(Plot):
@@ -47,6 +48,10 @@ class MultiPlot(Plot):
                          data_disclaimer=data_disclaimer,
                          figure=self.fig)
 
+        # Constrained layout runs every time the figure is drawn, i.e. during savefig
+        self.timer.instrument(self.fig.get_layout_engine(), 'execute', 'constrained_layout')
+
+    @plot_timing.timed('make_multiplot')
     def make_multiplot(self):
         """
         Generate the actual multiplot.
@@ -68,7 +73,11 @@ class MultiPlot(Plot):
                                           axes_class=FancyAxes)
             ax.spines[['bottom', 'left', 'right', 'top']].set_visible(False)
             plot["plot"].axis = ax
-            plot["plot"].make_plot()
+
+            # Sub-plots are timed as part of the multiplot, rather than each on their own
+            plot["plot"].timer = self.timer
+            with self.timer.phase(type(plot["plot"]).__name__):
+                plot["plot"].make_plot()
 
         self.fig.suptitle(self.title, **multiplot_title_params)
         #self.set_title()
@@ -1,4 +1,5 @@
 from plot_types.plot import Plot
+from util import plot_timing
 
 
 class PiePlot(Plot):
@@ -18,6 +19,7 @@ class PiePlot(Plot):
         self.labels = labels
         self.radius = radius
 
+    @plot_timing.timed('make_plot')
     def make_plot(self):
         """
         Draw the pie chart.
@@ -1,11 +1,49 @@
+import os
+from functools import lru_cache
+
 import matplotlib.pyplot as plt
 from matplotlib.offsetbox import OffsetImage, AnnotationBbox
 from matplotlib import axes
 from matplotlib import patches
+from matplotlib.image import pil_to_array
 from PIL import Image
 
+from plot_types import template as figure_template
+from util import svg_export, plot_timing
 from util.font_dicts import title_params, subtitle_params, multiplot_subtitle_params
 
+SAVE_DPI = 100
+
+# Directory the team logos are read from, as {sport}/{size}/{team}.png. Relative to the working
+# directory by default, since the entry scripts are run from the repo root
+LOGO_ROOT = os.environ.get('TEAM_LOGO_ROOT', 'team_logos')
+
+
+def set_logo_root(path):
+    """
+    Reads team logos from a different directory from now on, e.g. one with synthetic logos for
+    benchmarking. Clears the logos that were already decoded.
+
+    :param str path: Directory laid out like team_logos/.
+    """
+    global LOGO_ROOT
+    LOGO_ROOT = path
+    load_logo.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def load_logo(team_name, size='small', sport='hockey'):
+    """
+    Reads and decodes a team logo, returning it as an RGBA array. Decoded logos are cached, since
+    the same logo is usually drawn many times in a plot (or many times over in the render daemon).
+
+    :param str team_name: Team acronym, which is also the logo filename.
+    :param str size: Either 'tiny', 'small', 'big' or 'huge'.
+    :param str sport: Either 'hockey' or 'baseball'.
+    """
+    with Image.open(os.path.join(LOGO_ROOT, sport, size, f'{team_name}.png')) as img:
+        return pil_to_array(img)
+
 
 class StaticColorAxisBbox(patches.FancyBboxPatch):
     """
@@ -60,7 +98,8 @@ class Plot:
                  data_disclaimer='moneypuck',
                  for_game_report=False,
                  fantasy_mode=False,
-                 sport='hockey'):
+                 sport='hockey',
+                 template=None):
 
         self.filename = filename
         self.title = title
@@ -73,6 +112,16 @@ class Plot:
         self.fantasy_mode = fantasy_mode
         self.sport = sport
 
+        # Name under which the static scaffold of the figure is cached (e.g. chart type and
+        # season), or None to always draw the full figure. See plot_types/template.py.
+        self.template = template
+        self.template_key = None
+        self.figure_template = None
+        self.scaffold = None
+
+        # Records how long each phase of the render takes, if enabled. See util/plot_timing.py.
+        self.timer = plot_timing.timer_for(type(self).__name__, filename)
+
 
     def set_title(self):
         """
@@ -133,21 +182,85 @@ class Plot:
                     bbox={"facecolor": facecolor, "alpha": 0.8, "pad": 5})
 
 
+    def load_template(self, *geometry):
+        """
+        Looks up the cached scaffold for this plot, if `self.template` is set. The key is the
+        template name plus everything that determines how the scaffold looks, so plots that share
+        a name but not a scaffold (e.g. different axis limits) never share a template.
+
+        :param geometry: Every value that affects the static parts of the figure.
+        :return bool: True if a cached scaffold exists, in which case the caller should skip
+                      drawing the static artists.
+        """
+        # The cached background is rendered at the figure's dpi, so it has to match savefig's, and
+        # is stamped into a raster image, so it can't be used for vector output
+        if self.template is None or not self.filename or self.fig.dpi != SAVE_DPI \
+                or self.filename.lower().endswith('.svg'):
+            return False
+        self.template_key = (self.template, type(self).__name__, self.size, self.data_disclaimer,
+                             self.for_game_report, self.sport) + geometry
+        self.figure_template = figure_template.get_template(self.template_key)
+        return self.figure_template is not None
+
+
+    def mark_scaffold(self):
+        """
+        Records every artist drawn so far as part of the static scaffold. Anything added after
+        this point is treated as a dynamic layer and drawn on top of the cached background.
+        """
+        if self.template_key is not None:
+            self.scaffold = set(self.fig.get_children()) | set(self.axis.get_children())
+
+
     def save_plot(self):
         """
-        Performs the following before saving the plot as a PNG file:
+        Performs the following before saving the plot as a PNG file (or an SVG file, if the
+        filename ends in .svg):
            i. add styling (colors, frames, etc.)
           ii. adds the data disclaimer
         """
+        if self.scaffold is not None:
+            with self.timer.phase('stamp_template'):
+                self.save_templated_plot()
+            return
 
-        self.set_styling()
+        with self.timer.phase('styling'):
+            self.set_styling()
 
-        # Add data disclaimer
-        self.add_data_disclaimer()
+            # Add data disclaimer
+            self.add_data_disclaimer()
 
         # If self.filename is empty, then this is for a multiplot so don't save as a file
-        if self.filename:
-            plt.savefig(self.filename, dpi=100)
+        if not self.filename:
+            return
+
+        # Drawing the artists (including any layout) is timed separately, so what's left of
+        # savefig is encoding the image
+        self.timer.instrument(self.fig, 'draw', 'draw')
+        with self.timer.phase('savefig'):
+            if self.filename.lower().endswith('.svg'):
+                # Team logos repeat a lot, so each one is only embedded once
+                svg_export.save_svg(self.fig, self.filename, dpi=SAVE_DPI)
+            else:
+                # Not plt.savefig, which redraws the whole figure again once it's saved
+                self.fig.savefig(self.filename, dpi=SAVE_DPI)
+
+
+    def save_templated_plot(self):
+        """
+        Saves the plot by stamping its dynamic layers onto the cached scaffold. If there is no
+        cached scaffold yet, the full figure is drawn once and cached for the next plot.
+        """
+        artists = figure_template.dynamic_artists(self.fig, self.axis, self.scaffold)
+
+        self.set_styling()
+        if self.figure_template is None:
+            # The disclaimer is part of the scaffold, so only needs to be added the first time
+            self.add_data_disclaimer()
+            self.figure_template = figure_template.capture_template(self.template_key, self.fig,
+                                                                    artists)
+
+        figure_template.stamp_template(self.figure_template, self.fig, artists, self.filename)
 
 
     def add_team_logo(self, row, x, y, label=None, opacity=1, opacity_scale=None, opacity_max=None,
@@ -252,7 +365,7 @@ class Plot:
         Size can be one of 'tiny', 'big', or 'small'.
         Sport can be 'hockey' or 'baseball'.
         """
-        img = Image.open(f'team_logos/{sport}/{size}/{team_name}.png')
+        img = load_logo(team_name, size=size, sport=sport)
 
         # The zoom value here is how we get the native resolution of the image
         # relative to the DPI of the figure
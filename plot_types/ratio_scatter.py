@@ -3,8 +3,10 @@ import polars as pl
 import matplotlib.pyplot as plt
 
 from plot_types.plot import Plot, FancyAxes
+from plot_types import league_context
 from util.font_dicts import game_report_label_text_params, label_text_params
 from util.helpers import ratio_to_color
+from util import plot_timing
 
 AXIS_LABEL_PAD = 15
 
@@ -32,6 +34,8 @@ class RatioScatterPlot(Plot):
                  break_even_line=True,
                  plot_league_average=0,
                  show_league_context=False,
+                 league_context_style=league_context.DEFAULT_STYLE,
+                 league_context_threshold=league_context.DEFAULT_THRESHOLD,
                  team='ALL',
                  scale='team',
                  scale_to_extreme=False,
@@ -39,10 +43,12 @@ class RatioScatterPlot(Plot):
                  for_game_report=False,
                  data_disclaimer='moneypuck',
                  fade_non_playoffs=False,
-                 sport='hockey'):
+                 sport='hockey',
+                 fantasy_mode=False,
+                 template=None):
 
         super().__init__(filename, title, subtitle, size, data_disclaimer=data_disclaimer,
-                         sport=sport)
+                         fantasy_mode=fantasy_mode, sport=sport, template=template)
 
         self.df = dataframe
         self.x_col = x_column
@@ -62,6 +68,13 @@ class RatioScatterPlot(Plot):
         self.plot_y_mean = plot_y_mean
         self.quadrant_labels = quadrant_labels
         self.show_league_context = show_league_context
+        # How the league context is drawn once there are more than `league_context_threshold`
+        # players in it, one of league_context.STYLES or 'logos' to always draw logos
+        if league_context_style not in {*league_context.STYLES, 'logos'}:
+            raise ValueError("'league_context_style' value must be one of "
+                             f"{', '.join(league_context.STYLES)} or 'logos'")
+        self.league_context_style = league_context_style
+        self.league_context_threshold = league_context_threshold
         self.team = team
         self.scale_to_extreme = scale_to_extreme
         self.for_game_report = for_game_report
@@ -78,13 +91,77 @@ class RatioScatterPlot(Plot):
         self.fade_non_playoffs = fade_non_playoffs
 
 
+    @plot_timing.timed('make_plot')
     def make_plot(self, dashboard=False):
         """
         Method to assemble the plot object.
         """
 
+        # Set the scaling of the plot
+        x_min, x_max, _, y_max = self.set_scaling()
+
+        # Everything up until the data itself is identical for every team in a batch, so it can
+        # come from a cached template if one was requested. A league context layer has to sit
+        # under the scaffold's bands and lines, but a template is stamped under every dynamic
+        # artist, so plots with one are drawn in full
+        use_template = not dashboard and not self.draws_league_layer()
+        has_template = use_template and self.load_template(
+            self.x_col, self.y_col, self.x_label, self.y_label,
+            self.axis.get_xlim(), self.axis.get_ylim(),
+            self.invert_x, self.invert_y, self.ratio_lines,
+            self.break_even_line, self.plot_league_average,
+            repr(self.percentiles), repr(self.quadrant_labels))
+        if not has_template:
+            with self.timer.phase('scaffold'):
+                self.add_scaffold(x_min, x_max, y_max)
+        self.mark_scaffold()
+
         self.set_title()
 
+        # Calculate and plot the average for each value
+        if self.plot_x_mean:
+            x_mean = self.df[self.x_col].mean()
+            self.axis.axvline(x_mean, color='k', label='NHL Average')
+        if self.plot_y_mean:
+            y_mean = self.df[self.y_col].mean()
+            self.axis.axhline(y_mean, color='k', label='NHL Average')
+
+        # Add team logos, slightly different based on team- or player-scale
+        if self.scale == 'player':
+            with self.timer.phase('logos'):
+                self.self_add_player_data()
+
+        elif self.scale == 'team':
+            bad_teams = set()
+            if self.fade_non_playoffs:
+                bad_teams = {'OTT', 'STL', 'TB', 'TBL', 'MTL', 'NJD', 'NJ', 'LAK', 'LA',
+                             'MIN', 'COL', 'WPG', 'VGK', 'WSH', 'TOR'}
+            with self.timer.phase('logos'):
+                self.df.select(
+                    pl.struct(pl.all())
+                    .map_elements(lambda row: self.add_team_logo(row, self.x_col, self.y_col,
+                                                                 opacity=0.7,
+                                                                 teams_to_fade=bad_teams),
+                                  return_dtype=pl.Struct([]))
+                )
+
+        if self.invert_y:
+            self.axis.invert_yaxis()
+
+        if self.invert_x:
+            self.axis.invert_xaxis()
+
+        self.save_plot()
+
+        if dashboard:
+            return self.fig
+
+
+    def add_scaffold(self, x_min, x_max, y_max):
+        """
+        Adds the static parts of the plot, i.e. everything that doesn't depend on which team's
+        data is being highlighted: axis labels, quadrant labels, percentiles and reference lines.
+        """
         self.axis.set_xlabel(self.x_label, labelpad=AXIS_LABEL_PAD,
                              fontdict=game_report_label_text_params if self.for_game_report \
                                 else label_text_params)
@@ -103,9 +180,6 @@ class RatioScatterPlot(Plot):
 
         self.axis.tick_params(colors='antiquewhite', which='both')
 
-        # Set the scaling of the plot
-        x_min, x_max, _, y_max = self.set_scaling()
-
         if self.quadrant_labels:
             self.add_quadrant_labels()
 
@@ -137,62 +211,39 @@ class RatioScatterPlot(Plot):
                            size='small', weight='bold')
 
         if self.ratio_lines:
-            # Plot diagonal lines to show each percentage breakpoint
-            for x in np.arange(0.0001, 1, 0.01):
-                if round(x ,3) == 0.50:  # Already have a line indicating 50%, so skip here
-                    continue
-                # p1 and p2 are the endpoints of the diagonal
-                p1 = (2, 2 * ((1 - x) / x))
-                p2 = (2.5, 2.5 * ((1 - x) / x))
-                color = '0.88'
-
-                # For hockey ratio plots, emphasize lines at 40, 45, 55, 60, etc.
-                if round(x * 100, 0) % 5 == 0 and self.sport == 'hockey':
-                    color = ratio_to_color(x) if self.for_game_report else '0.6'
-                    text_xy = (y_max * (x / (1 - x)), y_max - 0.02)
-                    if text_xy[0] > x_max or text_xy[0] < x_min:
-                        text_xy = (x_max - 0.1, x_max * ((1 - x) / x))
-                    self.axis.annotate(f'{str(round(x, 3) * 100)[:2]}%', xy=text_xy, color=color)
-
-                # If this is for the game report, we only want the big lines at 40, 45 etc.
-                if not self.for_game_report or round(x* 100, 0) % 5 == 0:
-                    self.axis.axline(p1, p2, color=color, zorder=-10)
-
-        # Calculate and plot the average for each value
-        if self.plot_x_mean:
-            x_mean = self.df[self.x_col].mean()
-            self.axis.axvline(x_mean, color='k', label='NHL Average')
-        if self.plot_y_mean:
-            y_mean = self.df[self.y_col].mean()
-            self.axis.axhline(y_mean, color='k', label='NHL Average')
-
-        # Add team logos, slightly different based on team- or player-scale
-        if self.scale == 'player':
-            self.self_add_player_data()
-
-        elif self.scale == 'team':
-            bad_teams = set()
-            if self.fade_non_playoffs:
-                bad_teams = {'OTT', 'STL', 'TB', 'TBL', 'MTL', 'NJD', 'NJ', 'LAK', 'LA',
-                             'MIN', 'COL', 'WPG', 'VGK', 'WSH', 'TOR'}
-            self.df.select(
-                pl.struct(pl.all())
-                .map_elements(lambda row: self.add_team_logo(row, self.x_col, self.y_col,
-                                                             opacity=0.7,
-                                                             teams_to_fade=bad_teams),
-                              return_dtype=pl.Struct([]))
-            )
-
-        if self.invert_y:
-            self.axis.invert_yaxis()
-
-        if self.invert_x:
-            self.axis.invert_xaxis()
-
-        self.save_plot()
-
-        if dashboard:
-            return self.fig
+            with self.timer.phase('ratio_lines'):
+                # Plot diagonal lines to show each percentage breakpoint
+                for x in np.arange(0.0001, 1, 0.01):
+                    if round(x ,3) == 0.50:  # Already have a line indicating 50%, so skip here
+                        continue
+                    # p1 and p2 are the endpoints of the diagonal
+                    p1 = (2, 2 * ((1 - x) / x))
+                    p2 = (2.5, 2.5 * ((1 - x) / x))
+                    color = '0.88'
+
+                    # For hockey ratio plots, emphasize lines at 40, 45, 55, 60, etc.
+                    if round(x * 100, 0) % 5 == 0 and self.sport == 'hockey':
+                        color = ratio_to_color(x) if self.for_game_report else '0.6'
+                        text_xy = (y_max * (x / (1 - x)), y_max - 0.02)
+                        if text_xy[0] > x_max or text_xy[0] < x_min:
+                            text_xy = (x_max - 0.1, x_max * ((1 - x) / x))
+                        self.axis.annotate(f'{str(round(x, 3) * 100)[:2]}%', xy=text_xy,
+                                           color=color)
+
+                    # If this is for the game report, we only want the big lines at 40, 45 etc.
+                    if not self.for_game_report or round(x* 100, 0) % 5 == 0:
+                        self.axis.axline(p1, p2, color=color, zorder=-10)
+
+
+    def draws_league_layer(self):
+        """
+        Whether the league context is drawn as a single layer rather than logos, i.e. there are
+        more than `self.league_context_threshold` players in it.
+        """
+        if self.scale != 'player' or self.team == 'ALL' or not self.show_league_context \
+                or self.league_context_style == 'logos':
+            return False
+        return self.df.filter(pl.col('team') != self.team).height > self.league_context_threshold
 
 
     def self_add_player_data(self):
@@ -200,17 +251,28 @@ class RatioScatterPlot(Plot):
         Method to add the logos for each player in the plot. 
         
         If `self.team` is not 'ALL' and `self.show_league_context` is True, then show players from
-        all teams with severely reduced opacity and no labels.
+        all teams with severely reduced opacity and no labels. Past `self.league_context_threshold`
+        players, they're drawn as a single layer in `self.league_context_style` instead (see
+        plot_types/league_context.py), kept in memory under the plot's template name.
         """
         if self.team != 'ALL' and self.show_league_context:
-            # DataFrame for every player excluding the target team
-            remaining_df = self.df.filter(pl.col('team') != self.team)
-            remaining_df.select(
-                pl.struct(pl.all())
-                .map_elements(lambda row: self.add_team_logo(row, self.x_col, self.y_col,
-                                                             opacity=0.06),
-                              return_dtype=pl.Struct([]))
-            )
+            if self.draws_league_layer():
+                with self.timer.phase('league_context'):
+                    league_context.draw(self.axis,
+                                        self.df['team'].cast(pl.String).to_numpy(),
+                                        self.df[self.x_col].to_numpy(),
+                                        self.df[self.y_col].to_numpy(),
+                                        self.team, style=self.league_context_style,
+                                        name=self.template)
+            else:
+                # DataFrame for every player excluding the target team
+                remaining_df = self.df.filter(pl.col('team') != self.team)
+                remaining_df.select(
+                    pl.struct(pl.all())
+                    .map_elements(lambda row: self.add_team_logo(row, self.x_col, self.y_col,
+                                                                 opacity=0.06),
+                                  return_dtype=pl.Struct([]))
+                )
 
         team_df = self.df.filter(pl.col('team') == self.team) if self.team != 'ALL' else self.df
 
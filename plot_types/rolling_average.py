@@ -8,7 +8,21 @@ from scipy.interpolate import make_interp_spline
 
 from plot_types.plot import Plot, FancyAxes
 from util.color_maps import label_colors, mlb_label_colors
+from util.downsample import downsample, pixel_budget
 from util.font_dicts import game_report_label_text_params as label_params
+from util import plot_timing
+
+# Number of points each line is smoothed to
+SMOOTHING_POINTS = 300
+# When downsampling, lines are smoothed to this many points per data point instead, and then
+# downsampled to fit the width of the plot
+SMOOTHING_POINTS_PER_VALUE = 10
+# Maximum number of smoothed lines kept in the cache before it is reset
+MAX_CACHED_LINES = 4096
+
+# Smoothed (x, y) points for each line, keyed by (multiline key value, number of points,
+# raw x bytes, raw y bytes)
+_smoothed_lines = {}
 
 
 class RollingAveragePlot(Plot):
@@ -30,7 +44,8 @@ class RollingAveragePlot(Plot):
                  size=(10, 8),
                  multiline_key=None,
                  add_team_logos=False,
-                 for_multiplot=True):
+                 for_multiplot=True,
+                 downsample_lines=False):
 
         super().__init__(filename, title, subtitle, size, sport, data_disclaimer)
 
@@ -45,12 +60,15 @@ class RollingAveragePlot(Plot):
         self.add_team_logos = add_team_logos
         self.for_multiplot = for_multiplot
         self.data_disclaimer = data_disclaimer
+        # For long series (e.g. multiple seasons), cap the vertices of each line to the plot width
+        self.downsample_lines = downsample_lines
 
         self.fig = plt.figure(figsize=self.size)
         self.axis = self.fig.add_subplot(111, axes_class=FancyAxes, ar=2.0)
         self.axis.spines[['bottom', 'left', 'right', 'top']].set_visible(False)
 
 
+    @plot_timing.timed('make_plot')
     def make_plot(self):
         """
         Generate the actual plot object.
@@ -107,10 +125,12 @@ class RollingAveragePlot(Plot):
     def handle_team_logos(self, df=None, alpha=0.75):
         """
         Add the team logo to the first and last point of each line.
+
+        :return dict: The two logo artists added for each team, keyed by team.
         """
         if df is None:
             df = self.df
-        logos = list()
+        logos = dict()
         for team in set(df['team']):
             x_last = list(df.filter(pl.col('team') == team)[self.x_col])[-1]
             y_last = list(df.filter(pl.col('team') == team)[self.y_col])[-1]
@@ -118,7 +138,7 @@ class RollingAveragePlot(Plot):
             artist_box = AnnotationBbox(self.get_logo_marker(team, alpha=alpha, sport=self.sport),
                                         xy=(x_last, y_last),
                                         frameon=False)
-            self.axis.add_artist(artist_box)
+            last_logo = self.axis.add_artist(artist_box)
 
             x_first = list(df.filter(pl.col('team') == team)[self.x_col])[0]
             y_first = list(df.filter(pl.col('team') == team)[self.y_col])[0]
@@ -126,8 +146,8 @@ class RollingAveragePlot(Plot):
             artist_box = AnnotationBbox(self.get_logo_marker(team, alpha=alpha, sport=self.sport),
                                         xy=(x_first, y_first),
                                         frameon=False)
-            logo = self.axis.add_artist(artist_box)
-            logos.append(logo)
+            first_logo = self.axis.add_artist(artist_box)
+            logos[team] = [first_logo, last_logo]
         return logos
 
 
@@ -135,20 +155,20 @@ class RollingAveragePlot(Plot):
         """
         Given a multiline_key, for each distinct value in the column corresponding to that key,
         add a single line plot for the dataframe filtered on that value.
+
+        :return dict: The line added for each value of the multiline_key, keyed by that value.
         """
         if df is None:
             df = self.df
         keys = set(df[self.multiline_key])
-        lines = list()
+        lines = dict()
+        smoothed = self.smooth_lines(df, keys)
+        max_points = pixel_budget(self.axis) if self.downsample_lines else None
         for key in keys:
-            individual_df = df.filter(pl.col(self.multiline_key) == key)
-
-            # Add a bit of smoothing
-            x_col = individual_df[self.x_col]
-            y_col = individual_df[self.y_col]
-            new_x = np.linspace(x_col.min(), x_col.max(), 300)
-            spl = make_interp_spline(x_col, y_col, k=3)
-            y_smooth = spl(new_x)
+            # Add a bit of smoothing, computed once per line and cached
+            new_x, y_smooth = smoothed[key]
+            if max_points:
+                new_x, y_smooth = downsample(new_x, y_smooth, max_points)
 
             color = 'black'
             if self.add_team_logos:  # If we're adding team logos, color the lines by team color
@@ -157,12 +177,56 @@ class RollingAveragePlot(Plot):
                 elif self.sport == 'baseball':
                     color = mlb_label_colors[key]['line']
             #self.axis.plot(individual_df[self.x_col], individual_df[self.y_col], color=color,
-            line = self.axis.plot(new_x, y_smooth, color=color, alpha=alpha,
-                                  linewidth=linewidth)
-            lines.append(line)
+            line, = self.axis.plot(new_x, y_smooth, color=color, alpha=alpha,
+                                   linewidth=linewidth)
+            lines[key] = line
 
         return lines
 
+
+    def smooth_lines(self, df, keys):
+        """
+        Returns the smoothed points of the line for each of the given keys.
+
+        Smoothed lines are cached by their key and raw data, so they are only computed once no
+        matter how many times the same lines are drawn. Any missing lines which share the same
+        x-values (e.g. every team over the same games) are fit as a single vectorized spline.
+
+        :param DataFrame df: DataFrame holding every line, see `plot_multilines`.
+        :param set keys: The values of self.multiline_key to smooth.
+        :return dict: Tuple of (x, y) numpy arrays for each key.
+        """
+        smoothed = dict()
+        # Lines still to be fit, grouped by their x-values
+        pending = dict()
+        for key in keys:
+            individual_df = df.filter(pl.col(self.multiline_key) == key)
+            x_col = individual_df[self.x_col].to_numpy()
+            y_col = individual_df[self.y_col].to_numpy()
+            num_points = SMOOTHING_POINTS
+            if self.downsample_lines:
+                num_points = max(SMOOTHING_POINTS, SMOOTHING_POINTS_PER_VALUE * len(x_col))
+            cache_key = (key, num_points, x_col.tobytes(), y_col.tobytes())
+            if cache_key in _smoothed_lines:
+                smoothed[key] = _smoothed_lines[cache_key]
+            else:
+                pending.setdefault((num_points, x_col.tobytes()),
+                                   (num_points, x_col, []))[2].append((key, cache_key, y_col))
+
+        if len(_smoothed_lines) > MAX_CACHED_LINES:
+            _smoothed_lines.clear()
+
+        for num_points, x_col, group in pending.values():
+            new_x = np.linspace(x_col.min(), x_col.max(), num_points)
+            # Each column of y is one line, all fit and evaluated together
+            spl = make_interp_spline(x_col, np.column_stack([y for _, _, y in group]), k=3)
+            y_smooth = spl(new_x)
+            for i, (key, cache_key, _) in enumerate(group):
+                smoothed[key] = _smoothed_lines[cache_key] = (new_x, y_smooth[:, i])
+
+        return smoothed
+
+
     def add_x_axis(self):
         """
         Draws the x-axis at the y-midpoint.
@@ -8,6 +8,7 @@ from mpl_toolkits.axes_grid1.inset_locator import inset_axes
 from plot_types.plot import Plot
 from util.helpers import total_toi_as_timestamp, ratio_to_color
 from util.color_maps import label_colors
+from util import plot_timing
 
 
 # Dimensions for the boxes holding the goal/xgoal values
@@ -58,6 +59,7 @@ class ScoreBoardPlot(Plot):
         self.fig = plt.figure(figsize=self.size)
         self.axis = self.fig.add_subplot(111)
 
+    @plot_timing.timed('make_plot')
     def make_plot(self):
         """
         Assembles the Plot object.
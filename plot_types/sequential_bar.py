@@ -12,6 +12,7 @@ from matplotlib.container import BarContainer
 
 from plot_types.plot import Plot, FancyAxes
 from util.font_dicts import game_report_label_text_params as label_params
+from util import plot_timing
 
 COLORS = ['blue', 'orange', 'green', 'red', 'purple']
 
@@ -36,10 +37,11 @@ class SequentialBarPlot(Plot):
             size=(12, 8),
             figure=None,
             axis=None,
-            data_disclaimer='nst'):
+            data_disclaimer='nst',
+            template=None):
 
         super().__init__(title=title, subtitle=subtitle, filename=filename, size=size,
-                         data_disclaimer=data_disclaimer)
+                         data_disclaimer=data_disclaimer, template=template)
 
         self.fig = plt.figure(figsize=self.size) if figure is None else figure
         self.axis = self.fig.add_subplot(111, axes_class=FancyAxes) if axis is None else axis
@@ -56,11 +58,10 @@ class SequentialBarPlot(Plot):
         self.x_label = x_label
         self.y_label = y_label
 
+    @plot_timing.timed('make_plot')
     def make_plot(self):
         """Generate the actual plot object."""
 
-        self.set_title()
-
         # Gets a list of colors that will be used to color the bars in the proper sequence
         color_list = self.get_color_sequence()
 
@@ -81,21 +82,19 @@ class SequentialBarPlot(Plot):
         else:
             # Otherwise use the provided value
             self.axis.set_ylim(self.y_max * -1, self.y_max)
-            self.axis.set_yticks(range(-1 * (self.y_max) + 1, self.y_max))
-
-        self.axis.set_ylabel(self.y_label, fontdict=label_params)
 
         # Set the x-range to be +/-1 the values of the x-column (this will usually be something
         # like game #)
         self.axis.set_xlim(min(self.df[self.x_col]) - 1, max(self.df[self.x_col]) + 1)
-				
-				# xticks will start from 0 and go up by `xticks_step_size`. Remove the first element from the list
-				# to not show 0
-        xticks_step_size = 5
-        self.axis.set_xticks(list(range(0, max(self.df[self.x_col]) + 1, xticks_step_size))[1:])
-        self.axis.set_xlabel(self.x_label, fontdict=label_params)
 
-        self.axis.tick_params(colors='antiquewhite', which='both')
+        # The axes are the same for every goalie with the same number of games, so can come from
+        # a cached template if one was requested
+        if not self.load_template(self.x_label, self.y_label, self.y_max,
+                                  self.axis.get_xlim(), self.axis.get_ylim()):
+            self.add_scaffold()
+        self.mark_scaffold()
+
+        self.set_title()
 
         bars = self.axis.bar(self.df[self.x_col], self.df[self.y_col], color=color_list,
                       alpha=0.6, label=bar_labels)
@@ -120,6 +119,22 @@ class SequentialBarPlot(Plot):
         self.save_plot()
 
 
+    def add_scaffold(self):
+        """ Adds the static parts of the plot, i.e. the axis ticks and labels. """
+        if self.y_max != 0:
+            self.axis.set_yticks(range(-1 * (self.y_max) + 1, self.y_max))
+
+        self.axis.set_ylabel(self.y_label, fontdict=label_params)
+
+        # xticks will start from 0 and go up by `xticks_step_size`. Remove the first element from
+        # the list to not show 0
+        xticks_step_size = 5
+        self.axis.set_xticks(list(range(0, int(self.axis.get_xlim()[1]), xticks_step_size))[1:])
+        self.axis.set_xlabel(self.x_label, fontdict=label_params)
+
+        self.axis.tick_params(colors='antiquewhite', which='both')
+
+
     def get_color_sequence(self):
         """ Creates a list of colors for the bars corresponding to each row, where the color is 
         determined by the value in the selector column.
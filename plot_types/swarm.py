@@ -1,16 +1,21 @@
+from __future__ import annotations
+
 import matplotlib.pyplot as plt
 import matplotlib.patheffects as PathEffects
 import matplotlib.transforms as transforms
 from matplotlib.offsetbox import AnnotationBbox
 from matplotlib.patches import Rectangle
-import seaborn as sns
-import pandas as pd
-import polars as pl
 
 from plot_types.plot import Plot, FancyAxes
 from util.font_dicts import game_report_label_text_params as label_params
 from util.helpers import ratio_to_color
 from util.color_maps import mlb_label_colors
+from util.lazy_import import lazy_import
+from util import plot_timing
+
+# seaborn and pandas are slow to import, so only load them once a swarm is actually drawn
+sns = lazy_import('seaborn')
+pd = lazy_import('pandas')
 
 PRIMARY_COLOR = '#cccccc'
 SECONDARY_COLOR = '#999999'
@@ -63,6 +68,7 @@ class SwarmPlot(Plot):
         self.axis.set_xlabel('')
 
 
+    @plot_timing.timed('make_plot')
     def make_plot(self):
         """
         Method to assemble the plot object.
@@ -91,9 +97,11 @@ class SwarmPlot(Plot):
                                             box_alignment=(1, 0.5),
                                             xycoords='axes fraction', zorder=-11))
 
-        # Now plot every player in the full sample
-        self.axis = sns.swarmplot(y=self.column, x='day', data=self.df, color=PRIMARY_COLOR,
-                                  size=4.5)
+        # Now plot every player in the full sample. seaborn lays out the swarm by drawing the
+        # figure, so this is where most of the time goes.
+        with self.timer.phase('swarm_layout'):
+            self.axis = sns.swarmplot(y=self.column, x='day', data=self.df, color=PRIMARY_COLOR,
+                                      size=4.5)
 
         # If dealing with a second category of points, call a seperate method to handle
         # the bulk of the plotting.
@@ -109,9 +117,10 @@ class SwarmPlot(Plot):
         team_df = self.df[self.df['team'] == self.team]
         team_df = team_df.sort_values(by=[self.column], ascending=False)[0:12]
 
-        team_points = sns.swarmplot(y=self.column, x='day', data=team_df,
-                                    color='steelblue',
-                                    zorder=9)
+        with self.timer.phase('swarm_layout'):
+            team_points = sns.swarmplot(y=self.column, x='day', data=team_df,
+                                        color='steelblue',
+                                        zorder=9)
 
         # Get the xy-coords of the point for every player on the team
         # team_points.collections refers to a list of the collections of objects in
@@ -119,7 +128,8 @@ class SwarmPlot(Plot):
         team_coords = team_points.collections[-1].get_offsets()
 
         # Add labels for every player on team
-        self.label_team_players(team_df, team_coords)
+        with self.timer.phase('logos'):
+            self.label_team_players(team_df, team_coords)
 
         if self.table_columns is not None:
             self.add_table(team_df)
@@ -148,8 +158,9 @@ class SwarmPlot(Plot):
         df_b['rank'] = df_b.apply(lambda row: row.name, axis=1)
 
         # Add all players in league from df_a to swarm plot with slightly different color
-        self.axis = sns.swarmplot(y=self.column, x='day', data=df_a, color=SECONDARY_COLOR,
-                                  size=4.5)
+        with self.timer.phase('swarm_layout'):
+            self.axis = sns.swarmplot(y=self.column, x='day', data=df_a, color=SECONDARY_COLOR,
+                                      size=4.5)
 
         # Add two lines denoting the averages for each category
         self.draw_average_line(label='Starter\nAverage', avg_value=df_a[self.column].mean())
@@ -169,14 +180,16 @@ class SwarmPlot(Plot):
             #team_df = team_df.sort_values(by=[self.column], ascending=False)
 
             # And add to plot
-            team_points = sns.swarmplot(y=self.column, x='day', data=team_df,
-                                        color='steelblue',
-                                        #color=mlb_label_colors[self.team]['line'],
-                                        zorder=9)
+            with self.timer.phase('swarm_layout'):
+                team_points = sns.swarmplot(y=self.column, x='day', data=team_df,
+                                            color='steelblue',
+                                            #color=mlb_label_colors[self.team]['line'],
+                                            zorder=9)
             team_coords = team_points.collections[-1].get_offsets()
 
             # Then add labels
-            self.label_team_players(team_df, team_coords, vert_offset=0.3*i)
+            with self.timer.phase('logos'):
+                self.label_team_players(team_df, team_coords, vert_offset=0.3*i)
 
             # And save to list for creating combined table
             combined_dfs.append(team_df)
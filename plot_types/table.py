@@ -1,11 +1,11 @@
 import matplotlib.pyplot as plt
 import matplotlib.patheffects as PathEffects
-import seaborn as sns
 from blume.table import table
 
 from plot_types.plot import Plot, FancyAxes
 from util.font_dicts import game_report_label_text_params as label_params
 from util.helpers import ratio_to_color
+from util import plot_timing
 
 
 TOP_LEFT_X = 2
@@ -61,6 +61,7 @@ class TablePlot(Plot):
         self.bottom_right = (0, 0)
 
 
+    @plot_timing.timed('make_plot')
     def make_plot(self):
 
         #self.draw_table()
@@ -0,0 +1,107 @@
+"""
+Module for reusing the static scaffold of a figure across many renders of the same chart type.
+
+For the team-by-team batches (skater ratios, skater points, GSAx bars), everything except the
+highlighted data is identical for every team: the rounded FancyAxes patch, the facecolors, the
+data disclaimer, the axis labels and ticks, ratio lines, quadrant labels, percentile bands, etc.
+
+The first render of a chart draws the full figure once with the data layers hidden, and keeps the
+rasterized result as a FigureTemplate. Every subsequent render with the same scaffold skips
+creating those artists entirely: it restores the cached background and draws only the dynamic
+layers (logos, labels, bars, titles) on top of it, via blitting.
+
+Templates are kept in memory for the lifetime of the process, so they pay off in batch scripts
+that loop over every team, or in the render daemon.
+"""
+
+from PIL import Image
+
+# Maximum number of templates kept in memory, oldest are dropped first
+MAX_TEMPLATES = 32
+
+_templates = {}
+
+
+class FigureTemplate:
+    """
+    The rasterized scaffold of a figure, along with the geometry it was rendered at.
+
+    :param BufferRegion background: Region copied from the canvas with the data layers hidden.
+    :param tuple size: Size of the canvas, in pixels.
+    """
+    def __init__(self, background, size):
+        self.background = background
+        self.size = size
+
+
+def get_template(key):
+    """
+    Returns the cached FigureTemplate for the given key, or None if there isn't one.
+    """
+    return _templates.get(key)
+
+
+def clear_templates():
+    """
+    Drops every cached template, e.g. after changing the styling mid-process.
+    """
+    _templates.clear()
+
+
+def dynamic_artists(fig, axis, scaffold):
+    """
+    Returns every artist added to the figure or axis since the scaffold was marked, in the order
+    matplotlib would draw them (axes children first, then figure-level text, each by zorder).
+
+    :param Figure fig: The figure being rendered.
+    :param Axes axis: The main axis of the figure.
+    :param set scaffold: The artists which existed when the scaffold was marked.
+    """
+    axis_artists = [a for a in axis.get_children() if a not in scaffold]
+    fig_artists = [a for a in fig.get_children() if a not in scaffold and a not in fig.axes]
+    return sorted(axis_artists, key=lambda a: a.get_zorder()) + \
+           sorted(fig_artists, key=lambda a: a.get_zorder())
+
+
+def capture_template(key, fig, artists):
+    """
+    Draws the figure with the given dynamic artists hidden, and caches the result as the template
+    for `key`.
+
+    :param tuple key: Template key, see Plot.load_template.
+    :param Figure fig: The fully assembled figure.
+    :param list artists: The dynamic artists, to be left out of the background.
+    :return FigureTemplate: The new template.
+    """
+    visible = [a for a in artists if a.get_visible()]
+    for artist in visible:
+        artist.set_visible(False)
+    fig.canvas.draw()
+    template = FigureTemplate(fig.canvas.copy_from_bbox(fig.bbox),
+                              fig.canvas.get_width_height())
+    for artist in visible:
+        artist.set_visible(True)
+
+    if len(_templates) >= MAX_TEMPLATES:
+        del _templates[next(iter(_templates))]
+    _templates[key] = template
+    return template
+
+
+def stamp_template(template, fig, artists, filename):
+    """
+    Restores the template background onto the figure's canvas, draws the dynamic artists on top
+    and saves the result as a PNG.
+
+    :param FigureTemplate template: The cached scaffold.
+    :param Figure fig: Figure holding the dynamic artists, the same size as the template.
+    :param list artists: The dynamic artists to draw.
+    :param str filename: Output filename.
+    """
+    renderer = fig.canvas.get_renderer()
+    fig.canvas.restore_region(template.background)
+    for artist in artists:
+        artist.draw(renderer)
+
+    Image.frombuffer('RGBA', template.size, fig.canvas.buffer_rgba(), 'raw', 'RGBA', 0, 1) \
+        .save(filename, dpi=(fig.dpi, fig.dpi))
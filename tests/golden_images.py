@@ -0,0 +1,143 @@
+"""
+Golden-image regression harness: renders every chart type from the synthetic data in
+benchmarks/fixtures.py, the same way as the benchmark suite (benchmarks/plot_suite.py), and
+compares each chart with its stored golden image in tests/goldens/ using util/image_diff.py.
+
+Cases are rendered in parallel, each in a fresh process with a fixed hash seed, one per CPU at a
+time. When a chart no longer matches its golden, a heatmap of the changed pixels is written to
+tests/golden_diffs/.
+
+Run from the repo root, with the repo on PYTHONPATH:
+    python tests/golden_images.py              # compare against the goldens
+    python tests/golden_images.py --update     # store the current charts as the goldens
+
+or through pytest, with `python -m pytest tests/test_golden_images.py`. Only update the goldens
+after checking that a change to the charts is intended.
+"""
+
+import os
+import sys
+import argparse
+import multiprocessing
+
+from benchmarks import plot_suite
+from util import image_diff
+
+## Constants #########################################################################
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+GOLDEN_DIR = os.path.join(TESTS_DIR, 'goldens')
+DIFF_DIR = os.path.join(TESTS_DIR, 'golden_diffs')
+
+# Outputs of a case that are compared, anything else it writes is ignored
+IMAGE_EXTENSIONS = ('.png', '.gif')
+# String hash seed the charts are rendered with
+HASH_SEED = '0'
+## End Constants #####################################################################
+
+
+def golden_name(case, output):
+    """ Filename of the golden for one output of a case, e.g. 'game_report__game_report.png'. """
+    return f'{case}__{output}'
+
+
+def render_case(case):
+    """
+    Renders a case in a scratch directory.
+
+    :param str case: Name of a case in benchmarks/plot_suite.py.
+    :return dict: The contents of each image it wrote, by filename.
+    """
+    outputs = {}
+    with plot_suite.scratch_directory() as tmp:
+        plot_suite.run_once(plot_suite.CASES[case])
+        for filename in sorted(os.listdir(tmp)):
+            if filename.endswith(IMAGE_EXTENSIONS):
+                with open(os.path.join(tmp, filename), 'rb') as fi:
+                    outputs[filename] = fi.read()
+    return outputs
+
+
+def check_case(case, update=False):
+    """
+    Renders a case and compares each of its outputs with the golden, writing a heatmap of the
+    differences for any that don't match. Runs in a worker process.
+
+    :param str case: Name of a case in benchmarks/plot_suite.py.
+    :param bool update: Store the outputs as the goldens instead.
+    :return list[dict]: For each output, its status ('match', 'changed', 'missing' when there's
+                        no golden, or 'updated'), along with the comparison, if any.
+    """
+    import io
+
+    results = []
+    for output, data in render_case(case).items():
+        result = {'case': case, 'output': output}
+        golden = os.path.join(GOLDEN_DIR, golden_name(case, output))
+
+        if update:
+            with open(golden, 'wb') as fo:
+                fo.write(data)
+            result['status'] = 'updated'
+        elif not os.path.exists(golden):
+            result['status'] = 'missing'
+        else:
+            expected = image_diff.load_image(golden)
+            actual = image_diff.load_image(io.BytesIO(data))
+            result.update(image_diff.compare(expected, actual))
+            result['status'] = 'match' if image_diff.matches(result) else 'changed'
+            if result['status'] == 'changed':
+                result['heatmap'] = os.path.join(DIFF_DIR,
+                                                 f'{golden_name(case, output)}.diff.png')
+                image_diff.write_heatmap(expected, actual, result['heatmap'])
+        results.append(result)
+    return results
+
+
+def check_all(cases, update=False, processes=None):
+    """
+    Checks every case against its goldens, in parallel.
+
+    :param list[str] cases: Names of cases in benchmarks/plot_suite.py.
+    :param bool update: Store the outputs as the goldens instead.
+    :param int processes: Number of worker processes, defaults to the number of CPUs.
+    :return list[dict]: The results for every output of every case, see `check_case`.
+    """
+    os.makedirs(GOLDEN_DIR if update else DIFF_DIR, exist_ok=True)
+    processes = min(processes or os.cpu_count() or 1, len(cases))
+
+    # Workers are started fresh, with a fixed hash seed: some charts order teams by iterating
+    # over a set (e.g. which side of the scoreboard each team is on), which otherwise changes
+    # from one interpreter to the next
+    os.environ['PYTHONHASHSEED'] = HASH_SEED
+    context = multiprocessing.get_context('spawn')
+
+    # A fresh process for every case, since rendering one chart can leave state behind that
+    # changes the next (e.g. Plot.set_title changing the shared subtitle font size)
+    with context.Pool(processes, maxtasksperchild=1) as pool:
+        per_case = pool.starmap(check_case, [(case, update) for case in cases], chunksize=1)
+
+    return [result for results in per_case for result in results]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-k', '--cases', nargs='+', choices=list(plot_suite.CASES),
+                        default=list(plot_suite.CASES),
+                        help='Cases to check, defaults to all of them.')
+    parser.add_argument('-j', '--processes', type=int, default=None,
+                        help='Number of worker processes, defaults to the number of CPUs.')
+    parser.add_argument('--update', action='store_true',
+                        help='Store the current charts as the goldens.')
+    args = parser.parse_args()
+
+    results = check_all(args.cases, update=args.update, processes=args.processes)
+    for result in results:
+        line = f"{result['case']:<30}{result['output']:<38}{result['status']:<9}"
+        if 'ssim' in result:
+            line += f"SSIM {result['ssim']:.4f}, {result['changed_pixels']} pixels changed"
+        if 'heatmap' in result:
+            line += f" ({result['heatmap']})"
+        print(line)
+
+    if any(result['status'] in ('changed', 'missing') for result in results):
+        sys.exit(1)
@@ -0,0 +1,31 @@
+"""
+Tests for rendering the frames of a rolling average animation, which forked workers copy into
+shared memory rather than sending back through a pipe.
+
+Run from the repo root with
+    python -m pytest tests/test_animated_rolling_average.py
+"""
+
+import multiprocessing
+
+import matplotlib
+matplotlib.use('agg')
+import matplotlib.pyplot as plt
+import pytest
+
+from benchmarks.gif_writer_benchmark import TEAMS, make_frames
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(),
+                    reason='frames are only rendered in workers where processes can fork')
+@pytest.mark.parametrize('workers', [2, 3])
+def test_workers_render_the_same_frames_as_one_process(workers):
+    # Five frames, so the last batch of slots is only partly used
+    serial, size = make_frames(5, workers=1)
+    parallel, parallel_size = make_frames(5, workers=workers)
+    plt.close('all')
+    assert parallel_size == size
+    assert len(parallel) == len(serial) == 5
+    assert all(frame == expected for frame, expected in zip(parallel, serial))
+    # Every frame highlights a different team
+    assert len(set(serial)) == len(TEAMS[:5])
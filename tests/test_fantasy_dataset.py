@@ -0,0 +1,94 @@
+"""
+Tests for loading the fantasy dashboard's store from the partitioned Parquet dataset, whose
+partitions are only read, with just the columns needed, when their data is first asked for.
+
+Run from the repo root with
+    python -m pytest tests/test_fantasy_dataset.py
+"""
+
+import json
+
+import pandas as pd
+import pytest
+from polars.testing import assert_frame_equal
+
+from benchmarks.fantasy_dataset_benchmark import write_csvs
+from dashboard import fantasy_data, fantasy_dataset
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """ The same data as CSVs and as a dataset, returned as (csv_dir, dataset_dir). """
+    csv_dir = tmp_path / 'data'
+    dataset_dir = tmp_path / fantasy_dataset.DATASET_NAME
+    csv_dir.mkdir()
+    write_csvs(str(csv_dir), players_per_term=20)
+    fantasy_dataset.convert_csv_dir(str(csv_dir), str(dataset_dir))
+    return str(csv_dir), str(dataset_dir)
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """ Records the (position, term, columns) of every partition read. """
+    calls = []
+    read_partition = fantasy_dataset.Dataset.read_partition
+
+    def recording_read(self, pos, term, columns=None):
+        calls.append((pos, term, columns))
+        return read_partition(self, pos, term, columns)
+
+    monkeypatch.setattr(fantasy_dataset.Dataset, 'read_partition', recording_read)
+    return calls
+
+
+def test_dataset_store_matches_csv_store(sources):
+    csv_dir, dataset_dir = sources
+    fantasy_data.load_store(csv_dir)
+    expected = {pos: (fantasy_data.get_freeze_rows(pos),
+                      {term: (fantasy_data.get_table(pos, term),
+                              fantasy_data.get_plot_data(pos, term))
+                       for term in fantasy_data.TERMS})
+                for pos in fantasy_data.POSITIONS}
+
+    fantasy_data.load_store_from_dataset(dataset_dir)
+    for pos, (freeze, terms) in expected.items():
+        assert fantasy_data.get_freeze_rows(pos) == freeze
+        for term, (table, plot_data) in terms.items():
+            pd.testing.assert_frame_equal(fantasy_data.get_table(pos, term), table,
+                                          check_dtype=False)
+            assert_frame_equal(fantasy_data.get_plot_data(pos, term), plot_data,
+                               check_dtypes=False)
+
+
+def test_partitions_are_read_on_demand(sources, reads):
+    fantasy_data.load_store_from_dataset(sources[1])
+    # Loading only reads what's needed for the rows to freeze
+    assert len(reads) == len(fantasy_data.POSITIONS) * len(fantasy_data.TERMS)
+    assert all(columns == ['Name', 'on_team'] for _, _, columns in reads)
+    reads.clear()
+
+    fantasy_data.get_plot_data('SP', 'week')
+    fantasy_data.get_plot_data('SP', 'week')
+    assert reads == [('SP', 'week', ['Name', 'Team', 'K-BB%', 'Stuff+'])]
+    reads.clear()
+
+    table = fantasy_data.get_table('SS', 'month')
+    assert fantasy_data.get_table('SS', 'month') is table
+    assert len(reads) == 1
+    pos, term, columns = reads[0]
+    assert (pos, term) == ('SS', 'month')
+    assert not set(columns) & set(fantasy_data.HIDDEN_COLUMNS)
+    assert columns == list(table.columns)
+
+
+def test_other_schema_version_is_refused(sources):
+    dataset_dir = sources[1]
+    schema_path = f'{dataset_dir}/{fantasy_dataset.SCHEMA_FILENAME}'
+    with open(schema_path, encoding='utf-8') as fo:
+        schema = json.load(fo)
+    schema['schema_version'] = fantasy_dataset.SCHEMA_VERSION + 1
+    with open(schema_path, 'w', encoding='utf-8') as fo:
+        json.dump(schema, fo)
+
+    with pytest.raises(ValueError):
+        fantasy_data.load_store_from_dataset(dataset_dir)
@@ -0,0 +1,70 @@
+"""
+Tests for serving the fantasy dashboard's pre-rendered figures across data refreshes and failed
+renders, with the renders themselves replaced by a stand-in that returns a string.
+
+Run from the repo root with
+    python -m pytest tests/test_fantasy_figures.py
+"""
+
+import asyncio
+from concurrent.futures import Future
+
+import pytest
+
+from dashboard import fantasy_figures
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    """ Renders that return '<pos> <term> <n>' for the n-th render, after any failures set. """
+    calls = {'count': 0, 'failures': 0}
+
+    def render_figure(pos, term):
+        calls['count'] += 1
+        if calls['failures']:
+            calls['failures'] -= 1
+            raise RuntimeError('render failed')
+        return f"{pos} {term} {calls['count']}"
+
+    monkeypatch.setattr(fantasy_figures, 'render_figure', render_figure)
+    monkeypatch.setattr(fantasy_figures, '_generation', {'version': None, 'figures': {}})
+    return calls
+
+
+def test_failed_render_is_submitted_again(renders):
+    renders['failures'] = 1
+    with pytest.raises(RuntimeError):
+        fantasy_figures.figure_future('SP', 'week').result()
+    assert fantasy_figures.figure_future('SP', 'week').result() == 'SP week 2'
+
+
+def test_get_figure_retries_a_failed_render(renders):
+    renders['failures'] = 1
+    assert asyncio.run(fantasy_figures.get_figure('SP', 'week')) == 'SP week 2'
+
+
+def test_get_figure_survives_a_refresh(renders):
+    # A render for the old data that hasn't started yet when new data is loaded
+    fantasy_figures._generation.update({'version': 'old', 'figures': {('SP', 'week'): Future()}})
+
+    async def wait_through_refresh():
+        request = asyncio.create_task(fantasy_figures.get_figure('SP', 'week'))
+        await asyncio.sleep(0)
+        await asyncio.to_thread(fantasy_figures.prerender, 'new')
+        return await request
+
+    assert asyncio.run(wait_through_refresh()).startswith('SP week')
+
+
+def test_cancelled_request_is_not_retried(renders):
+    fantasy_figures._generation['figures'][('SP', 'week')] = Future()
+
+    async def cancel_request():
+        request = asyncio.create_task(fantasy_figures.get_figure('SP', 'week'))
+        await asyncio.sleep(0)
+        request.cancel()
+        await request
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(cancel_request())
+    assert renders['count'] == 0
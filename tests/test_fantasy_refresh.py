@@ -0,0 +1,166 @@
+"""
+Tests for the fantasy dashboard's background data refresh, against a local HTTP server standing
+in for the GitHub artifacts API.
+
+Run from the repo root with
+    python -m pytest tests/test_fantasy_refresh.py
+"""
+
+import io
+import os
+import json
+import hashlib
+import zipfile
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from dashboard import fantasy_data, fantasy_dataset, fantasy_refresh
+
+
+def make_position_df(on_team_count):
+    """ Data for one position, with `on_team_count` players on my team. """
+    return pd.DataFrame({
+        'Name': [f'Player {i}' for i in range(10)] * len(fantasy_data.TERMS),
+        'Team': 'NYY',
+        'xwOBA': 0.3, 'wRC+': 100, 'K-BB%': 0.1, 'Stuff+': 100,
+        'on_team': [i < on_team_count for i in range(10)] * len(fantasy_data.TERMS),
+        'term': [term for term in fantasy_data.TERMS for _ in range(10)],
+    })
+
+
+def make_artifact_zip(on_team_count):
+    """ Builds a data artifact zip of CSVs, with `on_team_count` players on my team. """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for pos in fantasy_data.POSITIONS:
+            archive.writestr(f'fantasy_data_{pos}.csv',
+                             make_position_df(on_team_count).to_csv(index=False))
+    return buffer.getvalue()
+
+
+def make_dataset_zip(on_team_count):
+    """ Same as `make_artifact_zip`, with the data as a partitioned Parquet dataset. """
+    buffer = io.BytesIO()
+    with tempfile.TemporaryDirectory() as tmp, zipfile.ZipFile(buffer, 'w') as archive:
+        fantasy_dataset.write_dataset({pos: pl.from_pandas(make_position_df(on_team_count))
+                                       for pos in fantasy_data.POSITIONS}, tmp)
+        for root, _, files in os.walk(tmp):
+            for filename in files:
+                path = os.path.join(root, filename)
+                archive.write(path, os.path.join(fantasy_dataset.DATASET_NAME,
+                                                 os.path.relpath(path, tmp)))
+    return buffer.getvalue()
+
+
+class StandInAPI:
+    """ Serves a single data artifact, counting how often it's downloaded. """
+    def __init__(self):
+        self.artifact_id = 0
+        self.content = b''
+        self.downloads = 0
+        self.corrupt = False
+
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.startswith('/actions/artifacts'):
+                    body = json.dumps({'artifacts': [api.artifact(self.server.server_port)]})
+                    self.reply(body.encode(), 'application/json')
+                elif self.path == f'/download/{api.artifact_id}':
+                    api.downloads += 1
+                    self.reply(api.content[:-1] if api.corrupt else api.content,
+                               'application/zip')
+                else:
+                    self.send_error(404)
+
+            def reply(self, body, content_type):
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('localhost', 0), Handler)
+        self.url = f'http://localhost:{self.server.server_port}'
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def publish(self, content):
+        self.artifact_id += 1
+        self.content = content
+
+    def artifact(self, port):
+        return {
+            'id': self.artifact_id,
+            'name': fantasy_refresh.ARTIFACT_NAME,
+            'expired': False,
+            'created_at': '2026-10-19T09:00:00Z',
+            'digest': f'sha256:{hashlib.sha256(self.content).hexdigest()}',
+            'archive_download_url': f'http://localhost:{port}/download/{self.artifact_id}',
+        }
+
+
+@pytest.fixture
+def api():
+    stand_in = StandInAPI()
+    fantasy_refresh._loaded['digest'] = None
+    yield stand_in
+    stand_in.server.shutdown()
+
+
+def test_refresh_loads_and_skips_unchanged_artifact(api):
+    api.publish(make_artifact_zip(on_team_count=2))
+    updates = []
+
+    assert fantasy_refresh.refresh(api.url, on_update=updates.append)
+    assert fantasy_data.get_freeze_rows('SS') == [0, 1]
+    assert fantasy_data.get_table('SS', 'week')['Name'].iloc[0] == 'P. 0'
+    assert len(updates) == 1
+
+    # Same artifact, so nothing is downloaded or swapped
+    assert not fantasy_refresh.refresh(api.url, on_update=updates.append)
+    assert api.downloads == 1
+    assert len(updates) == 1
+
+
+def test_refresh_hot_swaps_new_artifact(api):
+    api.publish(make_artifact_zip(on_team_count=2))
+    fantasy_refresh.refresh(api.url)
+
+    api.publish(make_artifact_zip(on_team_count=4))
+    assert fantasy_refresh.refresh(api.url)
+    assert fantasy_data.get_freeze_rows('SS') == [0, 1, 2, 3]
+    assert api.downloads == 2
+
+
+def test_refresh_rejects_download_not_matching_digest(api):
+    api.publish(make_artifact_zip(on_team_count=2))
+    fantasy_refresh.refresh(api.url)
+
+    api.publish(make_artifact_zip(on_team_count=4))
+    api.corrupt = True
+    with pytest.raises(ValueError):
+        fantasy_refresh.refresh(api.url)
+
+    # The previous data stays in place
+    assert fantasy_data.get_freeze_rows('SS') == [0, 1]
+
+
+def test_refresh_reads_parquet_dataset(api):
+    api.publish(make_artifact_zip(on_team_count=2))
+    fantasy_refresh.refresh(api.url)
+    csv_table = fantasy_data.get_table('SP', 'season')
+
+    api.publish(make_dataset_zip(on_team_count=2))
+    assert fantasy_refresh.refresh(api.url)
+    pd.testing.assert_frame_equal(fantasy_data.get_table('SP', 'season'), csv_table,
+                                  check_dtype=False)
+    assert fantasy_data.get_freeze_rows('SP') == [0, 1]
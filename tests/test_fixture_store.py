@@ -0,0 +1,69 @@
+"""
+Tests for recording and replaying data library calls, with the synthetic data from
+benchmarks/fixtures.py standing in for the live pyhockey and pybaseball.
+
+Run from the repo root with
+    python -m pytest tests/test_fixture_store.py
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks import fixtures
+from util import fixture_store
+from util.lazy_import import lazy_import
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, 'pyhockey', fixtures.hockey)
+    monkeypatch.setitem(sys.modules, 'pybaseball', fixtures.baseball)
+    return fixture_store.FixtureStore(str(tmp_path))
+
+
+def test_replays_polars_frames(store):
+    recorded = fixture_store.RecordingModule('pyhockey', store).skater_games(season=2025)
+    replayed = fixture_store.ReplayModule('pyhockey', store).skater_games(season=2025)
+    assert replayed.equals(recorded)
+
+
+def test_replays_pandas_frames_with_their_index(store):
+    recorded = fixture_store.RecordingModule('pybaseball', store).schedule_and_record(2025, 'NYY')
+    replayed = fixture_store.ReplayModule('pybaseball', store).schedule_and_record(2025, 'NYY')
+    pd.testing.assert_frame_equal(replayed, recorded, check_index_type=False)
+
+
+def test_replays_missing_strings(store):
+    # pybaseball leaves the likes of 'Save' as NaN in the games without one
+    recorded = pd.DataFrame({'Save': ['Hader', np.nan, None], 'R': [5, 3, 2]})
+    store.save('pybaseball', 'schedule_and_record', (2025, 'HOU'), {}, recorded)
+    replayed = store.load('pybaseball', 'schedule_and_record', (2025, 'HOU'), {})
+    assert replayed['Save'].tolist()[0] == 'Hader'
+    assert replayed['Save'].isna().tolist() == [False, True, True]
+    assert replayed['R'].tolist() == [5, 3, 2]
+
+
+def test_numpy_arguments_match_python_ones(store):
+    fixture_store.RecordingModule('pyhockey', store).team_seasons(season=np.int64(2025))
+    replay = fixture_store.ReplayModule('pyhockey', store)
+    assert len(replay.team_seasons(season=2025)) == len(fixtures.NHL_TEAMS)
+
+
+def test_unrecorded_call_fails(store):
+    fixture_store.RecordingModule('pyhockey', store).team_seasons(season=2025)
+    with pytest.raises(fixture_store.FixtureNotFoundError):
+        fixture_store.ReplayModule('pyhockey', store).team_seasons(season=2024)
+
+
+def test_lazy_import_replays_in_replay_mode(store, monkeypatch):
+    monkeypatch.setenv(fixture_store.MODE_VAR, 'replay')
+    monkeypatch.setenv(fixture_store.STORE_VAR, store.directory)
+    monkeypatch.delitem(sys.modules, 'pyhockey')
+
+    ph = lazy_import('pyhockey')
+    assert isinstance(ph, fixture_store.ReplayModule)
+    with pytest.raises(fixture_store.FixtureNotFoundError):
+        ph.team_seasons(season=2025)
@@ -0,0 +1,34 @@
+"""
+Tests for the palette-optimized GIF writer, which keeps only the changed part of each frame
+until the palette is built.
+
+Run from the repo root with
+    python -m pytest tests/test_gif_writer.py
+"""
+
+import numpy as np
+from PIL import Image, ImageSequence
+
+from util.gif_writer import write_gif
+
+
+def test_frames_read_back_as_written(tmp_path):
+    width, height = 120, 80
+    frames = []
+    # One box moves down, except in the third frame, which repeats the second
+    for step in [0, 1, 1, 2, 3, 4]:
+        frame = np.zeros((height, width, 4), dtype=np.uint8)
+        frame[:, :] = (240, 240, 240, 255)
+        row = 10 + 8 * step
+        frame[row:row + 10, 20:60] = (200, 40, 40, 255)
+        frames.append(frame)
+
+    path = tmp_path / 'frames.gif'
+    write_gif((frame.tobytes() for frame in frames), (width, height), str(path))
+
+    with Image.open(path) as gif:
+        decoded = [np.asarray(frame.convert('RGB')) for frame in ImageSequence.Iterator(gif)]
+    assert len(decoded) == len(frames)
+    for frame, actual in zip(frames, decoded):
+        # 5 bits per channel, so colours come back within 8 of what was written
+        assert np.abs(actual.astype(int) - frame[:, :, :3]).max() < 8
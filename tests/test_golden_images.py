@@ -0,0 +1,33 @@
+"""
+Checks that every chart type still renders the same as its golden image, see
+tests/golden_images.py (which also updates the goldens after an intended change).
+
+Run from the repo root with
+    python -m pytest tests/test_golden_images.py
+"""
+
+import pytest
+
+from benchmarks import plot_suite
+# Imported from tests/, which pytest puts on the path
+import golden_images
+
+
+@pytest.fixture(scope='module')
+def results():
+    """ Every case rendered and compared once, in parallel, grouped by case. """
+    by_case = {}
+    for result in golden_images.check_all(list(plot_suite.CASES)):
+        by_case.setdefault(result['case'], []).append(result)
+    return by_case
+
+
+@pytest.mark.parametrize('case', list(plot_suite.CASES))
+def test_matches_golden(results, case):
+    assert results.get(case), f"{case} didn't write any images"
+    for result in results[case]:
+        assert result['status'] != 'missing', \
+            f"No golden for {result['output']}, store one with tests/golden_images.py --update"
+        assert result['status'] == 'match', \
+            f"{result['output']} changed: SSIM {result['ssim']:.4f}, " \
+            f"{result['changed_fraction']:.3%} of pixels changed, see {result['heatmap']}"
@@ -0,0 +1,159 @@
+"""
+Tests for the local DuckDB mirror of the hockey tables, synced from a DuckDB file filled with
+the synthetic data from benchmarks/fixtures.py standing in for MotherDuck.
+
+Run from the repo root with
+    python -m pytest tests/test_hockey_data.py
+"""
+
+import inspect
+
+import duckdb
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from benchmarks import fixtures
+from util import hockey_data
+
+SEASON = 2025
+
+
+def write_source(path, tables):
+    """ Writes frames to a DuckDB file, named as in MotherDuck after the pyhockey functions. """
+    conn = duckdb.connect(str(path))
+    for function, df in tables.items():
+        table = hockey_data.SOURCE_TABLES[function]
+        # Through Parquet, as handing a polars frame to DuckDB directly needs pyarrow
+        parquet = f'{path}.{table}.parquet'
+        df.write_parquet(parquet)
+        conn.execute(f"CREATE OR REPLACE TABLE {table} AS SELECT * FROM read_parquet('{parquet}')")
+    conn.close()
+
+
+@pytest.fixture
+def source(tmp_path):
+    """ Source database with every table, and the first half of the season's games played. """
+    games = fixtures.hockey.skater_games(season=SEASON)
+    first_half = games['gameID'].unique().sort().head(games['gameID'].n_unique() // 2)
+    # Season totals, and team games, for more than one situation, as in MotherDuck
+    tables = {table: pl.concat([getattr(fixtures.hockey, table)(season=SEASON, situation=situation)
+                                for situation in ['all', '5on5']])
+              for table in hockey_data.SEASON_TABLES + ('team_games',)}
+    tables['goalie_games'] = fixtures.hockey.goalie_games(season=SEASON)
+    tables['skater_games'] = games.filter(pl.col('gameID').is_in(first_half.implode()))
+
+    path = tmp_path / 'source.duckdb'
+    write_source(path, tables)
+    return path, games
+
+
+def count(mirror, query):
+    conn = duckdb.connect(str(mirror), read_only=True)
+    try:
+        return conn.execute(query).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_sync_copies_every_table(source, tmp_path):
+    path, _ = source
+    mirror = tmp_path / 'mirror.duckdb'
+    added = hockey_data.sync(seasons=[SEASON], mirror=str(mirror), source=str(path))
+
+    for function, table in hockey_data.SOURCE_TABLES.items():
+        assert added[function] == count(path, f"SELECT count(*) FROM {table}") > 0
+        assert count(mirror, f"SELECT count(*) FROM {table}") == added[function]
+
+
+def test_sync_appends_only_new_games(source, tmp_path):
+    path, games = source
+    mirror = tmp_path / 'mirror.duckdb'
+    hockey_data.sync(['skater_games'], [SEASON], mirror=str(mirror), source=str(path))
+    synced = count(mirror, "SELECT count(*) FROM skater_games")
+
+    # The rest of the season is played
+    write_source(path, {'skater_games': games})
+    added = hockey_data.sync(['skater_games'], [SEASON], mirror=str(mirror), source=str(path))
+
+    assert added['skater_games'] == len(games) - synced
+    assert count(mirror, "SELECT count(*) FROM skater_games") == len(games)
+    assert hockey_data.sync(['skater_games'], [SEASON], mirror=str(mirror),
+                            source=str(path))['skater_games'] == 0
+
+
+def test_sync_replaces_season_totals(source, tmp_path):
+    path, _ = source
+    mirror = tmp_path / 'mirror.duckdb'
+    for _ in range(2):
+        hockey_data.sync(['team_seasons'], [SEASON], mirror=str(mirror), source=str(path))
+    assert count(mirror, "SELECT count(*) FROM teams") == count(path, "SELECT count(*) FROM teams")
+
+
+def test_next_unreported_game(source, tmp_path):
+    path, _ = source
+    mirror = tmp_path / 'mirror.duckdb'
+    hockey_data.sync(['skater_games'], [SEASON], mirror=str(mirror), source=str(path))
+    conn = hockey_data.connect('local', str(mirror))
+    game_ids = sorted(row[0] for row in conn.execute(
+        "SELECT DISTINCT gameID FROM skater_games").fetchall())
+
+    assert hockey_data.next_unreported_game(0, SEASON, conn) == game_ids[0]
+    assert hockey_data.next_unreported_game(game_ids[3], SEASON, conn) == game_ids[4]
+    assert hockey_data.next_unreported_game(game_ids[-1], SEASON, conn) == 0
+    assert hockey_data.next_unreported_game(0, SEASON + 1, conn) == 0
+
+
+def test_fetch_keeps_only_the_chart_columns():
+    columns = ['name', 'team', 'xGoals', 'goals']
+    df = hockey_data.fetch(fixtures.hockey, 'goalie_seasons', columns, season=SEASON, team='TOR')
+    assert df.columns == columns
+    assert df.equals(fixtures.hockey.goalie_seasons(season=SEASON, team='TOR').select(columns))
+
+
+def test_local_backend_has_pyhockeys_signatures():
+    pyhockey = pytest.importorskip('pyhockey')
+    for function in hockey_data.TABLES:
+        expected = inspect.signature(getattr(pyhockey, function)).parameters
+        actual = inspect.signature(getattr(hockey_data.LocalHockey, function)).parameters
+        assert [(name, parameter.default) for name, parameter in expected.items()] == \
+            [(name, parameter.default) for name, parameter in actual.items()
+             if name not in {'self', 'columns'}]
+
+
+def test_local_backend_matches_pyhockey(source, tmp_path, monkeypatch):
+    # Reading DuckDB results as polars frames goes through pyarrow
+    pytest.importorskip('pyarrow', exc_type=ImportError)
+    pyhockey = pytest.importorskip('pyhockey')
+    from pyhockey.util import query_table
+
+    path, _ = source
+    mirror = tmp_path / 'mirror.duckdb'
+    hockey_data.sync(seasons=[SEASON], mirror=str(mirror), source=str(path))
+    local = hockey_data.LocalHockey(str(mirror))
+
+    # pyhockey reads the same data as the mirror was synced from, rather than MotherDuck
+    monkeypatch.setattr(query_table, 'create_connection',
+                        lambda *args, **kwargs: duckdb.connect(str(path), read_only=True))
+
+    goalie = fixtures.hockey.goalie_games(season=SEASON)['name'][0]
+    calls = [
+        ('skater_seasons', {'season': SEASON}),
+        ('skater_seasons', {'season': SEASON, 'situation': '5on5', 'min_icetime': 300,
+                            'team': ['TOR', 'MTL']}),
+        ('goalie_seasons', {'season': SEASON, 'min_games_played': 20}),
+        ('team_seasons', {'season': SEASON}),
+        ('team_games', {'season': SEASON, 'team': 'TOR', 'situation': '5on5'}),
+        ('skater_games', {'season': SEASON, 'team': 'TOR', 'situation': 'all'}),
+        ('goalie_games', {'season': SEASON, 'name': goalie.split()[-1]}),
+    ]
+    for function, kwargs in calls:
+        expected = getattr(pyhockey, function)(quiet=True, **kwargs)
+        actual = getattr(local, function)(quiet=True, **kwargs)
+        assert len(actual) > 0
+        # Rows tied on pyhockey's sort columns can come back in any order
+        assert_frame_equal(actual.sort(actual.columns), expected.sort(expected.columns))
+
+    columns = ['name', 'team', 'iceTime']
+    projected = hockey_data.fetch(local, 'skater_seasons', columns, season=SEASON, team='TOR')
+    assert projected.columns == columns
@@ -0,0 +1,108 @@
+"""
+Tests for drawing the league context of a player scatter plot as a single layer, see
+plot_types/league_context.py.
+
+Run from the repo root with
+    python -m pytest tests/test_league_context.py
+"""
+
+import matplotlib
+matplotlib.use('agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import polars as pl
+import pytest
+from PIL import Image
+
+from benchmarks import fixtures
+from plot_types import league_context
+from plot_types import template as figure_template
+
+
+def players(count=300, seed=0):
+    """ Random players on five teams. """
+    rng = np.random.default_rng(seed)
+    teams = rng.choice(['TOR', 'MTL', 'BOS', 'OTT', 'DET'], count)
+    return teams, rng.normal(15, 3, count), rng.normal(1.5, 0.5, count)
+
+
+def test_density_of_each_team_adds_up_to_the_league():
+    teams, x, y = players()
+    density = league_context.compute_density(teams, x, y, (5, 25, 0, 3.5), size=50)
+    assert set(density.teams) == {'TOR', 'MTL', 'BOS', 'OTT', 'DET'}
+
+    others = teams != 'TOR'
+    expected = league_context.compute_density(teams[others], x[others], y[others],
+                                              (5, 25, 0, 3.5), size=50)
+    # The bandwidth comes from the whole league, so leaving TOR out first only changes it a little
+    excluding = density.excluding('TOR')
+    assert excluding.shape == (50, 50)
+    assert np.allclose(excluding, sum(density.teams[team] for team in density.teams
+                                      if team != 'TOR'))
+    assert np.corrcoef(excluding.ravel(), expected.total.ravel())[0, 1] > 0.99
+
+
+def test_density_is_kept_under_its_name():
+    league_context.clear_densities()
+    teams, x, y = players()
+    first = league_context.get_density('skater_points_F_5on5_2025', teams, x, y, (5, 25, 0, 3.5))
+    again = league_context.get_density('skater_points_F_5on5_2025', teams, x, y, (5, 25, 0, 3.5))
+    assert again is first
+
+    # Other players under the same name are never given the old density
+    other = league_context.get_density('skater_points_F_5on5_2025', teams, x + 1, y,
+                                       (5, 25, 0, 3.5))
+    assert other is not first
+    assert league_context.get_density(None, teams, x, y, (5, 25, 0, 3.5)) is not first
+    league_context.clear_densities()
+
+
+@pytest.mark.parametrize('style', league_context.STYLES)
+def test_draw_adds_one_layer_and_keeps_limits(style):
+    teams, x, y = players()
+    fig, axis = plt.subplots()
+    axis.set_xlim(5, 25)
+    axis.set_ylim(0, 3.5)
+    before = len(axis.get_children())
+
+    league_context.draw(axis, teams, x, y, 'TOR', style=style)
+    assert len(axis.get_children()) == before + 1
+    assert axis.get_xlim() == (5, 25)
+    assert axis.get_ylim() == (0, 3.5)
+    plt.close(fig)
+
+
+def test_unknown_style_raises():
+    fig, axis = plt.subplots()
+    with pytest.raises(ValueError):
+        league_context.draw(axis, *players(), 'TOR', style='contour')
+    plt.close(fig)
+
+
+def render(path, template, style):
+    """ Renders TOR's forward scoring rates, as plot_skater_points does, to a pixel array. """
+    from plot_types.ratio_scatter import RatioScatterPlot
+
+    df = fixtures.hockey.skater_seasons(season=2025, min_icetime=200)
+    df = df.filter(pl.col('position').is_in({'C', 'R', 'L'}))
+    plot = RatioScatterPlot(dataframe=df, filename=str(path), x_column='averageIceTime',
+                            y_column='pointsPerHour', scale='player', team='TOR',
+                            show_league_context=True, league_context_style=style,
+                            percentiles={'horizontal': [1.0, 1.5, 2.0]},
+                            y_min_max=(0, df['pointsPerHour'].max() + 0.2), template=template)
+    plot.make_plot()
+    plt.close('all')
+    return np.asarray(Image.open(path).convert('RGB'))
+
+
+@pytest.mark.parametrize('style', ['kde', 'logos'])
+def test_templated_plots_match_full_renders(tmp_path, style):
+    figure_template.clear_templates()
+    league_context.clear_densities()
+    full = render(tmp_path / 'full.png', None, style)
+    # The first templated render captures the scaffold, the second is stamped onto it
+    for index in range(2):
+        templated = render(tmp_path / f'templated_{index}.png', 'test_league_context', style)
+        assert np.array_equal(templated, full)
+    figure_template.clear_templates()
+    league_context.clear_densities()
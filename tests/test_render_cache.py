@@ -0,0 +1,49 @@
+"""
+Tests for the code-version salt of the render cache, which has to change with anything that
+changes how a cached chart would look.
+
+Run from the repo root with
+    python -m pytest tests/test_render_cache.py
+"""
+
+import os
+
+from plot_types import plot
+from plot_types.ratio_scatter import RatioScatterPlot
+from plot_types.sequential_bar import SequentialBarPlot
+from util import render_cache
+
+
+def repo_file(path):
+    return os.path.join(render_cache.REPO_ROOT, *path.split('/'))
+
+
+def test_salt_covers_the_modules_plots_import():
+    for plot_class in [RatioScatterPlot, SequentialBarPlot]:
+        files = render_cache.source_files(plot_class)
+        for path in ['plot_types/plot.py', 'util/font_dicts.py', 'util/helpers.py',
+                     'util/team_maps.py', 'util/svg_export.py']:
+            assert repo_file(path) in files
+    assert repo_file('plot_types/league_context.py') in render_cache.source_files(RatioScatterPlot)
+
+
+def test_repo_imports_leave_out_third_party_modules(tmp_path):
+    module = tmp_path / 'chart.py'
+    module.write_text('import numpy as np\n'
+                      'from util.helpers import ratio_to_color\n'
+                      'from util import plot_timing, svg_export\n'
+                      'from . import sibling\n')
+    assert sorted(render_cache._repo_imports(str(module))) == \
+        [repo_file('util/helpers.py'), repo_file('util/plot_timing.py'),
+         repo_file('util/svg_export.py')]
+
+
+def test_salt_changes_with_the_logos(tmp_path, monkeypatch):
+    salts = []
+    for name, logo in [('a', b'logo'), ('b', b'logo'), ('c', b'new logo')]:
+        root = tmp_path / name / 'hockey' / 'small'
+        root.mkdir(parents=True)
+        (root / 'TOR.png').write_bytes(logo)
+        monkeypatch.setattr(plot, 'LOGO_ROOT', str(tmp_path / name))
+        salts.append(render_cache.code_version_salt(RatioScatterPlot))
+    assert salts[0] == salts[1] != salts[2]
@@ -0,0 +1,125 @@
+"""
+Tests for the render daemon (util/render_daemon.py), with a server on a temporary Unix socket
+running jobs for small stand-in entry scripts. The server is started without `preload`, which
+only warms the imports.
+
+Run from the repo root with
+    python -m pytest tests/test_render_daemon.py
+"""
+
+import os
+import socket
+import tempfile
+import threading
+
+import pytest
+
+from util import render_daemon
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'),
+                                reason='the daemon listens on a Unix socket')
+
+# A job whose worker died never gets a reply, so give up on it after this long
+JOB_TIMEOUT = 30
+
+SCRIPTS = {
+    'echo.py': ("import os, sys\n"
+                "print('args', sys.argv[1:])\n"
+                "print('cwd', os.getcwd())\n"
+                "print('pid', os.getpid())\n"),
+    'exit_code.py': "import sys\nsys.exit(int(sys.argv[1]))\n",
+    'fails.py': "raise RuntimeError('chart could not be drawn')\n",
+}
+
+
+@pytest.fixture
+def scripts(tmp_path):
+    """ Directory holding the stand-in entry scripts. """
+    for name, source in SCRIPTS.items():
+        (tmp_path / name).write_text(source)
+    return tmp_path
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are limited to about 100 characters, so keep it short
+    with tempfile.TemporaryDirectory(prefix='render-') as tmp:
+        yield os.path.join(tmp, 'daemon.sock')
+
+
+@pytest.fixture
+def daemon(socket_path):
+    """ A daemon with a single worker, so consecutive jobs run in the same process. """
+    server = render_daemon.RenderServer(socket_path, workers=1, max_jobs=50)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def submit(script, args, socket_path):
+    """ Same as `render_daemon.submit`, failing the test if no reply comes within JOB_TIMEOUT. """
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(
+        returncode=render_daemon.submit(script, args, socket_path=socket_path)), daemon=True)
+    thread.start()
+    thread.join(JOB_TIMEOUT)
+    if 'returncode' not in result:
+        pytest.fail(f"No reply to {script} within {JOB_TIMEOUT}s")
+    return result['returncode']
+
+
+def job_output(capsys):
+    """ Parses the 'key value' lines printed by echo.py. """
+    return dict(line.split(' ', 1) for line in capsys.readouterr().out.splitlines())
+
+
+def test_job_round_trip(daemon, scripts, socket_path, monkeypatch, capsys):
+    monkeypatch.chdir(scripts)
+    assert submit('echo.py', ['-g', '2025020001'], socket_path) == 0
+
+    output = job_output(capsys)
+    assert output['args'] == "['-g', '2025020001']"
+    # The script runs in the client's working directory, in a worker rather than the daemon
+    assert output['cwd'] == str(scripts)
+    assert int(output['pid']) != os.getpid()
+
+    assert submit('exit_code.py', ['3'], socket_path) == 3
+
+
+def test_failing_script_reports_its_error(daemon, scripts, socket_path, monkeypatch, capsys):
+    monkeypatch.chdir(scripts)
+    submit('echo.py', [], socket_path)
+    worker = job_output(capsys)['pid']
+
+    assert submit('fails.py', [], socket_path) == 1
+    output = capsys.readouterr().out
+    assert 'RuntimeError: chart could not be drawn' in output
+    assert 'Traceback' in output
+
+    # Nor does exiting, e.g. argparse on bad arguments, take the worker down with it
+    assert submit('exit_code.py', ['2'], socket_path) == 2
+
+    # The same worker carries on with the next job
+    assert submit('echo.py', [], socket_path) == 0
+    assert job_output(capsys)['pid'] == worker
+
+
+@pytest.mark.parametrize('stale_socket', [False, True])
+def test_runs_script_directly_without_daemon(scripts, socket_path, monkeypatch, capfd,
+                                             stale_socket):
+    if stale_socket:
+        # Left behind by a daemon that didn't shut down cleanly, so nothing is listening on it
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(socket_path)
+        stale.close()
+
+    monkeypatch.chdir(scripts)
+    assert submit('echo.py', ['--team', 'TOR'], socket_path) == 0
+    assert submit('exit_code.py', ['2'], socket_path) == 2
+
+    captured = capfd.readouterr()
+    assert f'No render daemon at {socket_path}' in captured.err
+    assert "args ['--team', 'TOR']" in captured.out
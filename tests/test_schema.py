@@ -0,0 +1,43 @@
+"""
+Tests for casting the columns charts filter on to the dtypes in util/schema.py.
+
+Run from the repo root with
+    python -m pytest tests/test_schema.py
+"""
+
+import polars as pl
+
+from benchmarks import fixtures
+from util import schema
+
+
+def test_casts_known_values_to_enums():
+    df = schema.cast(fixtures.hockey.skater_games(season=2025))
+    assert df.schema['team'] == schema.NHL_TEAMS
+    assert df.schema['situation'] == schema.SITUATIONS
+    assert df.schema['position'] == schema.POSITIONS
+    assert df.schema['name'] == pl.Categorical
+
+
+def test_unknown_teams_fall_back_to_categorical():
+    df = schema.cast(pl.DataFrame({'team': ['TOR', 'H0000']}))
+    assert df.schema['team'] == pl.Categorical
+    assert df['team'].to_list() == ['TOR', 'H0000']
+
+
+def test_filters_and_sorting_match_strings():
+    strings = fixtures.hockey.team_games(season=2025)
+    cast = schema.cast(strings)
+    for team in ['TOR', 'MTL']:
+        expected = strings.filter((pl.col('team') == team) & (pl.col('situation') == '5on5'))
+        actual = cast.filter((pl.col('team') == team) & (pl.col('situation') == '5on5'))
+        assert actual['gameID'].to_list() == expected['gameID'].to_list()
+    assert cast.sort('team', 'gameID')['team'].to_list() == \
+        strings.sort('team', 'gameID')['team'].to_list()
+
+
+def test_leaves_other_columns_and_frames_alone():
+    df = pl.DataFrame({'team': ['TOR'], 'xGoals': [1.5], 'Team': ['TOR']})
+    assert schema.cast(df).schema == {'team': schema.NHL_TEAMS, 'xGoals': pl.Float64,
+                                      'Team': pl.String}
+    assert schema.cast(df.to_dict(as_series=False)) == df.to_dict(as_series=False)
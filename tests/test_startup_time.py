@@ -0,0 +1,49 @@
+"""
+Regression test for the start-up time of the entry scripts. Running any of them with `--help`
+should only parse arguments, without importing the plotting or data libraries.
+
+Run from the repo root with
+    python -m pytest tests/test_startup_time.py
+"""
+
+import pytest
+
+from util.import_report import measure_imports
+
+# Wall-clock budget for `<script> --help`, including interpreter start-up
+STARTUP_BUDGET_SECONDS = 1.0
+
+# Packages which should only be imported once a chart is actually drawn
+HEAVY_PACKAGES = {'matplotlib', 'polars', 'pandas', 'numpy', 'scipy', 'seaborn', 'pyhockey',
+                  'pybaseball'}
+
+ENTRY_SCRIPTS = [
+    'hockey/game_report/assemble_report.py',
+    'hockey/goalie_plots/games_by_gsax_bar_chart.py',
+    'hockey/goalie_plots/xgoals_scatter.py',
+    'hockey/skater_plots/plot_skater_points.py',
+    'hockey/skater_plots/plot_skater_ratios.py',
+    'hockey/team_plots/plot_rolling_avg_line_plot.py',
+    'hockey/team_plots/plot_special_teams.py',
+    'hockey/team_plots/plot_team_ratios.py',
+    'baseball/player_plots/plot_pitcher_war_distribution.py',
+    'baseball/player_plots/plot_wrc_distribution.py',
+    'baseball/team_plots/plot_fip_vs_era.py',
+    'baseball/team_plots/plot_obp_vs_slg.py',
+    'baseball/team_plots/plot_run_diff_rolling_avg.py',
+    'baseball/team_plots/plot_run_differential.py',
+    'baseball/team_plots/plot_team_standings.py',
+]
+
+
+@pytest.mark.parametrize('script', ENTRY_SCRIPTS)
+def test_help_skips_heavy_imports(script):
+    report = measure_imports(script)
+    assert report['returncode'] == 0
+
+    imported = {name.split('.')[0] for name, _, _ in report['modules']}
+    assert not imported & HEAVY_PACKAGES, \
+        f"{script} --help imported {sorted(imported & HEAVY_PACKAGES)}"
+
+    assert report['wall'] < STARTUP_BUDGET_SECONDS, \
+        f"{script} --help took {report['wall']:.2f}s, budget is {STARTUP_BUDGET_SECONDS}s"
@@ -0,0 +1,76 @@
+"""
+Module for encoding animation frames, rendered elsewhere as raw RGBA buffers, straight into a
+video or GIF without writing any intermediate files.
+
+Frames are streamed to ffmpeg's stdin when ffmpeg is available (the path is taken from
+matplotlib's `animation.ffmpeg_path` rcParam, same as FFMpegWriter), and otherwise written as an
+animated GIF with the palette-optimized writer in util/gif_writer.py.
+"""
+
+import os
+import shutil
+import subprocess
+
+import matplotlib
+
+from util.gif_writer import write_gif
+
+
+def find_ffmpeg():
+    """
+    Returns the path of the ffmpeg executable, or None if it isn't installed.
+    """
+    return shutil.which(matplotlib.rcParams['animation.ffmpeg_path'])
+
+
+def write_mp4(frames, size, filename, fps=1, ffmpeg=None):
+    """
+    Streams RGBA frames to ffmpeg's stdin, encoding them as H.264 in an mp4 file.
+
+    :param iterable[bytes] frames: Raw RGBA buffers, in order.
+    :param tuple[int, int] size: Width and height of every frame, in pixels.
+    :param str filename: Output filename.
+    :param int fps: Frames per second.
+    :param str ffmpeg: Path of the ffmpeg executable, defaults to the one from `find_ffmpeg`.
+    """
+    command = [ffmpeg or find_ffmpeg(), '-y', '-loglevel', 'error',
+               '-f', 'rawvideo', '-vcodec', 'rawvideo', '-pix_fmt', 'rgba',
+               '-s', f'{size[0]}x{size[1]}', '-r', str(fps), '-i', '-',
+               # yuv420p needs even dimensions, and is what most players expect
+               '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2',
+               '-vcodec', 'libx264', '-pix_fmt', 'yuv420p', filename]
+
+    with subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE) as proc:
+        try:
+            for frame in frames:
+                proc.stdin.write(frame)
+        except BrokenPipeError:
+            # ffmpeg exited early, the error is reported below
+            pass
+        finally:
+            proc.stdin.close()
+        stderr = proc.stderr.read().decode(errors='replace')
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed with exit code {proc.returncode}:\n{stderr}")
+
+
+def write_animation(frames, size, filename, fps=1):
+    """
+    Encodes the frames as a GIF if `filename` ends in .gif, otherwise as an mp4 if ffmpeg is
+    available, falling back to a GIF. The extension of `filename` is replaced to match.
+
+    :param iterable[bytes] frames: Raw RGBA buffers, in order.
+    :param tuple[int, int] size: Width and height of every frame, in pixels.
+    :param str filename: Output filename, its extension is only used to pick the format.
+    :param int fps: Frames per second.
+    :return str: The filename that was actually written.
+    """
+    stem, extension = os.path.splitext(filename)
+    ffmpeg = find_ffmpeg()
+    if ffmpeg and extension.lower() != '.gif':
+        filename = f'{stem}.mp4'
+        write_mp4(frames, size, filename, fps=fps, ffmpeg=ffmpeg)
+    else:
+        filename = f'{stem}.gif'
+        write_gif(frames, size, filename, fps=fps)
+    return filename
@@ -0,0 +1,95 @@
+"""
+Module for downsampling long time-series lines before they are drawn, so that multi-season or
+full-league line plots don't end up with far more vertices than there are pixels to show them.
+
+Uses the largest-triangle-three-buckets (LTTB) algorithm, which keeps the points that contribute
+most to the visual shape of the line, plus the overall minimum and maximum so peaks are never lost.
+"""
+
+import numpy as np
+
+# Never downsample a line to fewer points than this, however narrow the axis
+MIN_POINTS = 50
+# One vertex every other pixel is already finer than the width of the lines we draw
+POINTS_PER_PIXEL = 0.5
+
+
+def lttb_indices(x, y, threshold):
+    """
+    Returns the indices of the points kept by largest-triangle-three-buckets downsampling.
+
+    The first and last points are always kept. The rest are split into `threshold - 2` buckets,
+    and from each bucket the point forming the largest triangle with the previously kept point
+    and the average of the next bucket is kept.
+
+    :param np.ndarray x: x-values of the line, in increasing order.
+    :param np.ndarray y: y-values of the line.
+    :param int threshold: Number of points to keep.
+    :return np.ndarray: Sorted indices of the kept points.
+    """
+    num_points = len(x)
+    if threshold >= num_points or threshold < 3:
+        return np.arange(num_points)
+
+    bucket_size = (num_points - 2) / (threshold - 2)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = num_points - 1
+
+    previous = 0
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, num_points)
+
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        # Twice the area of the triangle formed with the previous point and the next bucket
+        areas = np.abs((x[previous] - avg_x) * (y[start:end] - y[previous]) -
+                       (x[previous] - x[start:end]) * (avg_y - y[previous]))
+        previous = start + int(areas.argmax())
+        indices[i + 1] = previous
+
+    return indices
+
+
+def downsample(x, y, max_points, keep_extremes=True):
+    """
+    Downsamples a line to at most `max_points` points with LTTB. Lines already within the budget
+    are returned unchanged.
+
+    :param array-like x: x-values of the line, in increasing order.
+    :param array-like y: y-values of the line.
+    :param int max_points: Maximum number of points to keep.
+    :param bool keep_extremes: If True, the points with the minimum and maximum y-values are
+                               always kept.
+    :return tuple[np.ndarray, np.ndarray]: The downsampled x- and y-values.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    max_points = max(int(max_points), MIN_POINTS)
+    if len(x) <= max_points:
+        return x, y
+
+    if keep_extremes:
+        # Leave room for the extremes, so the result stays within the budget
+        indices = lttb_indices(x, y, max_points - 2)
+        indices = np.union1d(indices, [y.argmin(), y.argmax()])
+    else:
+        indices = lttb_indices(x, y, max_points)
+
+    return x[indices], y[indices]
+
+
+def pixel_budget(axis, points_per_pixel=POINTS_PER_PIXEL):
+    """
+    Returns the maximum number of points worth drawing for a line spanning the given axis, based
+    on the width of the axis in pixels at the figure's resolution.
+
+    :param Axes axis: The axis the line will be drawn on.
+    :param float points_per_pixel: Number of points to allow per pixel of width.
+    :return int: The point budget.
+    """
+    width = axis.get_window_extent().width
+    return max(int(width * points_per_pixel), MIN_POINTS)
@@ -0,0 +1,254 @@
+"""
+Module for profiling how long each artist of a figure takes to draw.
+
+Where util/plot_timing.py says how long savefig takes, this says which artists that time goes to.
+While profiling, every artist records the code that created it (e.g. `Plot.add_team_logo`, or
+`RatioScatterPlot.add_scaffold > axline` for the ratio lines), and every time a figure is drawn
+the draw of each of its artists is wrapped to time it. Times are aggregated by artist class (with
+any path effects, e.g. 'Text+withStroke') and creation site:
+
+    with profile_draws() as profiler:
+        plot = RatioScatterPlot(...)
+        plot.make_plot()
+
+    print(profiler.report())
+    profiler.write_speedscope('ratio_scatter.speedscope.json')
+
+The speedscope file can be opened at https://www.speedscope.app to see the draws as a flame
+graph. Profiling has a real overhead, so absolute times are inflated, but they're comparable
+between artists.
+"""
+
+import os
+import sys
+import json
+import time
+import functools
+from contextlib import contextmanager
+
+from matplotlib.artist import Artist
+from matplotlib.figure import Figure
+
+# Only code in this repo counts as a creation site, rather than matplotlib's own internals
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Modules that wrap plot code, and so are never the interesting creation site
+SKIPPED_FILES = {os.path.abspath(__file__),
+                 os.path.join(REPO_ROOT, 'util', 'plot_timing.py')}
+# Number of repo functions in a creation site, innermost last
+SITE_DEPTH = 2
+# Names of matplotlib's decorator wrappers, which hide the function that was actually called
+WRAPPER_NAMES = {'inner', 'wrapper'}
+
+UNKNOWN_SITE = '<unknown>'
+SPEEDSCOPE_SCHEMA = 'https://www.speedscope.app/file-format-schema.json'
+
+# Marks an artist that has no draw of its own set on the instance
+_NO_INSTANCE_DRAW = object()
+
+
+def creation_site(frame) -> str:
+    """
+    Describes the code that's creating an artist, from the stack: the innermost functions in the
+    repo, followed by the matplotlib (or seaborn) function they called, if any, e.g.
+    'RatioScatterPlot.make_plot > RatioScatterPlot.add_scaffold > axline'.
+
+    :param frame: The innermost frame of the stack.
+    """
+    functions = []
+    api = None
+    callee = None
+    while frame is not None and len(functions) < SITE_DEPTH:
+        code = frame.f_code
+        filename = os.path.abspath(code.co_filename)
+        if filename.startswith(REPO_ROOT) and filename not in SKIPPED_FILES \
+                and not code.co_qualname.endswith('>'):
+            # The library function the repo called directly, unless it was a constructor
+            if not functions and callee is not None and callee.co_name != '__init__':
+                api = callee.co_name
+            functions.append(code.co_qualname)
+        elif not functions and code.co_name not in WRAPPER_NAMES:
+            callee = code
+        frame = frame.f_back
+
+    if not functions:
+        return UNKNOWN_SITE
+    return ' > '.join(functions[::-1] + ([api] if api else []))
+
+
+def artist_label(artist) -> str:
+    """
+    The class of an artist, plus any path effects it's drawn with, e.g. 'Text+withStroke'.
+    """
+    label = type(artist).__name__
+    for effect in artist.get_path_effects() or []:
+        label += f'+{type(effect).__name__}'
+    return label
+
+
+class DrawProfiler:
+    """
+    Records the time spent drawing each artist, see `profile_draws`.
+    """
+    def __init__(self):
+        # (artist label, creation site) -> totals
+        self.stats = {}
+        # Every artist whose draw has been wrapped, with the draw it had set on the instance
+        self._wrapped = []
+        # Speedscope frames and open/close events, in ms since the start
+        self._frames = []
+        self._frame_ids = {}
+        self._events = []
+        # Start time and time spent in children, for each draw in progress
+        self._stack = []
+        self._start = time.perf_counter()
+
+    def _frame_id(self, name):
+        if name not in self._frame_ids:
+            self._frame_ids[name] = len(self._frames)
+            self._frames.append({'name': name})
+        return self._frame_ids[name]
+
+    def wrap(self, artist, draw=None):
+        """
+        Wraps the draw of a single artist so that it's timed, if it isn't already.
+
+        :param Artist artist: The artist.
+        :param draw: The draw to time, defaults to the artist's own.
+        """
+        if getattr(artist.draw, '_profiler', None) is self:
+            return
+        draw = draw or artist.draw
+
+        key = (artist_label(artist), getattr(artist, '_draw_site', UNKNOWN_SITE))
+        totals = self.stats.setdefault(key, {'artists': 0, 'draws': 0, 'total': 0.0,
+                                             'self': 0.0})
+        totals['artists'] += 1
+        frame = self._frame_id(f'{key[0]} ({key[1]})')
+
+        @functools.wraps(draw)
+        def timed_draw(*args, **kwargs):
+            start = time.perf_counter()
+            self._stack.append([start, 0.0])
+            self._events.append({'type': 'O', 'frame': frame,
+                                 'at': (start - self._start) * 1000})
+            try:
+                return draw(*args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                start, children = self._stack.pop()
+                elapsed = end - start
+                if self._stack:
+                    self._stack[-1][1] += elapsed
+
+                totals['draws'] += 1
+                totals['total'] += elapsed
+                totals['self'] += elapsed - children
+                self._events.append({'type': 'C', 'frame': frame,
+                                     'at': (end - self._start) * 1000})
+
+        timed_draw._profiler = self
+        self._wrapped.append((artist, artist.__dict__.get('draw', _NO_INSTANCE_DRAW)))
+        artist.draw = timed_draw
+
+    def wrap_figure(self, fig, figure_draw):
+        """
+        Wraps the draw of a figure, so that every time it's drawn, the draw of each of its
+        artists is wrapped too, since artists can be added (or have their draw replaced, as
+        seaborn does) at any point.
+
+        :param Figure fig: The figure.
+        :param figure_draw: The unwrapped Figure.draw.
+        """
+        def draw(renderer):
+            for artist in fig.findobj():
+                if artist is not fig:
+                    self.wrap(artist)
+            return figure_draw(fig, renderer)
+
+        self.wrap(fig, draw)
+
+    def unwrap(self):
+        """
+        Restores the original draw of every wrapped artist.
+        """
+        for artist, draw in self._wrapped:
+            if draw is _NO_INSTANCE_DRAW:
+                artist.__dict__.pop('draw', None)
+            else:
+                artist.draw = draw
+        self._wrapped = []
+
+    def report(self, limit=None) -> str:
+        """
+        Returns a table of the time spent drawing each kind of artist, most expensive first.
+        Self time excludes the time spent drawing the artist's children, e.g. the artists of an
+        Axes, so adds up to the total time spent drawing.
+
+        :param int limit: Maximum number of rows, defaults to all of them.
+        """
+        rows = sorted(self.stats.items(), key=lambda item: item[1]['self'], reverse=True)
+        lines = [f"{'Self (ms)':>10}{'Total (ms)':>12}{'Draws':>8}{'Artists':>9}  "
+                 f"{'Artist':<28}Created by"]
+        for (label, site), totals in rows[:limit]:
+            lines.append(f"{totals['self'] * 1000:>10.1f}{totals['total'] * 1000:>12.1f}"
+                         f"{totals['draws']:>8}{totals['artists']:>9}  {label:<28}{site}")
+        return '\n'.join(lines)
+
+    def to_speedscope(self, name='draw') -> dict:
+        """
+        Returns the recorded draws as an evented profile in speedscope's file format.
+        """
+        end = self._events[-1]['at'] if self._events else 0
+        return {
+            '$schema': SPEEDSCOPE_SCHEMA,
+            'name': name,
+            'exporter': 'util/draw_profiler.py',
+            'shared': {'frames': self._frames},
+            'profiles': [{
+                'type': 'evented',
+                'name': name,
+                'unit': 'milliseconds',
+                'startValue': self._events[0]['at'] if self._events else 0,
+                'endValue': end,
+                'events': self._events,
+            }],
+        }
+
+    def write_speedscope(self, filename, name='draw'):
+        """
+        Writes the recorded draws to a speedscope JSON file.
+        """
+        with open(filename, 'w', encoding='utf-8') as fo:
+            json.dump(self.to_speedscope(name), fo)
+
+
+@contextmanager
+def profile_draws():
+    """
+    Context manager profiling the draw of every artist created and drawn within it.
+
+    :return DrawProfiler: The profiler, holding the results once the context exits.
+    """
+    profiler = DrawProfiler()
+    original_init = Artist.__init__
+    original_draw = Figure.draw
+
+    @functools.wraps(original_init)
+    def recording_init(artist, *args, **kwargs):
+        original_init(artist, *args, **kwargs)
+        artist._draw_site = creation_site(sys._getframe(1))
+
+    # Only reached the first time each figure is drawn, after which it has a draw of its own
+    @functools.wraps(original_draw)
+    def wrapping_draw(fig, renderer):
+        profiler.wrap_figure(fig, original_draw)
+        return fig.draw(renderer)
+
+    Artist.__init__ = recording_init
+    Figure.draw = wrapping_draw
+    try:
+        yield profiler
+    finally:
+        Artist.__init__ = original_init
+        Figure.draw = original_draw
+        profiler.unwrap()
@@ -1,5 +1,7 @@
-import polars as pl
-import pandas as pd
+from util.lazy_import import lazy_import
+
+pl = lazy_import('polars')
+pd = lazy_import('pandas')
 
 
 def fix_teams_for_traded_pitchers(df):
@@ -0,0 +1,318 @@
+"""
+Record and replay of pyhockey and pybaseball calls, so that the entry scripts and the scripts in
+tests/ can run without a network connection, always on the same data.
+
+In record mode every call to a `ph.*` or `pyb.*` function goes to the real library as usual, and
+its arguments and the DataFrame it returned are written to the fixture store. In replay mode the
+calls are answered from the store instead, without the library being imported at all. The mode
+is set with the FIXTURE_MODE environment variable, and is picked up by util/lazy_import.py:
+
+    FIXTURE_MODE=record python hockey/team_plots/plot_team_ratios.py -si 5on5 -s 2025
+    FIXTURE_MODE=replay python hockey/team_plots/plot_team_ratios.py -si 5on5 -s 2025
+
+Scripts that import pyhockey or pybaseball directly, like the ones in tests/, can be run through
+this module instead, which puts the recording or replaying module in their place:
+
+    python util/fixture_store.py record tests/test_nhl_gsax_plot.py
+    python util/fixture_store.py replay tests/test_nhl_gsax_plot.py
+
+The store is the directory in FIXTURE_STORE, defaulting to fixtures/ in the repo root. Each
+call is stored as a zstd-compressed Arrow IPC file, under a digest of the function's name and
+arguments, next to a JSON file describing the call:
+
+    fixtures/pyhockey/skater_games/3f9a0c1e2b7d4a65.arrow
+    fixtures/pyhockey/skater_games/3f9a0c1e2b7d4a65.json
+
+Arguments are matched as they were passed, so `skater_games(2025)` and
+`skater_games(season=2025)` are recorded separately.
+"""
+
+import os
+import sys
+import json
+import runpy
+import hashlib
+import argparse
+import functools
+import importlib
+from datetime import datetime
+
+## Constants #########################################################################
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODE_VAR = 'FIXTURE_MODE'
+STORE_VAR = 'FIXTURE_STORE'
+DEFAULT_STORE = os.path.join(REPO_ROOT, 'fixtures')
+MODES = ('record', 'replay')
+
+# Data libraries whose calls are recorded
+MODULES = ('pyhockey', 'pybaseball')
+
+# Column a pandas frame's index is stored under, when it isn't the default one
+INDEX_COLUMN = '__index__'
+## End Constants #####################################################################
+
+
+class FixtureNotFoundError(LookupError):
+    """
+    Raised in replay mode for a call that was never recorded.
+    """
+
+
+def mode():
+    """
+    The fixture mode set in the environment: 'record', 'replay', or None when it's off.
+    """
+    value = os.environ.get(MODE_VAR) or None
+    if value is not None and value not in MODES:
+        raise ValueError(f"{MODE_VAR} must be one of {', '.join(MODES)}, not '{value}'")
+    return value
+
+
+def _plain(value):
+    """ Converts numpy scalars (e.g. a game ID taken from a frame) to the Python equivalent. """
+    return value.item() if hasattr(value, 'item') and hasattr(value, 'dtype') else value
+
+
+def call_key(module, function, args, kwargs):
+    """
+    Digest identifying a call by the function called and the arguments it was passed.
+
+    :param str module: Module name, e.g. 'pyhockey'.
+    :param str function: Function name, e.g. 'skater_games'.
+    :param tuple args: Positional arguments.
+    :param dict kwargs: Keyword arguments.
+    """
+    call = [module, function, [_plain(arg) for arg in args],
+            {name: _plain(value) for name, value in kwargs.items()}]
+    canonical = json.dumps(call, sort_keys=True, default=repr)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+def _to_polars(df):
+    """
+    Converts a pandas frame to polars column by column, as pl.from_pandas needs pyarrow for
+    string columns, keeping a non-default index as a column.
+
+    :return tuple[pl.DataFrame, bool]: The frame, and whether its index was kept.
+    """
+    import pandas as pd
+    import polars as pl
+
+    keep_index = not df.index.equals(pd.RangeIndex(len(df)))
+    if keep_index:
+        df = df.reset_index(names=INDEX_COLUMN)
+    columns = {}
+    for name in df.columns:
+        values = df[name]
+        if values.dtype == object:
+            # Missing strings come from pandas as NaN, which polars won't mix with strings
+            columns[str(name)] = values.where(values.notna(), None).tolist()
+        else:
+            columns[str(name)] = values.to_numpy()
+    return pl.DataFrame(columns), keep_index
+
+
+def _to_pandas(df, has_index):
+    """ Converts a polars frame back to pandas, restoring its index if it was kept. """
+    import pandas as pd
+
+    pdf = pd.DataFrame({name: df[name].to_numpy() for name in df.columns})
+    if has_index:
+        pdf = pdf.set_index(INDEX_COLUMN)
+        pdf.index.name = None
+    return pdf
+
+
+class FixtureStore:
+    """
+    Directory of recorded calls, see the module docstring for its layout.
+
+    :param str directory: The store's directory, defaults to FIXTURE_STORE or fixtures/.
+    """
+    def __init__(self, directory=None):
+        self.directory = directory or os.environ.get(STORE_VAR) or DEFAULT_STORE
+
+    def path(self, module, function, key):
+        """ Path of a call's files, without the extension. """
+        return os.path.join(self.directory, module, function, key)
+
+    def save(self, module, function, args, kwargs, result):
+        """
+        Writes the result of a call to the store. Only DataFrames are stored, anything else is
+        skipped with a warning, and will fail to replay.
+        """
+        import pandas as pd
+        import polars as pl
+
+        if isinstance(result, pl.DataFrame):
+            df, kind, has_index = result, 'polars', False
+        elif isinstance(result, pd.DataFrame):
+            df, has_index = _to_polars(result)
+            kind = 'pandas'
+        else:
+            print(f"Not recording {module}.{function}, which returned a "
+                  f"{type(result).__name__} rather than a DataFrame")
+            return
+
+        path = self.path(module, function, call_key(module, function, args, kwargs))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        df.write_ipc(f'{path}.arrow', compression='zstd')
+        with open(f'{path}.json', 'w', encoding='utf-8') as fo:
+            json.dump({
+                'module': module,
+                'function': function,
+                'args': [repr(_plain(arg)) for arg in args],
+                'kwargs': {name: repr(_plain(value)) for name, value in kwargs.items()},
+                'kind': kind,
+                'index': has_index,
+                'rows': len(df),
+                'recorded': datetime.now().isoformat(timespec='seconds'),
+            }, fo, indent=2)
+
+    def load(self, module, function, args, kwargs):
+        """
+        Reads the result of a call from the store, as the same kind of DataFrame it was.
+
+        :raises FixtureNotFoundError: If the call was never recorded.
+        """
+        import polars as pl
+
+        path = self.path(module, function, call_key(module, function, args, kwargs))
+        if not os.path.exists(f'{path}.arrow'):
+            arguments = [repr(arg) for arg in args] + [f'{k}={v!r}' for k, v in kwargs.items()]
+            raise FixtureNotFoundError(
+                f"No recording of {module}.{function}({', '.join(arguments)}) in "
+                f"{self.directory}, record it by running with {MODE_VAR}=record")
+
+        with open(f'{path}.json', encoding='utf-8') as fi:
+            call = json.load(fi)
+        df = pl.read_ipc(f'{path}.arrow')
+        return _to_pandas(df, call['index']) if call['kind'] == 'pandas' else df
+
+    def calls(self):
+        """
+        Every recorded call, as described in its JSON file.
+        """
+        recorded = []
+        for root, _, files in os.walk(self.directory):
+            for filename in sorted(files):
+                if filename.endswith('.json'):
+                    with open(os.path.join(root, filename), encoding='utf-8') as fi:
+                        recorded.append(json.load(fi))
+        return recorded
+
+
+class RecordingModule:
+    """
+    Stands in for a data library, passing calls through to it and recording their results.
+    """
+    def __init__(self, name, store, module=None):
+        self._name = name
+        self._store = store
+        self._module = module
+
+    def _library(self):
+        """ The real library, imported on first use. """
+        if self._module is None:
+            stand_in = sys.modules.get(self._name)
+            if isinstance(stand_in, (RecordingModule, ReplayModule)):
+                # Which is what sys.modules holds once installed, so import past it
+                del sys.modules[self._name]
+                try:
+                    self._module = importlib.import_module(self._name)
+                finally:
+                    sys.modules[self._name] = stand_in
+            else:
+                self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        value = getattr(self._library(), attr)
+        if not callable(value):
+            return value
+
+        @functools.wraps(value)
+        def record(*args, **kwargs):
+            result = value(*args, **kwargs)
+            self._store.save(self._name, attr, args, kwargs, result)
+            return result
+        return record
+
+
+class ReplayModule:
+    """
+    Stands in for a data library, answering every call from the store.
+    """
+    def __init__(self, name, store):
+        self._name = name
+        self._store = store
+
+    def __getattr__(self, attr):
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+
+        def replay(*args, **kwargs):
+            return self._store.load(self._name, attr, args, kwargs)
+        replay.__name__ = attr
+        return replay
+
+
+def install(name, fixture_mode=None, store=None):
+    """
+    Puts the recording or replaying stand-in for a data library in sys.modules, so that it's
+    what any later import of it gets.
+
+    :param str name: The library, one of MODULES.
+    :param str fixture_mode: 'record' or 'replay', defaults to FIXTURE_MODE.
+    :param FixtureStore store: Defaults to the store in FIXTURE_STORE.
+    :return: The stand-in module.
+    """
+    fixture_mode = fixture_mode or mode()
+    store = store or FixtureStore()
+    if fixture_mode == 'record':
+        # Recording wraps the library if it's already been imported
+        library = sys.modules.get(name)
+        if isinstance(library, (RecordingModule, ReplayModule)):
+            library = None
+        sys.modules[name] = RecordingModule(name, store, library)
+    else:
+        sys.modules[name] = ReplayModule(name, store)
+    return sys.modules[name]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('mode', choices=list(MODES) + ['list'],
+                        help='Run a script recording or replaying its data calls, or list the '
+                             'recorded calls.')
+    parser.add_argument('script', nargs='?', help='Script to run.')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help="The script's arguments.")
+    parser.add_argument('-s', '--store', default=None,
+                        help=f'Fixture store directory, defaults to {STORE_VAR} or fixtures/.')
+    args = parser.parse_args()
+
+    if args.store:
+        os.environ[STORE_VAR] = args.store
+
+    if args.mode == 'list':
+        for call in FixtureStore().calls():
+            arguments = call['args'] + [f'{k}={v}' for k, v in call['kwargs'].items()]
+            print(f"{call['module']}.{call['function']}({', '.join(arguments)}): "
+                  f"{call['rows']} rows, recorded {call['recorded']}")
+        sys.exit(0)
+
+    if args.script is None:
+        parser.error(f'a script is needed to {args.mode}')
+
+    # Make the repo importable, as it is when running a script from the repo root
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+
+    os.environ[MODE_VAR] = args.mode
+    for library in MODULES:
+        install(library)
+    sys.argv = [args.script] + args.args
+    runpy.run_path(args.script, run_name='__main__')
@@ -1,7 +1,12 @@
-import pybaseball as pyb
-import polars as pl
+from __future__ import annotations
+
 from typing import Dict, Tuple, Any
 
+from util.lazy_import import lazy_import
+
+pyb = lazy_import('pybaseball')
+pl = lazy_import('polars')
+
 
 def get_park_factor(team: str) -> float:
     """
@@ -0,0 +1,182 @@
+"""
+Module for writing animated GIFs of charts where only a small part of the figure changes from one
+frame to the next, e.g. the rolling average animations where each frame highlights one team.
+
+Rather than storing every frame as a full image with its own palette, the writer:
+   i. computes a single global palette from a sample of the pixels of every frame,
+  ii. maps every frame onto that palette with a lookup table,
+ iii. writes each frame after the first as just the bounding box of the pixels that changed since
+      the previous frame, positioned with an offset. Pixels in that box that didn't change are
+      left transparent, and each frame is drawn over the last (disposal method 1).
+
+The LZW compression of each frame is done by Pillow.
+"""
+
+import numpy as np
+from PIL import Image, GifImagePlugin
+
+# One palette entry is reserved to mark pixels that are unchanged from the previous frame
+NUM_COLORS = 255
+TRANSPARENT_INDEX = 255
+
+# Number of pixels sampled from each frame to build the global palette
+PALETTE_SAMPLES_PER_FRAME = 50_000
+
+
+def rgba_to_rgb15(frame, size):
+    """
+    Converts a raw RGBA buffer to an array of 15-bit colors, i.e. 5 bits per channel.
+
+    :param bytes frame: Raw RGBA buffer.
+    :param tuple[int, int] size: Width and height of the frame, in pixels.
+    :return np.ndarray: Array of shape (height, width) of uint16 colors.
+    """
+    pixels = np.frombuffer(frame, dtype=np.uint8).reshape(size[1], size[0], 4)
+    r, g, b = (pixels[:, :, channel].astype(np.uint16) >> 3 for channel in range(3))
+    return (r << 10) | (g << 5) | b
+
+
+def rgb15_to_rgb(colors):
+    """
+    Converts an array of 15-bit colors back to 8-bit RGB, shape (..., 3).
+    """
+    channels = [(colors >> shift) & 0x1F for shift in (10, 5, 0)]
+    return (np.stack(channels, axis=-1) * 255 // 31).astype(np.uint8)
+
+
+def build_palette(samples):
+    """
+    Computes the global palette from a sample of 15-bit colors, using Pillow's median cut.
+
+    :param np.ndarray samples: 1D array of sampled 15-bit colors.
+    :return np.ndarray: Palette of shape (NUM_COLORS, 3), as uint8 RGB.
+    """
+    sample_image = Image.fromarray(rgb15_to_rgb(samples)[np.newaxis, :, :], 'RGB')
+    quantized = sample_image.quantize(colors=NUM_COLORS, method=Image.Quantize.MEDIANCUT)
+    palette = np.array(quantized.getpalette()[:NUM_COLORS * 3], dtype=np.uint8).reshape(-1, 3)
+    if len(palette) < NUM_COLORS:
+        palette = np.vstack([palette, np.zeros((NUM_COLORS - len(palette), 3), dtype=np.uint8)])
+    return palette
+
+
+def build_lookup_table(palette):
+    """
+    Maps every possible 15-bit color to the index of the nearest palette color.
+
+    :param np.ndarray palette: Palette of shape (NUM_COLORS, 3).
+    :return np.ndarray: Array of 32768 uint8 palette indices.
+    """
+    colors = rgb15_to_rgb(np.arange(1 << 15, dtype=np.uint16)).astype(np.int32)
+    palette = palette.astype(np.int32)
+    lookup = np.empty(1 << 15, dtype=np.uint8)
+    # Done in chunks to keep the distance matrix small
+    for start in range(0, 1 << 15, 4096):
+        chunk = colors[start:start + 4096]
+        distances = ((chunk[:, np.newaxis, :] - palette[np.newaxis, :, :]) ** 2).sum(axis=2)
+        lookup[start:start + 4096] = distances.argmin(axis=1)
+    return lookup
+
+
+def changed_bbox(previous, current):
+    """
+    Returns the bounding box (left, top, right, bottom) of the pixels that differ between two
+    frames of palette indices, or None if they are identical.
+    """
+    changed = previous != current
+    rows = np.flatnonzero(changed.any(axis=1))
+    if len(rows) == 0:
+        return None
+    cols = np.flatnonzero(changed.any(axis=0))
+    return cols[0], rows[0], cols[-1] + 1, rows[-1] + 1
+
+
+def _header(size, palette, loop):
+    """ GIF header, logical screen descriptor, global color table and looping extension. """
+    width, height = size
+    # Global color table present, 8 bits per channel, table of 2^(7+1) = 256 entries
+    header = b'GIF89a' + width.to_bytes(2, 'little') + height.to_bytes(2, 'little') + \
+             bytes([0xF7, 0, 0])
+    table = np.zeros((256, 3), dtype=np.uint8)
+    table[:len(palette)] = palette
+    loop_extension = b'!\xff\x0bNETSCAPE2.0\x03\x01' + loop.to_bytes(2, 'little') + b'\x00'
+    return header + table.tobytes() + loop_extension
+
+
+def _replay(first, changes):
+    """
+    Yields every frame in 15-bit color again, from the first frame and the box that changed in
+    each one after it (None where nothing did). The same array is updated in place each time.
+    """
+    canvas = first.copy()
+    yield canvas
+    for change in changes:
+        if change is not None:
+            (left, top, right, bottom), region = change
+            canvas[top:bottom, left:right] = region
+        yield canvas
+
+
+def write_gif(frames, size, filename, fps=1, loop=0):
+    """
+    Writes the frames as an animated GIF with a global palette and frame-difference encoding.
+
+    The palette has to be built from every frame before the first can be encoded, so frames are
+    kept until then, converted to 15-bit color as they arrive (2 bytes per pixel, rather than 4
+    for RGBA). Only the first frame is kept in full: every later one is kept as just the box of
+    pixels that changed from the frame before. Memory therefore grows with the size of the
+    changes rather than with the number of full frames, and for frames that change all over it's
+    still 2 bytes per pixel per frame.
+
+    :param iterable[bytes] frames: Raw RGBA buffers, in order.
+    :param tuple[int, int] size: Width and height of every frame, in pixels.
+    :param str filename: Output filename.
+    :param int fps: Frames per second.
+    :param int loop: Number of times to loop, 0 to loop forever.
+    """
+    rng = np.random.default_rng(0)
+    first, changes, samples = None, [], []
+    previous = None
+    for frame in frames:
+        rgb15 = rgba_to_rgb15(frame, size)
+        samples.append(rng.choice(rgb15.ravel(), PALETTE_SAMPLES_PER_FRAME))
+        if previous is None:
+            first = rgb15
+        else:
+            bbox = changed_bbox(previous, rgb15)
+            if bbox is None:
+                changes.append(None)
+            else:
+                left, top, right, bottom = bbox
+                changes.append((bbox, rgb15[top:bottom, left:right].copy()))
+        previous = rgb15
+    del previous
+
+    palette = build_palette(np.concatenate(samples))
+    lookup = build_lookup_table(palette)
+    duration = int(1000 / fps)
+
+    with open(filename, 'wb') as fo:
+        fo.write(_header(size, palette, loop))
+
+        previous = None
+        for rgb15 in _replay(first, changes):
+            indices = lookup[rgb15]
+            params = {'duration': duration, 'disposal': 1}
+
+            if previous is None:
+                left, top, right, bottom = 0, 0, size[0], size[1]
+                region = indices
+            else:
+                bbox = changed_bbox(previous, indices)
+                # Nothing changed, so just redraw a single pixel to keep the frame's timing
+                left, top, right, bottom = bbox if bbox is not None else (0, 0, 1, 1)
+                region = indices[top:bottom, left:right].copy()
+                region[region == previous[top:bottom, left:right]] = TRANSPARENT_INDEX
+                params['transparency'] = TRANSPARENT_INDEX
+
+            image = Image.fromarray(region, 'L')
+            for chunk in GifImagePlugin.getdata(image, offset=(int(left), int(top)), **params):
+                fo.write(chunk)
+            previous = indices
+
+        fo.write(b';')
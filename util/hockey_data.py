@@ -0,0 +1,443 @@
+"""
+Local DuckDB mirror of the MotherDuck tables pyhockey reads from, so that the hockey scripts can
+run their queries against a file on disk instead of paying for a network round trip (and a full
+re-read of tables like skater_games) on every call.
+
+The mirror is filled, and kept up to date, with the sync command, which needs MOTHERDUCK_TOKEN
+set. For the tables with one row per game only the games that aren't in the mirror yet are
+copied over, while the season totals (which change after every game) are replaced for the
+seasons being synced:
+
+    python util/hockey_data.py sync                       # every table, for the current season
+    python util/hockey_data.py sync -t skater_games -s 2024 2025
+
+Rows are written sorted by season, team and gameID, so DuckDB's per-row-group min/max statistics
+can skip most of a table for a query on one of them, and the game tables get an index on gameID
+for looking up a single game.
+
+The backend the scripts use is set with the HOCKEY_BACKEND environment variable: 'motherduck'
+(the default) uses pyhockey itself, while 'local' makes util/lazy_import.py hand out a stand-in
+for pyhockey, with the same functions, that reads from the mirror instead:
+
+    HOCKEY_BACKEND=local python hockey/team_plots/plot_team_ratios.py -si 5on5 -s 2025
+
+Charts fetch through `fetch`, with the columns they need, which the local backend passes down to
+DuckDB so that only those columns are read from the mirror (with pyhockey, the full frame is
+fetched and the columns selected from it). The columns charts filter on, like team and
+situation, are also cast to the dtypes in util/schema.py:
+
+    df = hockey_data.fetch(ph, 'goalie_seasons', ['name', 'team', 'xGoals', 'goals'],
+                           season=2025, situation='all')
+
+The mirror is the file in HOCKEY_MIRROR, defaulting to data/hockey.duckdb in the repo root.
+The next game to make a report for can be looked up with either backend:
+
+    HOCKEY_BACKEND=local python util/hockey_data.py next-game 2025020123 -s 2025
+"""
+
+import os
+import sys
+import argparse
+from datetime import datetime
+
+## Constants #########################################################################
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BACKEND_VAR = 'HOCKEY_BACKEND'
+MIRROR_VAR = 'HOCKEY_MIRROR'
+DEFAULT_MIRROR = os.path.join(REPO_ROOT, 'data', 'hockey.duckdb')
+BACKENDS = ('motherduck', 'local')
+
+# Connection string for the default MotherDuck database, reading MOTHERDUCK_TOKEN
+MOTHERDUCK = 'md:'
+
+# Tables mirrored, by the pyhockey function that reads them, along with the MotherDuck table
+# that function queries. The mirror names its tables the same way MotherDuck does
+SOURCE_TABLES = {
+    'skater_seasons': 'skaters',
+    'goalie_seasons': 'goalies',
+    'team_seasons': 'teams',
+    'skater_games': 'skater_games',
+    'goalie_games': 'goalie_games',
+    'team_games': 'team_games',
+}
+SEASON_TABLES = ('skater_seasons', 'goalie_seasons', 'team_seasons')
+GAME_TABLES = ('skater_games', 'goalie_games', 'team_games')
+TABLES = SEASON_TABLES + GAME_TABLES
+
+# Order pyhockey returns rows in, and the source it credits, for each function
+PYHOCKEY_ORDER = {function: ('team', 'gameDate') if function in GAME_TABLES
+                  else ('team', 'season') for function in TABLES}
+DATA_SOURCES = {
+    'skater_seasons': ('MoneyPuck', 'https://moneypuck.com'),
+    'goalie_seasons': ('MoneyPuck', 'https://moneypuck.com'),
+    'team_seasons': ('MoneyPuck', 'https://moneypuck.com'),
+    'team_games': ('MoneyPuck', 'https://moneypuck.com'),
+    'skater_games': ('NaturalStatTrick', 'https://naturalstattrick.com'),
+    'goalie_games': ('NaturalStatTrick', 'https://naturalstattrick.com'),
+}
+
+# Order rows are stored in, for each kind of table
+SEASON_SORT = ('season', 'team')
+GAME_SORT = ('season', 'team', 'gameID')
+
+# Current season, the same way the scripts default to it
+SEASON = datetime.now().year - 1 if datetime.now().month < 10 else datetime.now().year
+## End Constants #####################################################################
+
+
+def backend():
+    """
+    The backend set in the environment, 'motherduck' (the default) or 'local'.
+    """
+    value = os.environ.get(BACKEND_VAR) or 'motherduck'
+    if value not in BACKENDS:
+        raise ValueError(f"{BACKEND_VAR} must be one of {', '.join(BACKENDS)}, not '{value}'")
+    return value
+
+
+def mirror_path():
+    """ The mirror's file, from HOCKEY_MIRROR or the default. """
+    return os.environ.get(MIRROR_VAR) or DEFAULT_MIRROR
+
+
+def _quote(path):
+    """ A path as a SQL string literal. """
+    return "'" + path.replace("'", "''") + "'"
+
+
+def connect(hockey_backend=None, mirror=None):
+    """
+    Opens a connection to the hockey tables.
+
+    :param str hockey_backend: 'motherduck' or 'local', defaults to HOCKEY_BACKEND.
+    :param str mirror: The mirror's file, when local, defaults to HOCKEY_MIRROR.
+    :return duckdb.DuckDBPyConnection: The connection, with the tables in its default schema.
+    """
+    import duckdb
+
+    if (hockey_backend or backend()) == 'local':
+        mirror = mirror or mirror_path()
+        if not os.path.exists(mirror):
+            raise FileNotFoundError(f"No hockey mirror at {mirror}, create it with "
+                                    f"`python util/hockey_data.py sync`")
+        return duckdb.connect(mirror, read_only=True)
+    return duckdb.connect(MOTHERDUCK)
+
+
+def _mirror_has(conn, table):
+    """ Whether the attached mirror already has a table. """
+    return conn.execute("SELECT count(*) FROM duckdb_tables() "
+                        "WHERE database_name = 'mirror' AND table_name = ?",
+                        [table]).fetchone()[0] > 0
+
+
+def _game_ids(conn, table, seasons):
+    """ The IDs of every game of `seasons` in a table. """
+    return {row[0] for row in conn.execute(f"SELECT DISTINCT gameID FROM {table} "
+                                           f"WHERE season IN (SELECT unnest($1))",
+                                           [seasons]).fetchall()}
+
+
+def sync(tables=TABLES, seasons=(SEASON,), mirror=None, source=MOTHERDUCK):
+    """
+    Copies what's new in the source tables to the mirror, creating it if needed. The game
+    tables only get the games that aren't in the mirror yet: their IDs are compared first, so
+    that only the rows of the new games are read from the source. The season tables have the
+    rows for `seasons` replaced.
+
+    :param list[str] tables: Tables to sync, by their pyhockey function, from TABLES.
+    :param list[int] seasons: Seasons to sync.
+    :param str mirror: The mirror's file, defaults to HOCKEY_MIRROR.
+    :param str source: Database to copy from, MotherDuck by default, or the path of another
+                       DuckDB file.
+    :return dict: The number of rows added to each table, by its pyhockey function.
+    """
+    import duckdb
+
+    unknown = set(tables) - set(TABLES)
+    if unknown:
+        raise ValueError(f"Unknown tables {', '.join(sorted(unknown))}, "
+                         f"expected some of {', '.join(TABLES)}")
+
+    mirror = mirror or mirror_path()
+    os.makedirs(os.path.dirname(os.path.abspath(mirror)), exist_ok=True)
+    seasons = [int(season) for season in seasons]
+
+    conn = duckdb.connect(source)
+    conn.execute(f"ATTACH {_quote(mirror)} AS mirror")
+
+    added = {}
+    for function in tables:
+        table = SOURCE_TABLES[function]
+        is_game_table = function in GAME_TABLES
+        order = ', '.join(GAME_SORT if is_game_table else SEASON_SORT)
+
+        if not _mirror_has(conn, table):
+            conn.execute(f"CREATE TABLE mirror.{table} AS SELECT * FROM {table} WHERE false")
+            if is_game_table:
+                conn.execute(f"CREATE INDEX {table}_game ON mirror.{table} (gameID)")
+
+        conn.execute("BEGIN TRANSACTION")
+        if is_game_table:
+            # Game IDs are cheap to fetch, so work out which games are new before reading any
+            # of their rows
+            source_games = _game_ids(conn, table, seasons)
+            new_games = sorted(source_games - _game_ids(conn, f'mirror.{table}', seasons))
+            inserted = conn.execute(
+                f"INSERT INTO mirror.{table} SELECT * FROM {table} "
+                f"WHERE season IN (SELECT unnest($1)) AND gameID IN (SELECT unnest($2)) "
+                f"ORDER BY {order}", [seasons, new_games])
+            detail = f'{len(new_games)} new games'
+        else:
+            conn.execute(f"DELETE FROM mirror.{table} WHERE season IN (SELECT unnest($1))",
+                         [seasons])
+            inserted = conn.execute(f"INSERT INTO mirror.{table} SELECT * FROM {table} "
+                                    f"WHERE season IN (SELECT unnest($1)) ORDER BY {order}",
+                                    [seasons])
+            detail = f"seasons {', '.join(map(str, seasons))}"
+        added[function] = inserted.fetchone()[0]
+        conn.execute("COMMIT")
+
+        print(f"{table}: {added[function]} rows written ({detail})")
+
+    conn.close()
+    return added
+
+
+def next_unreported_game(last_game_id, season, conn=None):
+    """
+    The first game of a season after the last one reported on, as used by the game report
+    workflow.
+
+    :param int last_game_id: ID of the most recent game reported on.
+    :param int season: Season the game is in.
+    :param conn: Connection to the hockey tables, defaults to one for HOCKEY_BACKEND.
+    :return int: The game's ID, or 0 if there's no new game yet.
+    """
+    conn = conn or connect()
+    game_id = conn.execute("SELECT min(gameID) FROM skater_games "
+                           "WHERE season = ? AND gameID > ?",
+                           [int(season), int(last_game_id)]).fetchone()[0]
+    return int(game_id) if game_id is not None else 0
+
+
+class LocalHockey:
+    """
+    Stands in for pyhockey, answering the same calls, with the same arguments and defaults, from
+    the local mirror. Results come back the way pyhockey's own do: in the same order, with every
+    float rounded to 2 decimal places.
+
+    :param str mirror: The mirror's file, defaults to HOCKEY_MIRROR.
+    """
+    def __init__(self, mirror=None):
+        self._mirror = mirror
+        self._conn = None
+
+    def _select(self, function, columns, filters, minimums=None, start_date=None, end_date=None,
+                combine_seasons=False, quiet=False):
+        """
+        Rows of a table, filtered and finished the way pyhockey's query_table does.
+
+        :param str function: The pyhockey function being stood in for, e.g. 'skater_seasons'.
+        :param list[str] columns: Columns to read, defaults to all of them.
+        :param dict filters: Value, or list of values, each column has to match, skipping None.
+                             A team of 'ALL' matches every team, and names match in part.
+        :param dict minimums: Least value of each column, e.g. {'iceTime': 300}.
+        :param str start_date: Earliest gameDate, as YYYY-MM-DD.
+        :param str end_date: Latest gameDate, as YYYY-MM-DD.
+        :param bool combine_seasons: Combine each player's or team's seasons into a single row.
+        :param bool quiet: Don't print where the data comes from.
+        :return pl.DataFrame: The rows.
+        """
+        import polars as pl
+        import polars.selectors as cs
+
+        if self._conn is None:
+            self._conn = connect('local', self._mirror)
+
+        if start_date and end_date and filters.get('season') is not None:
+            print("Input values were provided for 'start_date', 'end_date', and 'season'. "
+                  "Disregarding the input for 'season' and returning all games between "
+                  f"{start_date} and {end_date}.")
+            filters = {**filters, 'season': None}
+
+        conditions, params = [], []
+        for column, value in filters.items():
+            if value is None or (column == 'team' and value == 'ALL'):
+                continue
+            values = list(value) if isinstance(value, (list, tuple)) else [value]
+            if column == 'name':
+                # As pyhockey does, each word of a name can match anywhere in the full name
+                conditions.append(f"({' OR '.join(['name LIKE ?'] * len(values))})")
+                params.extend(f"%{'%'.join(name.split())}%" for name in values)
+            else:
+                conditions.append(f'"{column}" IN (SELECT unnest(?))')
+                params.append(values)
+        for column, value in (minimums or {}).items():
+            conditions.append(f'"{column}" >= ?')
+            params.append(value)
+        for condition, value in [('gameDate >= ?', start_date), ('gameDate <= ?', end_date)]:
+            if value:
+                conditions.append(condition)
+                params.append(value)
+
+        # Seasons are combined from every column, and only then narrowed down
+        selected = ', '.join(f'"{column}"' for column in columns) \
+            if columns and not combine_seasons else '*'
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+        df = self._conn.execute(f"SELECT {selected} FROM {SOURCE_TABLES[function]}{where} "
+                                f"ORDER BY {', '.join(PYHOCKEY_ORDER[function])}", params).pl()
+
+        if combine_seasons:
+            df = self._combine_seasons(function, df, filters.get('season'))
+            if columns:
+                df = df.select(columns)
+
+        if not quiet:
+            source, url = DATA_SOURCES[function]
+            print(f"Data for this query provided by {source} ({url}).")
+
+        return df.with_columns(cs.float().cast(pl.Float64).round(2))
+
+    @staticmethod
+    def _combine_seasons(function, df, season):
+        """ Combines the seasons of each player or team with pyhockey's own functions. """
+        # install() imports these before it takes pyhockey's place in sys.modules
+        from pyhockey.util import query_table
+
+        if not isinstance(season, list):
+            print(f"The 'combine_seasons' parameter has been set to 'True', but data for only one "
+                  f"season ({season}) was requested. Returning data for just that season...")
+            return df
+        return {
+            'skater_seasons': query_table.combine_skater_seasons,
+            'goalie_seasons': query_table.combine_goalie_seasons,
+            'team_seasons': query_table.combine_team_seasons,
+        }[function](df)
+
+    @staticmethod
+    def _check_dates(season, start_date, end_date):
+        """ The game tables need a season or a date, as with pyhockey. """
+        if not season and not start_date and not end_date:
+            raise ValueError("No values provided for 'season', 'start_date', or 'end_date'. Must "
+                             "provide value for at least one of these.")
+
+    def skater_seasons(self, season, name=None, team='ALL', min_icetime=0, situation='all',
+                       combine_seasons=False, quiet=False, columns=None):
+        """ Same as pyhockey.skater_seasons, reading only `columns` if given. """
+        return self._select('skater_seasons', columns,
+                            {'season': season, 'team': team, 'name': name,
+                             'situation': situation},
+                            minimums={'iceTime': min_icetime},
+                            combine_seasons=combine_seasons, quiet=quiet)
+
+    def goalie_seasons(self, season, team='ALL', min_games_played=0, situation='all',
+                       combine_seasons=False, quiet=False, columns=None):
+        """ Same as pyhockey.goalie_seasons, reading only `columns` if given. """
+        return self._select('goalie_seasons', columns,
+                            {'season': season, 'team': team, 'situation': situation},
+                            minimums={'gamesPlayed': min_games_played},
+                            combine_seasons=combine_seasons, quiet=quiet)
+
+    def team_seasons(self, season, team='ALL', situation='all', combine_seasons=False,
+                     quiet=False, columns=None):
+        """ Same as pyhockey.team_seasons, reading only `columns` if given. """
+        return self._select('team_seasons', columns,
+                            {'season': season, 'team': team, 'situation': situation},
+                            combine_seasons=combine_seasons, quiet=quiet)
+
+    def team_games(self, season=None, team='ALL', start_date=None, end_date=None,
+                   situation=None, quiet=False, columns=None):
+        """ Same as pyhockey.team_games, reading only `columns` if given. """
+        self._check_dates(season, start_date, end_date)
+        return self._select('team_games', columns,
+                            {'season': season, 'team': team, 'situation': situation},
+                            start_date=start_date, end_date=end_date, quiet=quiet)
+
+    def skater_games(self, season=None, name=None, team='ALL', start_date=None, end_date=None,
+                     situation=None, quiet=False, columns=None):
+        """ Same as pyhockey.skater_games, reading only `columns` if given. """
+        self._check_dates(season, start_date, end_date)
+        return self._select('skater_games', columns,
+                            {'season': season, 'name': name, 'team': team,
+                             'situation': situation},
+                            start_date=start_date, end_date=end_date, quiet=quiet)
+
+    def goalie_games(self, season=None, name=None, team='ALL', start_date=None, end_date=None,
+                     situation=None, quiet=False, columns=None):
+        """ Same as pyhockey.goalie_games, reading only `columns` if given. """
+        self._check_dates(season, start_date, end_date)
+        return self._select('goalie_games', columns,
+                            {'season': season, 'name': name, 'team': team,
+                             'situation': situation},
+                            start_date=start_date, end_date=end_date, quiet=quiet)
+
+
+def fetch(ph, function, columns=None, **kwargs):
+    """
+    Calls a pyhockey function, keeping only the columns a chart needs. With the local backend
+    only those columns are read from the mirror, otherwise they're selected from the full frame.
+
+    :param ph: pyhockey, or whatever stands in for it.
+    :param str function: Name of the function, e.g. 'skater_seasons'.
+    :param list[str] columns: Columns to keep, defaults to all of them.
+    :param kwargs: The function's arguments.
+    :return pl.DataFrame: The function's result, with only `columns`, in that order, and its
+                          team, situation, position and name columns cast as in util/schema.py.
+    """
+    # Imported here rather than at the top, since it imports polars
+    from util import schema
+
+    if isinstance(ph, LocalHockey):
+        return schema.cast(getattr(ph, function)(columns=columns, **kwargs))
+
+    df = getattr(ph, function)(**kwargs)
+    return schema.cast(df.select(columns) if columns else df)
+
+
+def install(mirror=None):
+    """
+    Puts the local stand-in for pyhockey in sys.modules, so that it's what any later import of
+    pyhockey gets.
+
+    :param str mirror: The mirror's file, defaults to HOCKEY_MIRROR.
+    :return LocalHockey: The stand-in module.
+    """
+    # Combining seasons uses pyhockey's own functions, which can't be imported once the stand-in
+    # has taken its place
+    try:
+        import pyhockey.util.query_table  # noqa: F401
+    except ImportError:
+        pass
+    sys.modules['pyhockey'] = LocalHockey(mirror)
+    return sys.modules['pyhockey']
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('command', choices=['sync', 'next-game'],
+                        help='Sync the local mirror, or print the ID of the next game to report '
+                             'on (0 if there is none).')
+    parser.add_argument('last_game_id', nargs='?', type=int,
+                        help='ID of the most recent game reported on, for next-game.')
+    parser.add_argument('-t', '--tables', nargs='+', choices=TABLES, default=list(TABLES),
+                        help='Tables to sync, defaults to all of them.')
+    parser.add_argument('-s', '--seasons', nargs='+', type=int, default=[SEASON],
+                        help='Seasons to sync, or the season of the next game, defaults to the '
+                             'current one.')
+    parser.add_argument('-m', '--mirror', default=None,
+                        help=f'Mirror file, defaults to {MIRROR_VAR} or data/hockey.duckdb.')
+    parser.add_argument('--source', default=MOTHERDUCK,
+                        help='Database to sync from, defaults to MotherDuck.')
+    args = parser.parse_args()
+
+    if args.mirror:
+        os.environ[MIRROR_VAR] = args.mirror
+
+    if args.command == 'sync':
+        sync(args.tables, args.seasons, source=args.source)
+    else:
+        if args.last_game_id is None:
+            parser.error('next-game needs the ID of the most recent game reported on')
+        print(next_unreported_game(args.last_game_id, args.seasons[0]))
@@ -0,0 +1,156 @@
+"""
+Module for comparing rendered charts against reference images, for the golden-image tests (see
+tests/golden_images.py).
+
+Every function works on whole images as NumPy arrays, shaped (frames, height, width, RGBA) so a
+GIF is compared frame by frame the same way as a PNG. Two measures are used, since they catch
+different changes:
+    - The fraction of pixels where any channel differs by more than a tolerance, which catches
+      small but real changes, e.g. a moved logo or a different number in a table.
+    - A structural similarity (SSIM) score between 0 and 1, computed over sliding windows of the
+      luminance, which is insensitive to anti-aliasing noise, but drops with changes in layout.
+"""
+
+import numpy as np
+from PIL import Image, ImageSequence
+
+## Constants #########################################################################
+# Difference in a single channel (out of 255) that counts as a changed pixel
+DEFAULT_TOLERANCE = 8
+# Charts are considered to match with at least this SSIM score...
+MIN_SSIM = 0.995
+# ...and at most this fraction of changed pixels
+MAX_CHANGED_FRACTION = 0.0005
+
+# Side of the square windows SSIM is computed over, in pixels
+SSIM_WINDOW = 7
+# Stabilising constants from the SSIM paper, for 8-bit images
+SSIM_C1 = (0.01 * 255) ** 2
+SSIM_C2 = (0.03 * 255) ** 2
+
+# Weights of the red, green and blue channels in the luminance (ITU-R BT.601)
+LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114])
+## End Constants #####################################################################
+
+
+def load_image(source) -> np.ndarray:
+    """
+    Reads a PNG or GIF as an array of shape (frames, height, width, 4).
+
+    :param source: Filename or file-like object.
+    """
+    with Image.open(source) as img:
+        frames = ImageSequence.Iterator(img)
+        return np.stack([np.asarray(frame.convert('RGBA')) for frame in frames])
+
+
+def _pad_to(image, shape):
+    """ Pads an image with transparent pixels, at the end of every axis, to `shape`. """
+    return np.pad(image, [(0, target - size) for size, target in zip(image.shape, shape)])
+
+
+def luminance(image) -> np.ndarray:
+    """
+    The luminance of an image composited over white, as floats of shape (frames, height, width).
+    """
+    rgb = image[..., :3].astype(np.float64)
+    alpha = image[..., 3:].astype(np.float64) / 255
+    return (rgb * alpha + 255 * (1 - alpha)) @ LUMA_WEIGHTS
+
+
+def _window_means(values, window):
+    """
+    The mean over every `window` x `window` window of the last two axes, for all windows at once,
+    from an integral image (so the cost doesn't depend on the window size).
+    """
+    integral = np.pad(values.cumsum(axis=-1).cumsum(axis=-2), [(0, 0), (1, 0), (1, 0)])
+    sums = integral[:, window:, window:] - integral[:, :-window, window:] \
+        - integral[:, window:, :-window] + integral[:, :-window, :-window]
+    return sums / window ** 2
+
+
+def structural_similarity(expected, actual, window=SSIM_WINDOW) -> float:
+    """
+    Mean SSIM between the luminance of two images of the same shape, over every window.
+
+    :param np.ndarray expected: Reference image, as returned by `load_image`.
+    :param np.ndarray actual: Image to compare with it.
+    :param int window: Side of the windows.
+    :return float: 1 for identical images, lower the more their structure differs.
+    """
+    x, y = luminance(expected), luminance(actual)
+    mean_x, mean_y = _window_means(x, window), _window_means(y, window)
+    var_x = _window_means(x * x, window) - mean_x ** 2
+    var_y = _window_means(y * y, window) - mean_y ** 2
+    covariance = _window_means(x * y, window) - mean_x * mean_y
+
+    ssim = ((2 * mean_x * mean_y + SSIM_C1) * (2 * covariance + SSIM_C2)) \
+        / ((mean_x ** 2 + mean_y ** 2 + SSIM_C1) * (var_x + var_y + SSIM_C2))
+    return float(ssim.mean())
+
+
+def changed_pixels(expected, actual, tolerance=DEFAULT_TOLERANCE) -> np.ndarray:
+    """
+    Boolean mask of shape (frames, height, width), of the pixels where any channel differs by
+    more than `tolerance`.
+    """
+    difference = np.abs(expected.astype(np.int16) - actual.astype(np.int16))
+    return (difference > tolerance).any(axis=-1)
+
+
+def compare(expected, actual, tolerance=DEFAULT_TOLERANCE) -> dict:
+    """
+    Compares an image against a reference. Images of different sizes (or frame counts) are
+    compared after padding the smaller one, so every pixel outside of it counts as changed.
+
+    :param np.ndarray expected: Reference image, as returned by `load_image`.
+    :param np.ndarray actual: Image to compare with it.
+    :param int tolerance: Difference in a channel that counts as a changed pixel.
+    :return dict: Whether the shapes match, the largest difference in any channel, the number
+                  and fraction of changed pixels, and the SSIM score.
+    """
+    same_shape = expected.shape == actual.shape
+    if not same_shape:
+        shape = np.maximum(expected.shape, actual.shape)
+        expected, actual = _pad_to(expected, shape), _pad_to(actual, shape)
+
+    changed = changed_pixels(expected, actual, tolerance)
+    return {
+        'same_shape': same_shape,
+        'max_difference': int(np.abs(expected.astype(np.int16) - actual.astype(np.int16)).max()),
+        'changed_pixels': int(changed.sum()),
+        'changed_fraction': float(changed.mean()),
+        'ssim': structural_similarity(expected, actual),
+    }
+
+
+def matches(result, min_ssim=MIN_SSIM, max_changed_fraction=MAX_CHANGED_FRACTION) -> bool:
+    """
+    Whether a comparison from `compare` is close enough for the images to count as the same.
+    """
+    return result['same_shape'] and result['ssim'] >= min_ssim \
+        and result['changed_fraction'] <= max_changed_fraction
+
+
+def write_heatmap(expected, actual, filename, tolerance=DEFAULT_TOLERANCE):
+    """
+    Writes a PNG of the reference image, faded, with the changed pixels in red, brighter the
+    larger the change. For an animation, it's the frame with the most changed pixels.
+
+    :param np.ndarray expected: Reference image, as returned by `load_image`.
+    :param np.ndarray actual: Image compared with it.
+    :param str filename: File to write the heatmap to.
+    :param int tolerance: Difference in a channel that counts as a changed pixel.
+    """
+    shape = np.maximum(expected.shape, actual.shape)
+    expected, actual = _pad_to(expected, shape), _pad_to(actual, shape)
+    changed = changed_pixels(expected, actual, tolerance)
+    frame = int(changed.sum(axis=(1, 2)).argmax())
+
+    background = 255 - 0.3 * (255 - luminance(expected[frame:frame + 1])[0])
+    magnitude = np.abs(expected[frame].astype(np.int16) - actual[frame].astype(np.int16)).max(-1)
+    strength = np.where(changed[frame], 0.4 + 0.6 * magnitude / 255, 0)[..., None]
+
+    red = np.array([220, 20, 20], dtype=np.float64)
+    heatmap = background[..., None] * (1 - strength) + red * strength
+    Image.fromarray(heatmap.round().astype(np.uint8), 'RGB').save(filename)
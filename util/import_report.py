@@ -0,0 +1,108 @@
+"""
+Module for reporting where an entry script spends its start-up time, based on the output of
+Python's `-X importtime` flag.
+
+The script is run in a fresh interpreter (by default with `--help`, so only the imports and the
+argument parser are exercised), and the time spent importing each module is broken down per
+top-level package, e.g.
+    python util/import_report.py hockey/skater_plots/plot_skater_points.py
+    python util/import_report.py baseball/team_plots/plot_obp_vs_slg.py --top 30 -- -y 2025
+"""
+
+import os
+import re
+import sys
+import time
+import argparse
+import subprocess
+from collections import defaultdict
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Matches lines like 'import time:       512 |       1803 |   polars.dataframe'
+IMPORTTIME_PATTERN = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def measure_imports(script, args=('--help',)):
+    """
+    Runs the given script in a fresh interpreter with `-X importtime` and collects the time spent
+    importing each module.
+
+    :param str script: Path to the entry script, relative to the repo root or absolute.
+    :param list[str] args: Command-line arguments for the script.
+    :return dict: With keys 'wall' (total run time in seconds), 'returncode' and 'modules', a
+                  list of (module name, self time in seconds, cumulative time in seconds) tuples
+                  in the order the imports completed.
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [REPO_ROOT, env.get('PYTHONPATH')]))
+
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', script] + list(args),
+                            cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=False)
+    wall = time.perf_counter() - start
+
+    modules = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, _, name = match.groups()
+            modules.append((name, int(self_us) / 1e6, int(cumulative_us) / 1e6))
+
+    return {'wall': wall, 'returncode': result.returncode, 'modules': modules}
+
+
+def time_by_package(modules):
+    """
+    Sums the self time of every imported module into its top-level package.
+
+    :param list[tuple] modules: Module timings, as returned by `measure_imports`.
+    :return list[tuple]: (package, total seconds, number of modules), slowest first.
+    """
+    totals = defaultdict(float)
+    counts = defaultdict(int)
+    for name, self_time, _ in modules:
+        package = name.split('.')[0]
+        totals[package] += self_time
+        counts[package] += 1
+    return sorted(((p, totals[p], counts[p]) for p in totals), key=lambda x: x[1], reverse=True)
+
+
+def format_report(script, report, top=20):
+    """
+    Returns a printable breakdown of the import times for a script.
+
+    :param str script: The script that was measured.
+    :param dict report: The report returned by `measure_imports`.
+    :param int top: Number of packages and modules to list.
+    :return str: The formatted report.
+    """
+    modules = report['modules']
+    import_total = sum(self_time for _, self_time, _ in modules)
+    lines = [f"{script}: {report['wall']:.3f}s wall, {import_total:.3f}s importing "
+             f"{len(modules)} modules",
+             '',
+             f"{'Package':<40}{'Self (ms)':>12}{'Modules':>10}"]
+    for package, total, count in time_by_package(modules)[:top]:
+        lines.append(f"{package:<40}{total * 1000:>12.1f}{count:>10}")
+
+    lines += ['', f"{'Module':<40}{'Cumulative (ms)':>18}"]
+    slowest = sorted(modules, key=lambda x: x[2], reverse=True)[:top]
+    for name, _, cumulative in slowest:
+        lines.append(f"{name:<40}{cumulative * 1000:>18.1f}")
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('script', help='Entry script to measure, e.g. '
+                                       'hockey/skater_plots/plot_skater_points.py')
+    parser.add_argument('script_args', nargs='*', default=['--help'],
+                        help='Arguments passed to the script, defaults to --help. Put them '
+                             'after a -- separator.')
+    parser.add_argument('-n', '--top', type=int, default=20,
+                        help='Number of packages and modules to list.')
+    cli_args = parser.parse_args()
+
+    print(format_report(cli_args.script, measure_imports(cli_args.script, cli_args.script_args),
+                        top=cli_args.top))
@@ -0,0 +1,52 @@
+"""
+Helper for deferring heavy imports (polars, pyhockey, pybaseball, seaborn, etc.) until they are
+actually used, so that things like `--help` on an entry script return immediately.
+
+Usage mirrors a normal module import:
+    pl = lazy_import('polars')
+The module is only executed the first time one of its attributes is accessed.
+
+With FIXTURE_MODE set, pyhockey and pybaseball are replaced by stand-ins that record or replay
+their calls, see util/fixture_store.py. Otherwise, with HOCKEY_BACKEND=local, pyhockey is
+replaced by a stand-in that reads from the local DuckDB mirror, see util/hockey_data.py.
+"""
+
+import sys
+import importlib.util
+
+from util import fixture_store, hockey_data
+
+
+def lazy_import(name):
+    """
+    Returns the module `name`, but defers executing it until an attribute is first accessed.
+    If the module has already been imported, it is returned as-is.
+
+    :param str name: Fully-qualified module name, e.g. 'scipy.interpolate'.
+    :return module: The (possibly not-yet-executed) module.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    if name in fixture_store.MODULES and fixture_store.mode() is not None:
+        return fixture_store.install(name)
+
+    if name == 'pyhockey' and hockey_data.backend() == 'local':
+        return hockey_data.install()
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    # Mirror what a regular import does for submodules, i.e. make `parent.child` resolve
+    parent_name, _, child_name = name.rpartition('.')
+    if parent_name:
+        setattr(sys.modules[parent_name], child_name, module)
+
+    return module
@@ -0,0 +1,186 @@
+"""
+Module for timing where the time goes when rendering a chart.
+
+Every Plot has a timer, which records the wall and CPU time of each phase of the render: building
+the artists in make_plot, styling, and savefig (split further into drawing the artists, which
+includes constrained layout for a MultiPlot, while the rest of savefig is encoding). Subclasses
+add their own sub-phases with `self.timer.phase(...)`, e.g. 'logos' or 'swarm_layout', and entry
+scripts can time their data prep with the module-level `phase(...)`.
+
+Timing is off by default, in which case phases are a shared no-op context manager. It's turned
+on either by setting the PLOT_TIMING environment variable or by calling `enable()` (e.g. from a
+--timing flag): with '1' or 'stderr', records go to stderr, otherwise the value is the path of a
+file records are appended to. One JSON line is written per plot, once its outermost phase ends:
+
+    {"plot": "RatioScatterPlot", "filename": "xg_ratios.png",
+     "phases": {"make_plot": {"wall": 0.91, "cpu": 0.89, "count": 1},
+                "make_plot.logos": {...}, "make_plot.savefig": {...},
+                "make_plot.savefig.draw": {...}, ...}}
+
+Nested phases are named by their path, and a phase that runs more than once in a plot (e.g.
+'logos' for both the league context and the team's players) is summed, with its count.
+"""
+
+import os
+import sys
+import json
+import time
+import functools
+from contextlib import contextmanager, nullcontext
+
+ENV_VAR = 'PLOT_TIMING'
+
+# Where records go: None when timing is off, 'stderr', or a file path
+_target = os.environ.get(ENV_VAR) or None
+
+# Returned for every phase when timing is off, so it costs a single method call
+_NO_OP = nullcontext()
+
+
+def enable(target: str = 'stderr') -> None:
+    """
+    Turns timing on for every plot created from now on.
+
+    :param str target: 'stderr', or the path of a file to append JSON lines to.
+    """
+    global _target
+    _target = target
+
+
+def disable() -> None:
+    """
+    Turns timing off for every plot created from now on.
+    """
+    global _target
+    _target = None
+
+
+def is_enabled() -> bool:
+    return _target is not None
+
+
+def write_record(record: dict) -> None:
+    """
+    Writes a single JSON line to the configured target.
+    """
+    line = json.dumps(record) + '\n'
+    if _target in ('1', 'stderr'):
+        sys.stderr.write(line)
+    else:
+        with open(_target, 'a', encoding='utf-8') as fo:
+            fo.write(line)
+
+
+class PhaseTimer:
+    """
+    Records the wall and CPU time of nested phases, writing them as one record once the
+    outermost phase ends.
+    """
+    def __init__(self, name, filename=''):
+        self.name = name
+        self.filename = filename
+        self.phases = {}
+        self._stack = []
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Context manager timing everything run within it as the phase `name`, nested under any
+        phase that's already running.
+        """
+        self._stack.append(name)
+        path = '.'.join(self._stack)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            totals = self.phases.setdefault(path, {'wall': 0.0, 'cpu': 0.0, 'count': 0})
+            totals['wall'] += time.perf_counter() - wall
+            totals['cpu'] += time.process_time() - cpu
+            totals['count'] += 1
+            self._stack.pop()
+
+            if not self._stack:
+                self.emit()
+
+    def instrument(self, obj, method_name, name):
+        """
+        Times every call of a method of `obj` as the phase `name`, for work done inside
+        matplotlib, such as drawing the figure during savefig.
+        """
+        method = getattr(obj, method_name)
+        if getattr(method, '_timed_by', None) is self:
+            return
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            with self.phase(name):
+                return method(*args, **kwargs)
+
+        timed._timed_by = self
+        setattr(obj, method_name, timed)
+
+    def emit(self):
+        """
+        Writes the phases recorded so far and starts over.
+        """
+        if self.phases:
+            write_record({'plot': self.name, 'filename': self.filename, 'phases': self.phases})
+        self.phases = {}
+
+
+class NullTimer:
+    """
+    Stand-in for PhaseTimer when timing is off.
+    """
+    def phase(self, name):
+        return _NO_OP
+
+    def instrument(self, obj, method_name, name):
+        pass
+
+    def emit(self):
+        pass
+
+
+NULL_TIMER = NullTimer()
+
+
+def timer_for(name: str, filename: str = ''):
+    """
+    Returns a PhaseTimer if timing is on, otherwise the shared NullTimer.
+
+    :param str name: What's being timed, e.g. the Plot's class name.
+    :param str filename: The file being rendered, if any.
+    """
+    return PhaseTimer(name, filename) if is_enabled() else NULL_TIMER
+
+
+def timed(name):
+    """
+    Decorator timing a Plot method as the phase `name`, using the Plot's own timer.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.timer.phase(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# Timer for work outside of any Plot, such as data prep in an entry script
+_script_timer = None
+
+
+def phase(name):
+    """
+    Context manager timing a phase of an entry script, e.g. data prep. Written as its own
+    record, under the script's name.
+    """
+    global _script_timer
+    if not is_enabled():
+        return _NO_OP
+    if _script_timer is None:
+        _script_timer = PhaseTimer('script', os.path.basename(sys.argv[0]))
+    return _script_timer.phase(name)
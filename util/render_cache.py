@@ -0,0 +1,364 @@
+"""
+Module for caching rendered charts, so that a chart whose input data and configuration haven't
+changed since the last run can be reused without drawing it again.
+
+Most of the nightly charts (skater ratios, GSAx bars, wRC+ swarms) don't change for teams that
+didn't play, so the key for each chart is a hash of:
+  i. the exact input DataFrame(s), or just the relevant columns of them,
+ ii. every other argument passed to the Plot constructor,
+iii. a code-version salt, built from the source of the plot modules involved, every module of the
+     repo they import (fonts, colours, team maps, ...), and the team logos.
+
+The cache is only used when the `RENDER_CACHE_DIR` environment variable is set. Its size is
+capped by `RENDER_CACHE_MAX_MB` (defaults to 500), with least-recently-used entries evicted first.
+
+Running this module directly prints the hit rates for each chart type, e.g.
+    python util/render_cache.py
+"""
+
+import os
+import ast
+import json
+import time
+import shutil
+import hashlib
+import inspect
+from functools import lru_cache
+
+from util.lazy_import import lazy_import
+
+pl = lazy_import('polars')
+
+# Bump this to invalidate every cached chart, for changes the salt below can't see (e.g. to a
+# library the plots use)
+CACHE_VERSION = 1
+
+DEFAULT_MAX_MB = 500
+INDEX_FILENAME = 'index.json'
+
+# Root of the repo, which the modules a chart's output depends on are looked up in
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Modules every chart can depend on even when its Plot class doesn't import them, e.g. the team
+# maps the scripts (and util/schema.py) shape the data with
+SHARED_MODULES = ('util/font_dicts.py', 'util/helpers.py', 'util/team_maps.py',
+                  'util/color_maps.py')
+
+
+def stable_repr(value):
+    """
+    Returns a repr of the given value that is stable between processes, i.e. sets and dict keys
+    are sorted so that hash randomization doesn't change the resulting cache key.
+
+    :param value: Any plot constructor argument.
+    :return str: The stable representation of the value.
+    """
+    if isinstance(value, dict):
+        items = sorted((stable_repr(k), stable_repr(v)) for k, v in value.items())
+        return '{' + ', '.join(f'{k}: {v}' for k, v in items) + '}'
+    if isinstance(value, (set, frozenset)):
+        return '{' + ', '.join(sorted(stable_repr(x) for x in value)) + '}'
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__ + '(' + ', '.join(stable_repr(x) for x in value) + ')'
+    return repr(value)
+
+
+def hash_dataframe(df, columns=None):
+    """
+    Hashes the contents of a polars or pandas DataFrame. If `columns` is provided, only those
+    columns contribute to the hash.
+
+    :param DataFrame df: The polars or pandas DataFrame to hash.
+    :param list[str] columns: Optional list of the columns relevant to the plot.
+    :return str: Hex digest of the DataFrame contents.
+    """
+    digest = hashlib.sha256()
+    if isinstance(df, pl.DataFrame):
+        if columns is not None:
+            df = df.select([c for c in columns if c in df.columns])
+        digest.update(stable_repr(list(df.schema.items())).encode())
+        if df.width > 0:
+            digest.update(df.hash_rows(seed=0).to_numpy().tobytes())
+    else:
+        # Only pandas is left, which is already loaded by whatever created the DataFrame
+        import pandas as pd
+        if columns is not None:
+            df = df[[c for c in columns if c in df.columns]]
+        digest.update(stable_repr(list(df.dtypes.astype(str).items())).encode())
+        digest.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+def _repo_imports(path):
+    """
+    The files of the repo's modules imported by a module, e.g. util/font_dicts.py for
+    `from util.font_dicts import title_params`. Third-party imports are left out.
+
+    :param str path: The module's file.
+    :return list[str]: The imported modules' files.
+    """
+    with open(path, encoding='utf-8') as fi:
+        tree = ast.parse(fi.read())
+
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            # Either `from util.helpers import ratio_to_color` or `from util import plot_timing`
+            names.append(node.module)
+            names.extend(f'{node.module}.{alias.name}' for alias in node.names)
+
+    files = (os.path.join(REPO_ROOT, *name.split('.')) + '.py' for name in names)
+    return [file for file in files if os.path.isfile(file)]
+
+
+@lru_cache(maxsize=None)
+def source_files(plot_class):
+    """
+    The source files a Plot subclass's output depends on: its own module, those of the Plot
+    classes it inherits from, SHARED_MODULES, and every module of the repo those import,
+    directly or not.
+
+    :param type plot_class: The Plot subclass being rendered.
+    :return tuple[str]: The files, sorted.
+    """
+    pending = [os.path.join(REPO_ROOT, *module.split('/')) for module in SHARED_MODULES]
+    for cls in plot_class.__mro__:
+        if cls is object:
+            continue
+        try:
+            pending.append(os.path.abspath(inspect.getsourcefile(cls)))
+        except TypeError:
+            continue
+
+    found = set()
+    while pending:
+        path = pending.pop()
+        if path not in found:
+            found.add(path)
+            pending.extend(_repo_imports(path))
+    return tuple(sorted(found))
+
+
+@lru_cache(maxsize=None)
+def logo_digest(root):
+    """
+    Hash of every team logo under a directory, read once per process.
+
+    :param str root: Directory laid out like team_logos/.
+    :return str: Hex digest of the logos' paths and contents, empty if there are none.
+    """
+    digest = hashlib.sha256()
+    for directory, _, files in sorted(os.walk(root)):
+        for filename in sorted(files):
+            path = os.path.join(directory, filename)
+            digest.update(os.path.relpath(path, root).encode())
+            with open(path, 'rb') as fi:
+                digest.update(fi.read())
+    return digest.hexdigest()
+
+
+def code_version_salt(plot_class):
+    """
+    Returns a salt that changes whenever the source of the given Plot subclass (or any Plot class
+    it inherits from, or any module of the repo those import) changes, or the team logos do, so
+    that those changes invalidate previously cached charts.
+
+    :param type plot_class: The Plot subclass being rendered.
+    :return str: Hex digest of the relevant source files and logos.
+    """
+    # Already imported along with any Plot subclass
+    from plot_types import plot
+
+    digest = hashlib.sha256(f'{CACHE_VERSION}:{pl.__version__}'.encode())
+    for path in source_files(plot_class):
+        digest.update(os.path.relpath(path, REPO_ROOT).encode())
+        with open(path, 'rb') as fi:
+            digest.update(fi.read())
+    digest.update(logo_digest(plot.LOGO_ROOT).encode())
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """
+    A size-capped store of rendered PNGs on local disk, keyed by the hash of a chart's inputs.
+
+    Also keeps track of hits and misses for each chart type, persisted in the index alongside
+    the last-used time and size of every entry.
+    """
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_MB * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(directory, INDEX_FILENAME)
+        os.makedirs(directory, exist_ok=True)
+        self.index = self.load_index()
+
+
+    @classmethod
+    def from_env(cls):
+        """
+        Returns a RenderCache configured from the environment, or None if caching is disabled.
+        """
+        directory = os.environ.get('RENDER_CACHE_DIR')
+        if not directory:
+            return None
+        max_mb = float(os.environ.get('RENDER_CACHE_MAX_MB', DEFAULT_MAX_MB))
+        return cls(directory, max_bytes=int(max_mb * 1024 * 1024))
+
+
+    def load_index(self):
+        """
+        Reads the index from disk, starting a fresh one if it is missing or unreadable.
+        """
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as fi:
+                index = json.load(fi)
+        except (OSError, ValueError):
+            index = {}
+        index.setdefault('entries', {})
+        index.setdefault('stats', {})
+        return index
+
+
+    def save_index(self):
+        """
+        Writes the index to disk, via a temporary file so a crash never leaves it half-written.
+        """
+        tmp_path = f'{self.index_path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as fo:
+            json.dump(self.index, fo, indent=1)
+        os.replace(tmp_path, self.index_path)
+
+
+    def make_key(self, plot_class, kwargs, hash_columns=None):
+        """
+        Builds the cache key for a chart from its constructor arguments.
+
+        Every DataFrame argument is hashed by content and everything else by its stable repr.
+        The output filename is left out, since it doesn't change what gets drawn.
+
+        :param type plot_class: The Plot subclass being rendered.
+        :param dict kwargs: Keyword arguments for the Plot constructor.
+        :param list[str] hash_columns: If given, only these DataFrame columns are hashed.
+        :return str: The cache key.
+        """
+        digest = hashlib.sha256(code_version_salt(plot_class).encode())
+        digest.update(plot_class.__qualname__.encode())
+        for name in sorted(kwargs):
+            if name == 'filename':
+                continue
+            value = kwargs[name]
+            if isinstance(value, pl.DataFrame) or type(value).__name__ == 'DataFrame':
+                value = hash_dataframe(value, hash_columns)
+            else:
+                value = stable_repr(value)
+            digest.update(f'{name}={value};'.encode())
+        return digest.hexdigest()
+
+
+    def entry_path(self, key):
+        """ Path of the cached PNG for the given key. """
+        return os.path.join(self.directory, f'{key}.png')
+
+
+    def fetch(self, key, chart_type, filename):
+        """
+        Copies the cached PNG for `key` to `filename`, if one exists.
+
+        :return bool: True on a cache hit, False otherwise.
+        """
+        stats = self.index['stats'].setdefault(chart_type, {'hits': 0, 'misses': 0})
+        entry = self.index['entries'].get(key)
+        if entry is None or not os.path.exists(self.entry_path(key)):
+            self.index['entries'].pop(key, None)
+            stats['misses'] += 1
+            self.save_index()
+            return False
+
+        shutil.copyfile(self.entry_path(key), filename)
+        entry['last_used'] = time.time()
+        stats['hits'] += 1
+        self.save_index()
+        return True
+
+
+    def store(self, key, chart_type, filename):
+        """
+        Adds a freshly rendered PNG to the cache, then evicts old entries if over the size cap.
+        """
+        if not os.path.exists(filename):
+            return
+        shutil.copyfile(filename, self.entry_path(key))
+        self.index['entries'][key] = {
+            'chart_type': chart_type,
+            'size': os.path.getsize(filename),
+            'last_used': time.time()
+        }
+        self.evict()
+        self.save_index()
+
+
+    def evict(self):
+        """
+        Removes the least-recently-used entries until the cache fits within `self.max_bytes`.
+        """
+        entries = self.index['entries']
+        total = sum(entry['size'] for entry in entries.values())
+        for key in sorted(entries, key=lambda k: entries[k]['last_used']):
+            if total <= self.max_bytes:
+                break
+            total -= entries[key]['size']
+            del entries[key]
+            try:
+                os.remove(self.entry_path(key))
+            except OSError:
+                pass
+
+
+    def report(self):
+        """
+        Returns a printable summary of the hit rate for each chart type.
+        """
+        lines = [f"{'Chart type':<30}{'Hits':>8}{'Misses':>8}{'Hit rate':>10}"]
+        for chart_type, stats in sorted(self.index['stats'].items()):
+            total = stats['hits'] + stats['misses']
+            rate = stats['hits'] / total if total else 0.0
+            lines.append(f"{chart_type:<30}{stats['hits']:>8}{stats['misses']:>8}{rate:>10.1%}")
+        size_mb = sum(e['size'] for e in self.index['entries'].values()) / (1024 * 1024)
+        lines.append(f"{len(self.index['entries'])} cached charts, {size_mb:.1f} MB "
+                     f"of {self.max_bytes / (1024 * 1024):.0f} MB")
+        return '\n'.join(lines)
+
+
+def render_cached(plot_class, chart_type=None, hash_columns=None, **kwargs):
+    """
+    Renders `plot_class(**kwargs).make_plot()` to `kwargs['filename']`, unless an identical chart
+    is already in the render cache, in which case the cached PNG is copied there without drawing.
+
+    When `RENDER_CACHE_DIR` isn't set this is just a plain render.
+
+    :param type plot_class: The Plot subclass to render.
+    :param str chart_type: Name used to group hit rates, defaults to the class name.
+    :param list[str] hash_columns: The DataFrame columns relevant to the plot. Defaults to all.
+    :param kwargs: Keyword arguments for the Plot constructor, must include 'filename'.
+    """
+    cache = RenderCache.from_env()
+    if cache is None:
+        plot_class(**kwargs).make_plot()
+        return
+
+    chart_type = chart_type or plot_class.__name__
+    key = cache.make_key(plot_class, kwargs, hash_columns)
+    if cache.fetch(key, chart_type, kwargs['filename']):
+        return
+
+    plot_class(**kwargs).make_plot()
+    cache.store(key, chart_type, kwargs['filename'])
+
+
+if __name__ == '__main__':
+    render_cache = RenderCache.from_env()
+    if render_cache is None:
+        print("RENDER_CACHE_DIR is not set, render caching is disabled.")
+    else:
+        print(render_cache.report())
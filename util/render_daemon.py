@@ -0,0 +1,225 @@
+"""
+Long-running render worker that keeps the heavy imports, the matplotlib font cache and every
+decoded team logo warm, so that each chart only pays for its own data and drawing.
+
+Start the daemon from the repo root:
+    python util/render_daemon.py serve --workers 4 --max-jobs 50
+
+Then run any entry script through it, with the same arguments it would normally take:
+    python util/render_daemon.py run hockey/game_report/assemble_report.py -g 2025020001
+
+Jobs are accepted over a local Unix socket and run concurrently in a pool of worker processes.
+Each worker is recycled after `--max-jobs` jobs to contain any leaked figures or memory. If no
+daemon is listening, `run` falls back to running the script in a fresh Python process.
+
+Note that the workers keep the repo modules cached as well, so restart the daemon after changing
+anything under plot_types/ or util/.
+"""
+
+import os
+import sys
+import io
+import json
+import runpy
+import socket
+import argparse
+import traceback
+import subprocess
+import socketserver
+import multiprocessing
+from contextlib import redirect_stdout, redirect_stderr
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SOCKET = os.environ.get('RENDER_DAEMON_SOCKET', '/tmp/chart-plotting-render.sock')
+
+# Modules imported once in the daemon, and inherited by every worker process
+PRELOAD_MODULES = ['numpy', 'polars', 'pandas', 'scipy.interpolate', 'seaborn', 'pybaseball',
+                   'pyhockey', 'plot_types.plot', 'plot_types.ratio_scatter',
+                   'plot_types.swarm', 'plot_types.scoreboard', 'plot_types.mirrored_bar',
+                   'plot_types.multiplot', 'plot_types.sequential_bar',
+                   'plot_types.layered_lollipop', 'plot_types.rolling_average',
+                   'plot_types.animated_rolling_average', 'plot_types.cumulative_lines']
+
+
+def preload():
+    """
+    Imports every heavy dependency, builds the font cache and decodes every team logo. This runs
+    once in the daemon before the worker pool is started, so forked workers start warm.
+    """
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+
+    import matplotlib
+    matplotlib.use('agg')
+    import matplotlib.pyplot  # pylint: disable=unused-import
+    from matplotlib import font_manager
+
+    for module in PRELOAD_MODULES:
+        try:
+            __import__(module)
+        except ImportError as e:
+            print(f"Skipping preload of {module}: {e}")
+
+    # Resolve the fonts used in the charts, which is what populates the font cache
+    for weight in [600, 700, 800, 900, 'bold', 'normal']:
+        font_manager.findfont(font_manager.FontProperties(family='sans-serif', weight=weight))
+
+    from plot_types.plot import load_logo, LOGO_ROOT
+    logo_root = os.path.join(REPO_ROOT, LOGO_ROOT)
+    num_logos = 0
+    for sport in os.listdir(logo_root):
+        for size in os.listdir(os.path.join(logo_root, sport)):
+            for filename in os.listdir(os.path.join(logo_root, sport, size)):
+                team, ext = os.path.splitext(filename)
+                if ext != '.png':
+                    continue
+                cwd = os.getcwd()
+                os.chdir(REPO_ROOT)
+                try:
+                    load_logo(team, size=size, sport=sport)
+                    num_logos += 1
+                finally:
+                    os.chdir(cwd)
+    print(f"Preloaded {len(PRELOAD_MODULES)} modules and {num_logos} logos")
+
+
+def run_job(script, args, cwd):
+    """
+    Runs an entry script as if it were called from the command line, inside a worker process.
+
+    :param str script: Path to the entry script, relative to `cwd` or absolute.
+    :param list[str] args: Command-line arguments for the script.
+    :param str cwd: Working directory the client was called from.
+    :return dict: Return code and combined stdout/stderr of the job.
+    """
+    import matplotlib.pyplot as plt
+
+    output = io.StringIO()
+    old_cwd = os.getcwd()
+    old_argv = sys.argv
+    returncode = 0
+    try:
+        os.chdir(cwd)
+        sys.argv = [script] + list(args)
+        with redirect_stdout(output), redirect_stderr(output):
+            runpy.run_path(script, run_name='__main__')
+    except SystemExit as e:
+        # argparse exits on --help or bad arguments, which shouldn't take down the worker
+        if isinstance(e.code, int):
+            returncode = e.code
+        elif e.code is not None:
+            output.write(f"{e.code}\n")
+            returncode = 1
+    except Exception:  # pylint: disable=broad-exception-caught
+        output.write(traceback.format_exc())
+        returncode = 1
+    finally:
+        # Entry scripts don't close their figures, so do it here to keep the worker lean
+        plt.close('all')
+        sys.argv = old_argv
+        os.chdir(old_cwd)
+
+    return {'returncode': returncode, 'output': output.getvalue()}
+
+
+class RenderRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handles a single job per connection. The request and response are each one line of JSON.
+    """
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            result = self.server.pool.apply(run_job, (request['script'],
+                                                      request.get('args', []),
+                                                      request.get('cwd', REPO_ROOT)))
+        except Exception:  # pylint: disable=broad-exception-caught
+            result = {'returncode': 1, 'output': traceback.format_exc()}
+        self.wfile.write(json.dumps(result).encode() + b'\n')
+
+
+class RenderServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Unix socket server that hands each job off to a pool of warm, recyclable worker processes.
+    """
+    daemon_threads = True
+
+    def __init__(self, socket_path, workers, max_jobs):
+        # Fork the pool before any server threads exist, from the already-warm daemon process
+        self.pool = multiprocessing.get_context('fork').Pool(processes=workers,
+                                                             maxtasksperchild=max_jobs)
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        super().__init__(socket_path, RenderRequestHandler)
+
+    def server_close(self):
+        super().server_close()
+        self.pool.terminate()
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+
+
+def serve(socket_path, workers, max_jobs):
+    """
+    Preloads everything and serves render jobs until interrupted.
+    """
+    preload()
+    server = RenderServer(socket_path, workers, max_jobs)
+    print(f"Render daemon listening on {socket_path} with {workers} workers, "
+          f"recycled every {max_jobs} jobs")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def submit(script, args, socket_path=DEFAULT_SOCKET):
+    """
+    Sends a job to the render daemon and waits for it to finish. Falls back to running the script
+    in a fresh process if the daemon isn't running.
+
+    :param str script: Path to the entry script.
+    :param list[str] args: Command-line arguments for the script.
+    :param str socket_path: Path of the daemon's Unix socket.
+    :return int: Return code of the job.
+    """
+    request = {'script': script, 'args': list(args), 'cwd': os.getcwd()}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+            sock.sendall(json.dumps(request).encode() + b'\n')
+            with sock.makefile('rb') as response_file:
+                response = json.loads(response_file.readline())
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"No render daemon at {socket_path}, running {script} directly", file=sys.stderr)
+        return subprocess.run([sys.executable, script] + list(args), check=False).returncode
+
+    sys.stdout.write(response['output'])
+    return response['returncode']
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--socket', default=DEFAULT_SOCKET,
+                        help='Path of the Unix socket used to talk to the daemon.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = subparsers.add_parser('serve', help='Start the render daemon.')
+    serve_parser.add_argument('-w', '--workers', type=int, default=os.cpu_count(),
+                              help='Number of worker processes, defaults to the CPU count.')
+    serve_parser.add_argument('-m', '--max-jobs', type=int, default=50,
+                              help='Number of jobs after which a worker is recycled.')
+
+    run_parser = subparsers.add_parser('run', help='Run an entry script through the daemon.')
+    run_parser.add_argument('script', help='Entry script to run, e.g. '
+                                           'hockey/game_report/assemble_report.py')
+    run_parser.add_argument('script_args', nargs=argparse.REMAINDER,
+                            help='Arguments passed through to the entry script.')
+
+    cli_args = parser.parse_args()
+
+    if cli_args.command == 'serve':
+        serve(cli_args.socket, cli_args.workers, cli_args.max_jobs)
+    else:
+        sys.exit(submit(cli_args.script, cli_args.script_args, socket_path=cli_args.socket))
@@ -0,0 +1,77 @@
+"""
+Module with the dtypes of the string columns that charts filter and group on over and over, e.g.
+`pl.col('team') == team` or `pl.col('situation') == 'ev'` for every team and situation in the
+game report.
+
+Teams, situations and positions come from small fixed sets, so they're cast to a `pl.Enum` of
+them (with the teams taken from util/team_maps.py). Filters and group-bys then compare integer
+codes rather than strings, and each value takes up a few bytes instead of its full string.
+Names can't be listed in advance, so they're cast to `pl.Categorical` instead.
+
+Frames are cast when they're loaded, by `cast`:
+
+    df = schema.cast(ph.skater_games(season=2025))
+
+Every category list is sorted, so sorting on a cast column gives the same order as on strings.
+"""
+
+import polars as pl
+
+from util.team_maps import team_full_names, mlb_team_full_names
+
+## Constants #########################################################################
+NHL_TEAMS = pl.Enum(sorted(team_full_names))
+MLB_TEAMS = pl.Enum(sorted(mlb_team_full_names))
+
+# Situations of the season tables ('5on5', ...), and of the game tables ('ev', ...)
+SITUATIONS = pl.Enum(sorted({'5on5', '5on4', '4on5', 'other', 'all', 'ev', 'pp', 'pk'}))
+POSITIONS = pl.Enum(sorted({'C', 'L', 'R', 'D', 'G'}))
+
+# Dtype of each column that's cast, for each league
+SCHEMAS = {
+    'nhl': {
+        'team': NHL_TEAMS,
+        'opposingTeam': NHL_TEAMS,
+        'situation': SITUATIONS,
+        'position': POSITIONS,
+        'name': pl.Categorical,
+    },
+    'mlb': {
+        'team': MLB_TEAMS,
+    },
+}
+## End Constants #####################################################################
+
+
+def dtype_for(series, dtype):
+    """
+    The dtype a column is cast to: `dtype` itself, unless it's an Enum that's missing some of
+    the column's values (e.g. a team that isn't in util/team_maps.py yet), in which case it's
+    Categorical, so that loading new data never fails.
+
+    :param pl.Series series: The column, of strings.
+    :param pl.DataType dtype: Its dtype in the schema.
+    """
+    if isinstance(dtype, pl.Enum):
+        known = series.drop_nulls().is_in(dtype.categories.implode()).all()
+        if not known:
+            return pl.Categorical
+    return dtype
+
+
+def cast(df, league='nhl'):
+    """
+    Casts the string columns of a frame that are in a league's schema, leaving anything else
+    (including frames that aren't polars) as it is.
+
+    :param pl.DataFrame df: Frame, as loaded.
+    :param str league: 'nhl' or 'mlb'.
+    :return pl.DataFrame: The frame, with the columns cast.
+    """
+    if not isinstance(df, pl.DataFrame):
+        return df
+
+    dtypes = {column: dtype_for(df[column], dtype)
+              for column, dtype in SCHEMAS[league].items()
+              if column in df.columns and df.schema[column] == pl.String}
+    return df.cast(dtypes) if dtypes else df
@@ -0,0 +1,94 @@
+"""
+Module for exporting figures as SVG with each distinct embedded image written only once.
+
+matplotlib's SVG backend inlines a full base64 PNG in an <image> element every time an image is
+drawn, so a scatter plot of 40 players from 10 teams embeds 40 copies of those 10 logos. Here,
+every image that appears more than once is moved into <defs> and each occurrence is replaced
+by a <use> element referencing it, keeping the occurrence's own position, transform, clipping
+and opacity.
+"""
+
+import io
+import re
+
+# An <image> element as written by matplotlib, which is always self-closing
+IMAGE_PATTERN = re.compile(r'<image\s(?P<attributes>[^>]*?)/>', re.DOTALL)
+ATTRIBUTE_PATTERN = re.compile(r'(?P<name>[\w:-]+)="(?P<value>[^"]*)"')
+
+# Attributes describing the bitmap itself, which go on the shared definition
+SHARED_ATTRIBUTES = ('xlink:href', 'width', 'height')
+
+SVG_OPEN_PATTERN = re.compile(r'<svg\s[^>]*>')
+
+
+def deduplicate_images(svg: str) -> str:
+    """
+    Rewrites an SVG document so that every repeated <image> is defined once in <defs> and
+    referenced with <use>. Images that only appear once are left untouched.
+
+    :param str svg: The SVG document, as written by matplotlib.
+    :return str: The rewritten document.
+    """
+    images = []
+    counts = {}
+    for match in IMAGE_PATTERN.finditer(svg):
+        attributes = dict(ATTRIBUTE_PATTERN.findall(match.group('attributes')))
+        key = tuple(attributes.get(name) for name in SHARED_ATTRIBUTES)
+        images.append((match, attributes, key))
+        counts[key] = counts.get(key, 0) + 1
+
+    ids = {}
+    definitions = []
+    pieces = []
+    position = 0
+    for match, attributes, key in images:
+        if counts[key] < 2 or key[0] is None:
+            continue
+
+        if key not in ids:
+            ids[key] = f'shared-image-{len(ids)}'
+            shared = ' '.join(f'{name}="{value}"'
+                              for name, value in zip(SHARED_ATTRIBUTES, key) if value is not None)
+            definitions.append(f'  <image id="{ids[key]}" {shared}/>')
+
+        # Everything else (position, transform, clip path, opacity, ...) stays on the instance
+        own = ' '.join(f'{name}="{value}"' for name, value in attributes.items()
+                       if name not in SHARED_ATTRIBUTES)
+        pieces.append(svg[position:match.start()])
+        pieces.append(f'<use xlink:href="#{ids[key]}" {own}/>')
+        position = match.end()
+
+    if not definitions:
+        return svg
+    pieces.append(svg[position:])
+    svg = ''.join(pieces)
+
+    # The definitions go right at the start of the document, ahead of any use
+    svg_open = SVG_OPEN_PATTERN.search(svg)
+    defs = '\n <defs>\n' + '\n'.join(definitions) + '\n </defs>'
+    return svg[:svg_open.end()] + defs + svg[svg_open.end():]
+
+
+def figure_to_svg(fig, **savefig_kwargs) -> str:
+    """
+    Renders a figure as SVG, with repeated images embedded once.
+
+    :param Figure fig: The figure to render.
+    :param savefig_kwargs: Passed on to Figure.savefig, e.g. dpi.
+    :return str: The SVG document.
+    """
+    buffer = io.StringIO()
+    fig.savefig(buffer, format='svg', **savefig_kwargs)
+    return deduplicate_images(buffer.getvalue())
+
+
+def save_svg(fig, filename: str, **savefig_kwargs) -> None:
+    """
+    Saves a figure as an SVG file, with repeated images embedded once.
+
+    :param Figure fig: The figure to save.
+    :param str filename: Output filename.
+    :param savefig_kwargs: Passed on to Figure.savefig, e.g. dpi.
+    """
+    with open(filename, 'w', encoding='utf-8') as fo:
+        fo.write(figure_to_svg(fig, **savefig_kwargs))